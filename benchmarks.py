@@ -0,0 +1,311 @@
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import typing
+from dataclasses import dataclass, asdict
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from casperpy.client import JRPCClient
+from casperpy.codec import CODECS, orjson
+from casperpy.generated import parse_info_get_deploy_result
+from casperpy.instrument import HistogramSink, Instruments
+from casperpy.types_old import InfoGetDeployResponse
+import casperpy.types.cl_values as cl_values
+import casperpy.types.deploy as deploy_types
+from fakes import FakeRPCServer, MOCK_DEPLOY_INFO, STATE_ROOT_HASH_RESULT
+
+Operation = typing.Callable[[], typing.Any]
+
+@dataclass
+class Benchmark:
+    """
+    A named operation to measure, built by its setup.
+    """
+    name: str
+    setup: typing.Callable[[contextlib.ExitStack], Operation]
+    """Build the operation, registering its cleanup on the exit stack."""
+    items: int = 1
+    """Items processed by one call of the operation, e.g. the calls of a batch."""
+
+@dataclass
+class Result:
+    """
+    Measurements of a benchmark.
+    """
+    name: str
+    ops_per_second: float
+    """Median over the repeats."""
+    spread: float
+    """Relative difference of the fastest and slowest repeats."""
+    items_per_second: float
+    peak_alloc_bytes: int
+    """Peak memory allocated by one call of the operation."""
+    alloc_blocks: int
+    """Memory blocks still allocated after one call, as kept by the operation."""
+
+BENCHMARKS: typing.List[Benchmark] = []
+
+def benchmark(name: str, items: int = 1) -> typing.Callable:
+    """
+    Register the decorated setup as a benchmark.
+    """
+    def register(setup: typing.Callable[[contextlib.ExitStack], Operation]) -> typing.Callable:
+        BENCHMARKS.append(Benchmark(name, setup, items))
+        return setup
+    return register
+
+def deploy_info_payload(transforms: int) -> str:
+    """
+    Serialized info_get_deploy result with the number of operations and transforms.
+    """
+    raw = json.loads(json.dumps(MOCK_DEPLOY_INFO))
+    effect = raw["execution_results"][0]["result"]["Success"]["effect"]
+    effect["operations"] = [
+        {"key": f"hash-{i % 1000:064x}", "kind": "Write" if i % 3 else "Read"} for i in range(transforms)
+    ]
+    effect["transforms"] = [
+        {"key": f"hash-{i % 1000:064x}", "transform": {"AddUInt64": i} if i % 3 else "Identity"} for i in range(transforms)
+    ]
+    return json.dumps(raw)
+
+@benchmark("encode_int/u512")
+def bench_encode_int(stack: contextlib.ExitStack) -> Operation:
+    return lambda: cl_values.encode_int(10 ** 30, [64], False, True)
+
+@benchmark("CL_U512.encode_value")
+def bench_encode_u512(stack: contextlib.ExitStack) -> Operation:
+    value = cl_values.CL_U512(10 ** 30)
+    return value.encode_value
+
+@benchmark("encode_vector/1000")
+def bench_encode_vector(stack: contextlib.ExitStack) -> Operation:
+    items = [cl_values.CL_U512(i).encode_value() for i in range(1000)]
+    return lambda: cl_values.encode_vector(items)
+
+@benchmark("ModuleBytes.encode_value/erc20")
+def bench_module_bytes(stack: contextlib.ExitStack) -> Operation:
+    with open("erc20.wasm", "rb") as f:
+        wasm = f.read()
+    session = deploy_types.ModuleBytes(
+        args={"token_total_supply": cl_values.CL_U256(10 ** 30), "token_name": cl_values.CL_String("Token")},
+        raw_wasm_payload=wasm,
+    )
+    return session.encode_value
+
+def register_parse(transforms: int) -> None:
+    for lazy in (False, True):
+        def setup(stack: contextlib.ExitStack, lazy: bool = lazy) -> Operation:
+            payload = deploy_info_payload(transforms)
+            return lambda: InfoGetDeployResponse.from_json(json.loads(payload), lazy)
+        BENCHMARKS.append(Benchmark(f"InfoGetDeployResponse.parse/{transforms}{'/lazy' if lazy else ''}", setup, transforms))
+    def generated(stack: contextlib.ExitStack) -> Operation:
+        payload = deploy_info_payload(transforms)
+        return lambda: parse_info_get_deploy_result(json.loads(payload))
+    BENCHMARKS.append(Benchmark(f"parse_info_get_deploy_result/{transforms}", generated, transforms))
+
+for transforms in (1, 100, 10_000, 100_000):
+    register_parse(transforms)
+
+def register_codec(name: str) -> None:
+    def loads(stack: contextlib.ExitStack) -> Operation:
+        codec = CODECS[name]()
+        payload = deploy_info_payload(10_000).encode("utf-8")
+        return lambda: codec.loads(payload)
+    def dumps(stack: contextlib.ExitStack) -> Operation:
+        codec = CODECS[name]()
+        value = json.loads(deploy_info_payload(10_000))
+        return lambda: codec.dumps(value)
+    BENCHMARKS.append(Benchmark(f"codec.loads/{name}/10000", loads, 10_000))
+    BENCHMARKS.append(Benchmark(f"codec.dumps/{name}/10000", dumps, 10_000))
+
+for name in CODECS:
+    if name != "orjson" or orjson is not None:
+        register_codec(name)
+
+@benchmark("client.chain_get_state_root_hash")
+def bench_round_trip(stack: contextlib.ExitStack) -> Operation:
+    server = stack.enter_context(FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}))
+    client = JRPCClient("127.0.0.1", server.port)
+    stack.callback(client.transport.close)
+    return client.chain_get_state_root_hash
+
+@benchmark("client.info_get_deploy")
+def bench_deploy_round_trip(stack: contextlib.ExitStack) -> Operation:
+    server = stack.enter_context(FakeRPCServer({"info_get_deploy": MOCK_DEPLOY_INFO}))
+    client = JRPCClient("127.0.0.1", server.port)
+    stack.callback(client.transport.close)
+    return lambda: client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+
+@benchmark("client.info_get_deploy/instrumented")
+def bench_instrumented_round_trip(stack: contextlib.ExitStack) -> Operation:
+    server = stack.enter_context(FakeRPCServer({"info_get_deploy": MOCK_DEPLOY_INFO}))
+    client = JRPCClient("127.0.0.1", server.port, instruments=Instruments([HistogramSink()]))
+    stack.callback(client.transport.close)
+    return lambda: client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+
+@benchmark("client.batch/info_get_deploy/100", items=100)
+def bench_batch_round_trip(stack: contextlib.ExitStack) -> Operation:
+    server = stack.enter_context(FakeRPCServer({"info_get_deploy": MOCK_DEPLOY_INFO}))
+    client = JRPCClient("127.0.0.1", server.port)
+    stack.callback(client.transport.close)
+    def run() -> list:
+        with client.batch() as batch:
+            calls = [batch.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"]) for _ in range(100)]
+        return [call.get() for call in calls]
+    return run
+
+def time_calls(op: Operation, number: int) -> float:
+    """
+    Seconds taken by number calls of the operation, with the garbage collector off as timeit does.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+def calibrate(op: Operation, min_time: float) -> int:
+    """
+    Number of calls of the operation taking at least min_time seconds.
+    """
+    number = 1
+    while True:
+        elapsed = time_calls(op, number)
+        if elapsed >= min_time:
+            return number
+        number = max(number * 2, int(number * min_time / elapsed) + 1) if elapsed > 0 else number * 10
+
+def measure_allocations(op: Operation) -> typing.Tuple[int, int]:
+    """
+    Peak bytes allocated by one call of the operation, and the blocks it leaves allocated.
+    """
+    op()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        result = op()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+        gc.collect()
+        blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+    return peak - before, max(blocks, 0)
+
+def peak_rss_kb() -> typing.Optional[int]:
+    """
+    Peak resident set size of the process in KB, None where unavailable.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB elsewhere.
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+def run(bench: Benchmark, repeat: int, min_time: float) -> Result:
+    """
+    Run the benchmark: repeat timed runs of at least min_time seconds, then one traced call.
+    """
+    with contextlib.ExitStack() as stack:
+        op = bench.setup(stack)
+        number = calibrate(op, min_time)
+        timings = [time_calls(op, number) / number for _ in range(repeat)]
+        peak, blocks = measure_allocations(op)
+    median = statistics.median(timings)
+    return Result(
+        name=bench.name,
+        ops_per_second=1 / median,
+        spread=(max(timings) - min(timings)) / median,
+        items_per_second=bench.items / median,
+        peak_alloc_bytes=peak,
+        alloc_blocks=blocks,
+    )
+
+def compare(results: typing.List[Result], baseline: dict, threshold: float) -> typing.List[str]:
+    """
+    Print the results against the baseline, returning the names of the regressed benchmarks.
+
+    A benchmark regresses when its throughput drops, or its peak allocation grows, by more than threshold.
+    The peak RSS is not compared: it is shared by the benchmarks of the run
+    and depends on which ones ran before.
+    """
+    previous = baseline["results"]
+    regressions = []
+    print(f"\n{'benchmark':<44} {'ops/s':>12} {'baseline':>12} {'change':>8} {'alloc':>8}")
+    for result in results:
+        base = previous.get(result.name)
+        if base is None:
+            print(f"{result.name:<44} {result.ops_per_second:>12.1f} {'-':>12}")
+            continue
+        speed = result.ops_per_second / base["ops_per_second"] - 1
+        alloc = result.peak_alloc_bytes / base["peak_alloc_bytes"] - 1 if base["peak_alloc_bytes"] else 0.0
+        regressed = speed < -threshold or alloc > threshold
+        if regressed:
+            regressions.append(result.name)
+        print(
+            f"{result.name:<44} {result.ops_per_second:>12.1f} {base['ops_per_second']:>12.1f} "
+            f"{speed:>+8.1%} {alloc:>+8.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the encoding, decoding and client hot paths.")
+    parser.add_argument("-k", "--filter", default="", help="run the benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds of a timed run")
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'benchmark':<44} {'ops/s':>12} {'items/s':>12} {'spread':>7} {'alloc KB':>10} {'blocks':>7}")
+    for bench in BENCHMARKS:
+        if args.filter not in bench.name:
+            continue
+        result = run(bench, args.repeat, args.min_time)
+        results.append(result)
+        print(
+            f"{result.name:<44} {result.ops_per_second:>12.1f} {result.items_per_second:>12.1f} "
+            f"{result.spread:>7.1%} {result.peak_alloc_bytes / 1024:>10.1f} {result.alloc_blocks:>7}"
+        )
+    rss = peak_rss_kb()
+    if rss is not None:
+        print(f"\nPeak RSS of the run: {rss} KB")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "peak_rss_kb": rss,
+                "results": {result.name: asdict(result) for result in results},
+            }, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("python") != platform.python_version():
+            print(f"[!] Baseline recorded with Python {baseline.get('python')}")
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
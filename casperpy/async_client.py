@@ -0,0 +1,200 @@
+from dataclasses import dataclass, field
+import asyncio
+import time
+import typing
+from abc import ABC, abstractmethod
+from .codec import Codec, get_codec, request, result
+from .generated import QueryGlobalStateResult, StateGetItemResult, parse_query_global_state_result, parse_state_get_item_result
+from .instrument import Instruments, T
+from .transport import AsyncHTTPTransport
+from .types_old import AccountPutDeployResponse, BlockIdentifier, ChainGetBlockResponse, ChainGetBlockTransfersResponse, block_params, global_state_params, state_item_params, ChainGetStateRootHashResponse, StateGetAccountInfoResponse, InfoGetDeployResponse
+from .constants import ACCOUNT_PUT_DEPLOY, CHAIN_GET_BLOCK, CHAIN_GET_BLOCK_TRANSFERS, CHAIN_GET_STATE_ROOT_HASH, STATE_GET_ACCOUNT_INFO, STATE_GET_ITEM, QUERY_GLOBAL_STATE, INFO_GET_DEPLOY
+import casperpy.types.deploy as deploy_types
+
+class AsyncClient(ABC):
+    @abstractmethod
+    async def send(self, method: str, params: dict) -> dict:
+        """
+        Send a JSON RPC request to the client.
+        """
+        pass
+
+    @abstractmethod
+    async def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> ChainGetBlockResponse:
+        """
+        Get the block of the hash or height, the latest block if None.
+        """
+        pass
+
+    @abstractmethod
+    async def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> ChainGetBlockTransfersResponse:
+        """
+        Get the transfers of the block of the hash or height, the latest block if None.
+        """
+        pass
+
+    @abstractmethod
+    async def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
+        """
+        Get the state root hash of the chain.
+        """
+        pass
+
+    @abstractmethod
+    async def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> StateGetAccountInfoResponse:
+        """
+        Get the account info of the public key at the block of the hash or height, the latest block if None.
+        """
+        pass
+
+    @abstractmethod
+    async def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> InfoGetDeployResponse:
+        """
+        Get the deploy info of the deploy hash, building its nested lists on access if lazy.
+        """
+        pass
+
+    @abstractmethod
+    async def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Get the value stored under the key at the state root hash, following the path of named keys.
+        """
+        pass
+
+    @abstractmethod
+    async def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> QueryGlobalStateResult:
+        """
+        Get the value stored under the key at the state root hash or else the block, following the path of named keys.
+        """
+        pass
+
+    @abstractmethod
+    async def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResponse:
+        """
+        Send a signed deploy to the node.
+        """
+        pass
+
+@dataclass
+class AsyncJRPCClient(AsyncClient):
+    """
+    Asyncio client class for the Casper API.
+    """
+    host: str
+    port: int
+    max_concurrency: int = 100
+    """Maximum number of requests in flight against the node."""
+    transport: AsyncHTTPTransport = field(default_factory=AsyncHTTPTransport, repr=False)
+    codec: Codec = field(default_factory=get_codec, repr=False)
+    """JSON codec of the bodies, orjson when installed."""
+    instruments: typing.Optional[Instruments] = field(default=None, repr=False)
+    """Records the calls into sinks, None to skip instrumentation."""
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @property
+    def rpc_url(self) -> str:
+        """
+        The JSON RPC URL for the client.
+        """
+        return f"http://{self.host}:{self.port}/rpc"
+
+    async def send(self, method: str, params: dict) -> dict:
+        """
+        Send a JSON RPC request to the client.
+        """
+        if self.instruments is None:
+            body = self.codec.dumps(request(method, params))
+            async with self._semaphore:
+                res = await self.transport.post(self.rpc_url, body)
+            return result(self.codec.loads(res))
+        call, owned = self.instruments.begin(method)
+        try:
+            body = self.codec.dumps(request(method, params))
+            call.request_bytes = len(body)
+            async with self._semaphore:
+                # Waiting for a free slot is not network time.
+                start = time.perf_counter()
+                res = await self.transport.post(self.rpc_url, body)
+            decoding = time.perf_counter()
+            call.network_time = decoding - start
+            call.response_bytes = len(res)
+            reply = self.codec.loads(res)
+            call.decode_time = time.perf_counter() - decoding
+            return result(reply)
+        except Exception as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            if owned:
+                self.instruments.emit(call)
+
+    async def call(self, method: str, params: dict, parser: typing.Callable[..., T], *args: typing.Any) -> T:
+        """
+        Send a JSON RPC request and build its typed result with parser(result, *args).
+        """
+        if self.instruments is None:
+            return parser(await self.send(method, params), *args)
+        return await self.instruments.call_async(self.send, method, params, parser, *args)
+
+    async def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> ChainGetBlockResponse:
+        """
+        Get the block of the hash or height, the latest block if None.
+        """
+        return await self.call(CHAIN_GET_BLOCK, block_params(block), ChainGetBlockResponse.from_json, lazy)
+
+    async def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> ChainGetBlockTransfersResponse:
+        """
+        Get the transfers of the block of the hash or height, the latest block if None.
+        """
+        return await self.call(CHAIN_GET_BLOCK_TRANSFERS, block_params(block), ChainGetBlockTransfersResponse.from_json)
+
+    async def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
+        """
+        Get the state root hash of the chain.
+        """
+        return await self.call(CHAIN_GET_STATE_ROOT_HASH, {}, ChainGetStateRootHashResponse.from_json)
+
+    async def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> StateGetAccountInfoResponse:
+        """
+        Get the account info of the public key at the block of the hash or height, the latest block if None.
+        """
+        return await self.call(STATE_GET_ACCOUNT_INFO, dict(block_params(block), public_key=public_key), StateGetAccountInfoResponse.from_json)
+
+    async def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> InfoGetDeployResponse:
+        """
+        Get the deploy info of the deploy hash, building its nested lists on access if lazy.
+        """
+        return await self.call(INFO_GET_DEPLOY, {"deploy_hash": deploy_hash}, InfoGetDeployResponse.from_json, lazy)
+
+    async def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Get the value stored under the key at the state root hash, following the path of named keys.
+        """
+        return await self.call(STATE_GET_ITEM, state_item_params(state_root_hash, key, path), parse_state_get_item_result)
+
+    async def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> QueryGlobalStateResult:
+        """
+        Get the value stored under the key at the state root hash or else the block, following the path of named keys.
+        """
+        return await self.call(QUERY_GLOBAL_STATE, global_state_params(key, path, state_root_hash, block_hash), parse_query_global_state_result)
+
+    async def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResponse:
+        """
+        Send a signed deploy to the node.
+        """
+        return await self.call(ACCOUNT_PUT_DEPLOY, {"deploy": deploy.to_json()}, AccountPutDeployResponse.from_json)
+
+    async def close(self) -> None:
+        """
+        Close the connections held by the client.
+        """
+        await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncJRPCClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
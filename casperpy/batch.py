@@ -0,0 +1,153 @@
+import dataclasses
+import typing
+
+from .errors import RPCError
+from .generated import QueryGlobalStateResult, StateGetItemResult, parse_query_global_state_result, parse_state_get_item_result
+from .types_old import BlockIdentifier, ChainGetBlockResponse, ChainGetBlockTransfersResponse, block_params, global_state_params, state_item_params, ChainGetStateRootHashResponse, StateGetAccountInfoResponse, InfoGetDeployResponse
+from .constants import CHAIN_GET_BLOCK, CHAIN_GET_BLOCK_TRANSFERS, CHAIN_GET_STATE_ROOT_HASH, STATE_GET_ACCOUNT_INFO, STATE_GET_ITEM, QUERY_GLOBAL_STATE, INFO_GET_DEPLOY
+
+T = typing.TypeVar("T")
+
+@dataclasses.dataclass
+class BatchCall(typing.Generic[T]):
+    """
+    A call queued in a JSON RPC batch, holding its typed result or its error once sent.
+    """
+    method: str
+    params: dict
+    parser: typing.Callable[[dict], T] = dataclasses.field(repr=False)
+    id: typing.Optional[int] = None
+    result: typing.Optional[T] = None
+    error: typing.Optional[Exception] = None
+    done: bool = False
+
+    def resolve(self, result: dict) -> None:
+        """
+        Build the typed result of the call from the raw JSON RPC result.
+        """
+        try:
+            self.result = self.parser(result)
+        except Exception as e:
+            self.error = e
+        self.done = True
+
+    def fail(self, error: Exception) -> None:
+        """
+        Record the error of the call.
+        """
+        self.error = error
+        self.done = True
+
+    def get(self) -> T:
+        """
+        Get the typed result of the call, raising its error if it failed.
+        """
+        if not self.done:
+            raise RuntimeError(f"Batch call {self.method} has not been sent")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class Batch:
+    """
+    Collects calls and sends them as JSON RPC batches when the context exits.
+
+    Example:
+        with client.batch() as batch:
+            calls = [batch.info_get_deploy(h) for h in deploy_hashes]
+        deploys = [call.get() for call in calls]
+    """
+    def __init__(self, client: "typing.Any", chunk_size: int = 100) -> None:
+        self.client = client
+        self.chunk_size = chunk_size
+        self.calls: typing.List[BatchCall] = []
+
+    def call(self, method: str, params: dict, parser: typing.Callable[[dict], T]) -> BatchCall[T]:
+        """
+        Queue a call of the method, its result being built with the parser.
+        """
+        call = BatchCall(method, params, parser)
+        self.calls.append(call)
+        return call
+
+    def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> BatchCall[ChainGetBlockResponse]:
+        """
+        Queue a call getting the block of the hash or height, the latest block if None.
+        """
+        return self.call(CHAIN_GET_BLOCK, block_params(block), lambda res: ChainGetBlockResponse.from_json(res, lazy))
+
+    def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> BatchCall[ChainGetBlockTransfersResponse]:
+        """
+        Queue a call getting the transfers of the block of the hash or height, the latest block if None.
+        """
+        return self.call(CHAIN_GET_BLOCK_TRANSFERS, block_params(block), ChainGetBlockTransfersResponse.from_json)
+
+    def chain_get_state_root_hash(self) -> BatchCall[ChainGetStateRootHashResponse]:
+        """
+        Queue a call getting the state root hash of the chain.
+        """
+        return self.call(CHAIN_GET_STATE_ROOT_HASH, {}, ChainGetStateRootHashResponse.from_json)
+
+    def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> BatchCall[StateGetAccountInfoResponse]:
+        """
+        Queue a call getting the account info of the public key at the block of the hash or height, the latest block if None.
+        """
+        return self.call(STATE_GET_ACCOUNT_INFO, dict(block_params(block), public_key=public_key), StateGetAccountInfoResponse.from_json)
+
+    def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> BatchCall[InfoGetDeployResponse]:
+        """
+        Queue a call getting the deploy info of the deploy hash.
+        """
+        return self.call(INFO_GET_DEPLOY, {"deploy_hash": deploy_hash}, lambda res: InfoGetDeployResponse.from_json(res, lazy))
+
+    def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> BatchCall[StateGetItemResult]:
+        """
+        Queue a call getting the value stored under the key at the state root hash, following the path of named keys.
+        """
+        return self.call(STATE_GET_ITEM, state_item_params(state_root_hash, key, path), parse_state_get_item_result)
+
+    def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> BatchCall[QueryGlobalStateResult]:
+        """
+        Queue a call getting the value stored under the key at the state root hash or else the block, following the path of named keys.
+        """
+        return self.call(QUERY_GLOBAL_STATE, global_state_params(key, path, state_root_hash, block_hash), parse_query_global_state_result)
+
+    def send(self) -> typing.List[BatchCall]:
+        """
+        Send the pending calls, split in chunks of at most chunk_size calls.
+        """
+        pending = [call for call in self.calls if not call.done]
+        for start in range(0, len(pending), self.chunk_size):
+            self.client.send_batch(pending[start:start + self.chunk_size])
+        return self.calls
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.send()
+
+def resolve_batch(calls: typing.List[BatchCall], replies: typing.Union[list, dict]) -> None:
+    """
+    Match the JSON RPC replies of a batch back to its calls by id.
+    """
+    if isinstance(replies, dict):
+        # The node rejected the whole batch with a single error object.
+        error = replies.get("error") or {}
+        for call in calls:
+            call.fail(RPCError(error.get("code", -32600), error.get("message", "Invalid batch reply"), error.get("data")))
+        return
+    by_id = {call.id: call for call in calls}
+    for reply in replies:
+        call = by_id.pop(reply.get("id"), None)
+        if call is None:
+            continue
+        if "result" in reply:
+            call.resolve(reply["result"])
+        else:
+            # A malformed reply fails its own call only.
+            error = reply.get("error") or {}
+            call.fail(RPCError(error.get("code", -32603), error.get("message", f"Invalid reply for request {call.id}"), error.get("data")))
+    for call in by_id.values():
+        call.fail(RPCError(-32603, f"No reply for request {call.id}"))
@@ -0,0 +1,89 @@
+import concurrent.futures
+import dataclasses
+import typing
+
+import casperpy.types.cl_values as cl_values
+import casperpy.types.deploy as deploy_types
+from .deploy_builder import DEFAULT_TTL, DeployBuilder
+from .signing import PrivateKey
+
+@dataclasses.dataclass
+class DeploySpec:
+    """
+    Inputs of one deploy built by a BulkDeployBuilder.
+    """
+    session_args: typing.Dict[str, cl_values.CL_Value]
+    payment_amount: int
+    """Payment in motes."""
+    signer: PrivateKey
+    timestamp: typing.Optional[int] = None
+    """Creation time in milliseconds since epoch, the time of the build if not set."""
+
+_worker_builder: typing.Optional[DeployBuilder] = None
+_worker_wasm: bytes = b""
+
+def _init_worker(chain_name: str, gas_price: int, ttl: int, wasm: bytes) -> None:
+    # Runs once per worker process, the wasm module is received here only.
+    global _worker_builder, _worker_wasm
+    _worker_builder = DeployBuilder(chain_name, gas_price, ttl)
+    _worker_wasm = wasm
+
+def _build_one(spec: DeploySpec) -> deploy_types.Deploy:
+    payment = deploy_types.ModuleBytes(args={"amount": cl_values.CL_U512(spec.payment_amount)})
+    session = deploy_types.ModuleBytes(args=spec.session_args, raw_wasm_payload=_worker_wasm)
+    deploy = _worker_builder.build(spec.signer, payment, session, spec.timestamp)
+    # Don't send the module back, the parent attaches its own copy.
+    session.raw_wasm_payload = b""
+    return deploy
+
+@dataclasses.dataclass
+class BulkDeployBuilder:
+    """
+    Builds, hashes and signs many deploys of the same wasm module across a process pool.
+
+    The module bytes and the chain settings are sent once to each worker when
+    it starts, tasks only carry their DeploySpec. The returned deploys share
+    the module bytes of the builder.
+    """
+    chain_name: str
+    wasm: bytes = dataclasses.field(repr=False)
+    gas_price: int = 1
+    ttl: int = DEFAULT_TTL
+    """Time to live of the deploys, in milliseconds."""
+    max_workers: typing.Optional[int] = None
+    """Number of worker processes, the number of CPUs if not set."""
+    chunksize: int = 64
+    """Number of specs sent to a worker at once."""
+    _executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = dataclasses.field(default=None, init=False, repr=False)
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.chain_name, self.gas_price, self.ttl, self.wasm),
+            )
+        return self._executor
+
+    def build(self, specs: typing.Iterable[DeploySpec]) -> typing.List[deploy_types.Deploy]:
+        """
+        Build and sign a deploy per spec, returned in the order of the specs.
+        """
+        deploys = list(self._get_executor().map(_build_one, specs, chunksize=self.chunksize))
+        for deploy in deploys:
+            deploy.session.raw_wasm_payload = self.wasm
+        return deploys
+
+    def close(self) -> None:
+        """
+        Shut the worker processes down.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "BulkDeployBuilder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,273 @@
+from dataclasses import dataclass, field
+import collections
+import threading
+import time
+import typing
+from .client import Client
+from .generated import QueryGlobalStateResult, StateGetItemResult
+from .store import ChainStore, BLOCK, BLOCK_TRANSFERS, DEPLOY
+from .types_old import AccountPutDeployResponse, BlockIdentifier, ChainGetBlockResponse, ChainGetBlockTransfersResponse, block_params, ChainGetStateRootHashResponse, StateGetAccountInfoResponse, InfoGetDeployResponse
+from .constants import CHAIN_GET_BLOCK, CHAIN_GET_BLOCK_TRANSFERS, STATE_GET_ACCOUNT_INFO, STATE_GET_ITEM, QUERY_GLOBAL_STATE, INFO_GET_DEPLOY
+import casperpy.types.deploy as deploy_types
+
+_MISSING = object()
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counters of a cache.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of the lookups answered from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class LRUCache:
+    """
+    Thread safe mapping keeping at most max_entries entries, evicting the least recently used.
+    """
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "collections.OrderedDict[typing.Hashable, object]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: typing.Hashable, default: object = _MISSING) -> object:
+        """
+        Get the value of the key, counting a hit or a miss.
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: typing.Hashable, value: object) -> None:
+        """
+        Store the value of the key, evicting the least recently used entries if full.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+@dataclass
+class CachingClient(Client):
+    """
+    Opt-in caching layer around a client.
+
+    Account reads are keyed on (method, params, block hash): the latest
+    block is fetched and pinned for state_root_ttl seconds, the reads are
+    made at that block, so a cached read matches the pinned state root hash
+    and is at most that stale. Deploys
+    with execution results and found blocks are final and cached without
+    expiry, and are also written to the persistent store if one is given.
+    """
+    client: Client
+    max_entries: int = 10_000
+    state_root_ttl: float = 1.0
+    store: typing.Optional[ChainStore] = None
+    """Persistent store consulted for finalized data before going to the network."""
+    _cache: LRUCache = field(init=False, repr=False)
+    _pinned: typing.Optional[typing.Tuple[str, str]] = field(default=None, init=False, repr=False)
+    """Hash and state root hash of the pinned block."""
+    _pinned_at: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._cache = LRUCache(self.max_entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Hit and miss counters of the cache.
+        """
+        return self._cache.stats
+
+    def clear(self) -> None:
+        """
+        Drop every cached response.
+        """
+        self._cache.clear()
+
+    def pinned_block(self) -> typing.Tuple[str, str]:
+        """
+        Get the hash and state root hash of the block the state reads are made at, pinning the latest block when stale.
+        """
+        if self._pinned is None or time.monotonic() - self._pinned_at > self.state_root_ttl:
+            block = self.client.chain_get_block(None, True).block
+            self._pinned = (str(block.hash), str(block.header.state_root_hash))
+            self._pinned_at = time.monotonic()
+        return self._pinned
+
+    def state_root_hash(self) -> str:
+        """
+        Get the state root hash of the pinned block.
+        """
+        return self.pinned_block()[1]
+
+    def send(self, method: str, params: dict) -> dict:
+        """
+        Send a JSON RPC request to the client, bypassing the cache.
+        """
+        return self.client.send(method, params)
+
+    def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
+        """
+        Get the state root hash of the chain, never cached.
+        """
+        return self.client.chain_get_state_root_hash()
+
+    def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> StateGetAccountInfoResponse:
+        """
+        Get the account info of the public key at the block, the pinned block if None, cached per block.
+        """
+        if block is None:
+            block = self.pinned_block()[0]
+        key = (STATE_GET_ACCOUNT_INFO, public_key, block if isinstance(block, int) else str(block))
+        res = self._cache.get(key)
+        if res is _MISSING:
+            res = self.client.state_get_account_info(public_key, block)
+            self._cache.put(key, res)
+        return res
+
+    def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Get the value stored under the key at the state root hash, cached as the state at a root never changes.
+        """
+        cache_key = (STATE_GET_ITEM, str(state_root_hash), str(key), tuple(path or ()))
+        res = self._cache.get(cache_key)
+        if res is _MISSING:
+            res = self.client.state_get_item(state_root_hash, key, path)
+            self._cache.put(cache_key, res)
+        return res
+
+    def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> QueryGlobalStateResult:
+        """
+        Get the value stored under the key at the state root hash or else the block, cached as the state at either never changes.
+        """
+        cache_key = (QUERY_GLOBAL_STATE, str(key), tuple(path or ()), state_root_hash and str(state_root_hash), block_hash and str(block_hash))
+        res = self._cache.get(cache_key)
+        if res is _MISSING:
+            res = self.client.query_global_state(key, path, state_root_hash, block_hash)
+            self._cache.put(cache_key, res)
+        return res
+
+    def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> InfoGetDeployResponse:
+        """
+        Get the deploy info of the deploy hash, cached once it has been executed.
+        """
+        key = (INFO_GET_DEPLOY, deploy_hash, lazy)
+        res = self._cache.get(key)
+        if res is _MISSING:
+            if self.store is None:
+                res = self.client.info_get_deploy(deploy_hash, lazy)
+                final = bool(res.execution_results)
+            else:
+                raw, final = self._fetch_final(DEPLOY, deploy_hash, INFO_GET_DEPLOY, {"deploy_hash": deploy_hash}, lambda raw: bool(raw["execution_results"]))
+                res = InfoGetDeployResponse.from_json(raw, lazy)
+            if final:
+                self._cache.put(key, res)
+        return res
+
+    def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> ChainGetBlockResponse:
+        """
+        Get the block of the hash or height, cached once found. The latest block is never cached.
+        """
+        raw = self._fetch_block(BLOCK, CHAIN_GET_BLOCK, block, lambda raw: raw.get("block") and raw["block"]["hash"])
+        return ChainGetBlockResponse.from_json(raw, lazy)
+
+    def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> ChainGetBlockTransfersResponse:
+        """
+        Get the transfers of the block of the hash or height, cached once found. The latest block is never cached.
+        """
+        raw = self._fetch_block(BLOCK_TRANSFERS, CHAIN_GET_BLOCK_TRANSFERS, block, lambda raw: raw.get("transfers") is not None and raw["block_hash"])
+        return ChainGetBlockTransfersResponse.from_json(raw)
+
+    def _fetch_block(
+        self,
+        kind: str,
+        method: str,
+        block: typing.Optional[BlockIdentifier],
+        block_hash: typing.Callable[[dict], typing.Optional[str]],
+    ) -> dict:
+        """
+        Get the raw result of a block method, block_hash giving the hash of a found block.
+
+        Blocks are final once found, they are cached by identifier and
+        written to the persistent store by hash, the hashes of the blocks
+        fetched by height being indexed by the store.
+        """
+        params = block_params(block)
+        if block is None:
+            return self.client.send(method, params)
+        key = (method, block if isinstance(block, int) else str(block))
+        raw = self._cache.get(key)
+        if raw is not _MISSING:
+            return raw
+        if self.store is not None and isinstance(block, int):
+            # Blocks are stored by hash, find the hash of the height first.
+            stored = self.store.block_hash(block)
+            raw = None if stored is None else self.store.get(kind, stored)
+            if raw is not None:
+                self._cache.put(key, raw)
+                return raw
+        if self.store is not None and not isinstance(block, int):
+            raw, final = self._fetch_final(kind, str(block), method, params, lambda raw: bool(block_hash(raw)))
+        else:
+            raw = self.client.send(method, params)
+            found = block_hash(raw)
+            final = bool(found)
+            if final and self.store is not None:
+                self.store.put(kind, found, raw)
+                self.store.put_block_hash(block, found)
+        if final:
+            self._cache.put(key, raw)
+        return raw
+
+    def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResponse:
+        """
+        Send a signed deploy to the node, never cached.
+        """
+        return self.client.account_put_deploy(deploy)
+
+    def _fetch_final(
+        self,
+        kind: str,
+        key: str,
+        method: str,
+        params: dict,
+        is_final: typing.Callable[[dict], bool],
+    ) -> typing.Tuple[dict, bool]:
+        """
+        Get a raw result from the persistent store, or from the network storing it once final.
+        """
+        raw = self.store.get(kind, key)
+        if raw is not None:
+            return raw, True
+        raw = self.client.send(method, params)
+        final = is_final(raw)
+        if final:
+            self.store.put(kind, key, raw)
+        return raw, final
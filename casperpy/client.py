@@ -1,9 +1,17 @@
-from dataclasses import dataclass
-import requests
-import jsonrpcclient
+from dataclasses import dataclass, field
+import contextlib
+import time
+import typing
 from abc import ABC, abstractmethod
-from .types_old import ChainGetStateRootHashResponse, StateGetAccountInfoResponse, InfoGetDeployResponse
-from .constants import CHAIN_GET_STATE_ROOT_HASH, STATE_GET_ACCOUNT_INFO, INFO_GET_DEPLOY
+from .batch import Batch, BatchCall, resolve_batch
+from .codec import Codec, get_codec, request, result
+from .generated import QueryGlobalStateResult, RPCMethods, StateGetItemResult, parse_query_global_state_result, parse_state_get_item_result
+from .instrument import CallRecord, Instruments, T
+from .scheduler import Scheduler
+from .transport import Transport, HTTPTransport
+from .types_old import AccountPutDeployResponse, BlockIdentifier, ChainGetBlockResponse, ChainGetBlockTransfersResponse, block_params, global_state_params, state_item_params, ChainGetStateRootHashResponse, StateGetAccountInfoResponse, InfoGetDeployResponse
+from .constants import ACCOUNT_PUT_DEPLOY, CHAIN_GET_BLOCK, CHAIN_GET_BLOCK_TRANSFERS, CHAIN_GET_STATE_ROOT_HASH, STATE_GET_ACCOUNT_INFO, STATE_GET_ITEM, QUERY_GLOBAL_STATE, INFO_GET_DEPLOY
+import casperpy.types.deploy as deploy_types
 
 class Client(ABC):
     @abstractmethod
@@ -13,6 +21,30 @@ class Client(ABC):
         """
         pass
 
+    @property
+    def rpc(self) -> RPCMethods:
+        """
+        Typed methods of every RPC endpoint of the node schema, returning the generated models.
+
+        Example:
+            balance = client.rpc.state_get_balance(state_root_hash, purse_uref).balance_value
+        """
+        return RPCMethods(self.send)
+
+    @abstractmethod
+    def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> ChainGetBlockResponse:
+        """
+        Get the block of the hash or height, the latest block if None.
+        """
+        pass
+
+    @abstractmethod
+    def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> ChainGetBlockTransfersResponse:
+        """
+        Get the transfers of the block of the hash or height, the latest block if None.
+        """
+        pass
+
     @abstractmethod
     def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
         """
@@ -21,26 +53,118 @@ class Client(ABC):
         pass
 
     @abstractmethod
-    def state_get_account_info(self, public_key: str) -> StateGetAccountInfoResponse:
+    def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> StateGetAccountInfoResponse:
+        """
+        Get the account info of the public key at the block of the hash or height, the latest block if None.
+        """
+        pass
+
+    @abstractmethod
+    def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> InfoGetDeployResponse:
+        """
+        Get the deploy info of the deploy hash, building its nested lists on access if lazy.
+        """
+        pass
+
+    @abstractmethod
+    def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Get the value stored under the key at the state root hash, following the path of named keys.
+        """
+        pass
+
+    @abstractmethod
+    def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> QueryGlobalStateResult:
         """
-        Get the account info of the public key.
+        Get the value stored under the key at the state root hash or else the block, following the path of named keys.
         """
         pass
 
     @abstractmethod
-    def info_get_deploy(self, deploy_hash: str) -> InfoGetDeployResponse:
+    def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResponse:
         """
-        Get the deploy info of the deploy hash.
+        Send a signed deploy to the node.
         """
         pass
 
+class BaseClient(Client):
+    """
+    Client implementing the typed methods on top of send.
+    """
+    instruments: typing.Optional[Instruments] = None
+    """Records the calls into sinks, None to skip instrumentation."""
+
+    def call(self, method: str, params: dict, parser: typing.Callable[..., T], *args: typing.Any) -> T:
+        """
+        Send a JSON RPC request and build its typed result with parser(result, *args).
+        """
+        if self.instruments is None:
+            return parser(self.send(method, params), *args)
+        return self.instruments.call(self.send, method, params, parser, *args)
+
+    def chain_get_block(self, block: typing.Optional[BlockIdentifier] = None, lazy: bool = False) -> ChainGetBlockResponse:
+        """
+        Get the block of the hash or height, the latest block if None.
+        """
+        return self.call(CHAIN_GET_BLOCK, block_params(block), ChainGetBlockResponse.from_json, lazy)
+
+    def chain_get_block_transfers(self, block: typing.Optional[BlockIdentifier] = None) -> ChainGetBlockTransfersResponse:
+        """
+        Get the transfers of the block of the hash or height, the latest block if None.
+        """
+        return self.call(CHAIN_GET_BLOCK_TRANSFERS, block_params(block), ChainGetBlockTransfersResponse.from_json)
+
+    def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
+        """
+        Get the state root hash of the chain.
+        """
+        return self.call(CHAIN_GET_STATE_ROOT_HASH, {}, ChainGetStateRootHashResponse.from_json)
+
+    def state_get_account_info(self, public_key: str, block: typing.Optional[BlockIdentifier] = None) -> StateGetAccountInfoResponse:
+        """
+        Get the account info of the public key at the block of the hash or height, the latest block if None.
+        """
+        return self.call(STATE_GET_ACCOUNT_INFO, dict(block_params(block), public_key=public_key), StateGetAccountInfoResponse.from_json)
+
+    def info_get_deploy(self, deploy_hash: str, lazy: bool = False) -> InfoGetDeployResponse:
+        """
+        Get the deploy info of the deploy hash, building its nested lists on access if lazy.
+        """
+        return self.call(INFO_GET_DEPLOY, {"deploy_hash": deploy_hash}, InfoGetDeployResponse.from_json, lazy)
+
+    def state_get_item(self, state_root_hash: str, key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Get the value stored under the key at the state root hash, following the path of named keys.
+        """
+        return self.call(STATE_GET_ITEM, state_item_params(state_root_hash, key, path), parse_state_get_item_result)
+
+    def query_global_state(self, key: str, path: typing.Optional[typing.List[str]] = None, state_root_hash: typing.Optional[str] = None, block_hash: typing.Optional[str] = None) -> QueryGlobalStateResult:
+        """
+        Get the value stored under the key at the state root hash or else the block, following the path of named keys.
+        """
+        return self.call(QUERY_GLOBAL_STATE, global_state_params(key, path, state_root_hash, block_hash), parse_query_global_state_result)
+
+    def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResponse:
+        """
+        Send a signed deploy to the node.
+        """
+        return self.call(ACCOUNT_PUT_DEPLOY, {"deploy": deploy.to_json()}, AccountPutDeployResponse.from_json)
+
 @dataclass
-class JRPCClient(Client):
+class JRPCClient(BaseClient):
     """
     Client class for the Casper API.
     """
     host: str
     port: int
+    transport: Transport = field(default_factory=HTTPTransport, repr=False)
+    """Transport used to reach the node, sharing its keep-alive connections between calls."""
+    codec: Codec = field(default_factory=get_codec, repr=False)
+    """JSON codec of the bodies, orjson when installed."""
+    instruments: typing.Optional[Instruments] = field(default=None, repr=False)
+    """Records the calls into sinks, None to skip instrumentation."""
+    scheduler: typing.Optional[Scheduler] = field(default=None, repr=False)
+    """Rate limits, prioritizes and retries the requests, None to send them right away."""
 
     @property
     def rpc_url(self) -> str:
@@ -49,28 +173,73 @@ class JRPCClient(Client):
         """
         return f"http://{self.host}:{self.port}/rpc"
 
+    def _post(self, body: bytes, *methods: str) -> bytes:
+        if self.scheduler is None:
+            return self.transport.post(self.rpc_url, body)
+        return self.scheduler.post(self.transport, self.rpc_url, body, methods)
+
     def send(self, method: str, params: dict) -> dict:
         """
         Send a JSON RPC request to the client.
         """
-        req = jsonrpcclient.request(method, params)
-        res = requests.post(self.rpc_url, json=req)
-        return jsonrpcclient.parse(res.json()).result
-    
-    def chain_get_state_root_hash(self) -> ChainGetStateRootHashResponse:
-        """
-        Get the state root hash of the chain.
-        """
-        res = self.send(CHAIN_GET_STATE_ROOT_HASH, {})
-        return ChainGetStateRootHashResponse.from_dict(res)
-    
-    def state_get_account_info(self, public_key: str) -> StateGetAccountInfoResponse:
+        if self.instruments is None:
+            res = self._post(self.codec.dumps(request(method, params)), method)
+            return result(self.codec.loads(res))
+        with self._recorded(method) as call:
+            return result(self._post_recorded(call, request(method, params), (method,)))
+
+    def send_batch(self, calls: typing.List[BatchCall]) -> typing.List[BatchCall]:
+        """
+        Send the calls in a single JSON RPC batch request, resolving each of them.
+        """
+        reqs = []
+        for call in calls:
+            req = request(call.method, call.params)
+            call.id = req["id"]
+            reqs.append(req)
+        if self.instruments is None:
+            res = self._post(self.codec.dumps(reqs), *(call.method for call in calls))
+            resolve_batch(calls, self.codec.loads(res))
+            return calls
+        with self._recorded("batch") as record:
+            replies = self._post_recorded(record, reqs, [call.method for call in calls])
+            parsing = time.perf_counter()
+            resolve_batch(calls, replies)
+            record.parse_time = time.perf_counter() - parsing
+            return calls
+
+    @contextlib.contextmanager
+    def _recorded(self, method: str) -> typing.Iterator[CallRecord]:
+        """
+        Get the record of a send, noting the error raised within the block and emitting it after if owned.
+        """
+        call, owned = self.instruments.begin(method)
+        try:
+            yield call
+        except Exception as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            if owned:
+                self.instruments.emit(call)
+
+    def _post_recorded(self, call: CallRecord, payload: typing.Any, methods: typing.Sequence[str]) -> typing.Any:
+        """
+        Post the JSON payload of a request calling the methods and decode the reply, recording the sizes and times.
+        """
+        body = self.codec.dumps(payload)
+        call.request_bytes = len(body)
+        start = time.perf_counter()
+        res = self._post(body, *methods)
+        decoding = time.perf_counter()
+        call.network_time = decoding - start
+        call.response_bytes = len(res)
+        reply = self.codec.loads(res)
+        call.decode_time = time.perf_counter() - decoding
+        return reply
+
+    def batch(self, chunk_size: int = 100) -> Batch:
         """
-        Get the account info of the public key.
+        Collect calls to be sent as JSON RPC batches of at most chunk_size calls.
         """
-        res = self.send(STATE_GET_ACCOUNT_INFO, {"public_key": public_key})
-        return StateGetAccountInfoResponse.from_dict(res)
-    
-    def info_get_deploy(self, deploy_hash: str) -> InfoGetDeployResponse:
-        res = self.send(INFO_GET_DEPLOY, {"deploy_hash": deploy_hash})
-        return InfoGetDeployResponse.from_dict(res)
\ No newline at end of file
+        return Batch(self, chunk_size)
@@ -0,0 +1,107 @@
+import itertools
+import json
+import typing
+from abc import ABC, abstractmethod
+from .errors import RPCError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Buffer = typing.Union[bytes, bytearray, memoryview]
+
+class Codec(ABC):
+    """
+    JSON codec of the request and response bodies.
+    """
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: typing.Any) -> bytes:
+        """
+        Encode the value to UTF-8 JSON bytes.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: typing.Union[Buffer, str]) -> typing.Any:
+        """
+        Decode UTF-8 JSON bytes, or a string.
+        """
+        pass
+
+class JSONCodec(Codec):
+    """
+    Codec of the standard library json module.
+    """
+    name = "json"
+
+    def dumps(self, value: typing.Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: typing.Union[Buffer, str]) -> typing.Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        # bytes are decoded as UTF-8 by json itself.
+        return json.loads(data)
+
+class OrjsonCodec(Codec):
+    """
+    Codec of orjson, decoding straight from the bytes of the body.
+
+    Numbers beyond 64 bits are decoded as floats, the node sends its
+    U128, U256 and U512 values as strings. Values orjson can't encode,
+    like such numbers, are encoded by the json module instead.
+    """
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._fallback = JSONCodec()
+
+    def dumps(self, value: typing.Any) -> bytes:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            return self._fallback.dumps(value)
+
+    def loads(self, data: typing.Union[Buffer, str]) -> typing.Any:
+        return orjson.loads(data)
+
+CODECS: typing.Dict[str, typing.Type[Codec]] = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+"""Codecs by name."""
+
+def get_codec(name: typing.Optional[str] = None) -> Codec:
+    """
+    Get the codec of the name, the fastest one installed if None.
+    """
+    if name is None:
+        name = OrjsonCodec.name if orjson is not None else JSONCodec.name
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec: {name}")
+    return CODECS[name]()
+
+_ids = itertools.count(1)
+
+def request(method: str, params: dict) -> dict:
+    """
+    Build a JSON RPC request with a new id, leaving empty params out.
+    """
+    req = {"jsonrpc": "2.0", "method": method, "id": next(_ids)}
+    if params:
+        req["params"] = params
+    return req
+
+def result(reply: dict) -> typing.Any:
+    """
+    Get the result of a JSON RPC reply, raising an RPCError for an error reply.
+    """
+    if "result" in reply:
+        return reply["result"]
+    error = reply.get("error") or {}
+    raise RPCError(error.get("code", -32603), error.get("message", "Invalid reply"), error.get("data"))
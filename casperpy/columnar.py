@@ -0,0 +1,364 @@
+import array
+import collections
+import json
+import struct
+import sys
+import typing
+from dataclasses import dataclass, field
+from .types_old import Digest, ExecutionResultSuccess, InfoGetDeployResponse
+import casperpy.types.keys as keys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+MAGIC = b"CSPYCOL1"
+"""First bytes of a columnar file."""
+
+HASH_SIZE = 32
+FIXED_HASH = "32s"
+"""Type of the fixed width hash columns, stored in a bytearray."""
+
+TABLES: typing.Dict[str, typing.Dict[str, str]] = {
+    "deploys": {
+        "deploy_hash": FIXED_HASH,
+        "block_hash": "I",
+        "block_height": "q",
+        "cost": "Q",
+        "cost_high": "Q",
+        "success": "B",
+    },
+    "operations": {"deploy": "I", "key": "I", "kind": "H"},
+    "transforms": {"deploy": "I", "key": "I", "kind": "H"},
+    "transfers": {"deploy": "I", "transfer": "I"},
+}
+"""Columns of the tables and their array typecodes. deploy columns are row indexes in deploys."""
+
+DICTIONARY_COLUMNS = {
+    ("deploys", "block_hash"): "block_hashes",
+    ("operations", "key"): "keys",
+    ("operations", "kind"): "operation_kinds",
+    ("transforms", "key"): "keys",
+    ("transforms", "kind"): "transform_kinds",
+    ("transfers", "transfer"): "keys",
+}
+"""Dictionary encoding the values of the columns holding ids."""
+
+DICTIONARY_DECODERS: typing.Dict[str, typing.Callable[[str], typing.Any]] = {
+    "block_hashes": Digest.from_hex,
+    "keys": keys.from_string,
+    "operation_kinds": str,
+    "transform_kinds": str,
+}
+
+HIGH_COLUMNS = {("deploys", "cost"): "cost_high"}
+"""Columns holding the bits 64 to 127 of the wide integer columns, as costs are U512."""
+
+WIDE_MASK = (1 << 64) - 1
+
+NUMPY_DTYPES = {"B": "u1", "H": "u2", "I": "u4", "q": "i8", "Q": "u8"}
+
+U32 = struct.Struct("<I")
+
+Column = typing.Union[array.array, bytearray]
+
+def _new_tables() -> typing.Dict[str, typing.Dict[str, Column]]:
+    return {
+        name: {column: bytearray() if typecode == FIXED_HASH else array.array(typecode) for column, typecode in columns.items()}
+        for name, columns in TABLES.items()
+    }
+
+class Dictionary:
+    """
+    Values of a dictionary encoded column, each given an id in insertion order.
+    """
+    def __init__(self) -> None:
+        self.values: typing.List[typing.Any] = []
+        self._ids: typing.Dict[typing.Any, int] = {}
+
+    def id(self, value: typing.Any) -> int:
+        """
+        Get the id of the value, adding it if new.
+        """
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+@dataclass
+class ColumnarData:
+    """
+    Tables of execution effects as typed columns, with the dictionaries of their id columns.
+
+    Columns are array.array buffers (bytearray for the hash columns), which
+    NumPy and Arrow wrap without copying.
+    """
+    tables: typing.Dict[str, typing.Dict[str, Column]] = field(default_factory=_new_tables)
+    dictionaries: typing.Dict[str, Dictionary] = field(
+        default_factory=lambda: {name: Dictionary() for name in set(DICTIONARY_COLUMNS.values())}
+    )
+
+    def rows(self, table: str) -> int:
+        """
+        Number of rows of the table.
+        """
+        first = next(iter(TABLES[table]))
+        column = self.tables[table][first]
+        return len(column) // HASH_SIZE if TABLES[table][first] == FIXED_HASH else len(column)
+
+    def decode(self, table: str, column: str) -> typing.List[typing.Any]:
+        """
+        Get the values of an id column through its dictionary.
+        """
+        values = self.dictionaries[DICTIONARY_COLUMNS[(table, column)]].values
+        return [values[value_id] for value_id in self.tables[table][column]]
+
+    def count_by(self, table: str, column: str) -> typing.Dict[typing.Any, int]:
+        """
+        Count the rows of the table per value of an id column, e.g. transforms per key.
+        """
+        values = self.dictionaries[DICTIONARY_COLUMNS[(table, column)]].values
+        ids = self.tables[table][column]
+        if numpy is not None:
+            counts = numpy.bincount(numpy.frombuffer(ids, dtype=NUMPY_DTYPES[ids.typecode]), minlength=len(values))
+            return {values[i]: int(counts[i]) for i in numpy.flatnonzero(counts)}
+        return {values[value_id]: count for value_id, count in collections.Counter(ids).items()}
+
+    def integers(self, table: str, column: str) -> typing.List[int]:
+        """
+        Get the values of a numeric column, joining the high bits of the wide columns.
+        """
+        low = self.tables[table][column]
+        high = HIGH_COLUMNS.get((table, column))
+        if high is None:
+            return list(low)
+        return [value | high_bits << 64 for value, high_bits in zip(low, self.tables[table][high])]
+
+    def sum_by(self, table: str, value_column: str, group_column: str) -> typing.Dict[typing.Any, int]:
+        """
+        Sum a numeric column of the table per value of an id column, e.g. cost per block hash.
+
+        Wide columns are summed with their high bits, totals are exact.
+        """
+        groups = self.dictionaries[DICTIONARY_COLUMNS[(table, group_column)]].values
+        ids = self.tables[table][group_column]
+        parts = [(self.tables[table][value_column], 0)]
+        high = HIGH_COLUMNS.get((table, value_column))
+        if high is not None:
+            parts.append((self.tables[table][high], 64))
+        if numpy is not None:
+            np_ids = numpy.frombuffer(ids, dtype=NUMPY_DTYPES[ids.typecode])
+            present = numpy.unique(np_ids)
+            totals = dict.fromkeys(present.tolist(), 0)
+            for amounts, shift in parts:
+                values = numpy.frombuffer(amounts, dtype=NUMPY_DTYPES[amounts.typecode])
+                values = values.astype(numpy.int64 if values.dtype.kind == "i" else numpy.uint64)
+                # Summed by 32 bit limbs in 64 bit integers, which can't overflow
+                # below 2**31 rows, and joined as Python integers.
+                for limb, limb_values in ((0, values & 0xFFFFFFFF), (32, values >> 32)):
+                    limb_totals = numpy.zeros(len(groups), dtype=limb_values.dtype)
+                    numpy.add.at(limb_totals, np_ids, limb_values)
+                    for i in totals:
+                        totals[i] += int(limb_totals[i]) << (shift + limb)
+            return {groups[i]: total for i, total in totals.items()}
+        sums: typing.Dict[int, int] = collections.defaultdict(int)
+        for amounts, shift in parts:
+            for group_id, amount in zip(ids, amounts):
+                sums[group_id] += amount << shift
+        return {groups[group_id]: total for group_id, total in sums.items()}
+
+    def to_numpy(self, table: str) -> typing.Dict[str, typing.Any]:
+        """
+        Get the columns of the table as NumPy arrays sharing the column buffers.
+        """
+        if numpy is None:
+            raise ImportError("to_numpy requires numpy")
+        arrays = {}
+        for column, typecode in TABLES[table].items():
+            buffer = self.tables[table][column]
+            if typecode == FIXED_HASH:
+                arrays[column] = numpy.frombuffer(buffer, dtype=f"S{HASH_SIZE}")
+            else:
+                arrays[column] = numpy.frombuffer(buffer, dtype=NUMPY_DTYPES[typecode])
+        return arrays
+
+    def to_arrow(self, table: str) -> typing.Any:
+        """
+        Get the table as a pyarrow Table sharing the column buffers, id columns as dictionary arrays.
+        """
+        if pyarrow is None:
+            raise ImportError("to_arrow requires pyarrow")
+        arrow_types = {"B": pyarrow.uint8(), "H": pyarrow.uint16(), "I": pyarrow.uint32(), "q": pyarrow.int64(), "Q": pyarrow.uint64()}
+        rows = self.rows(table)
+        columns = {}
+        for column, typecode in TABLES[table].items():
+            buffer = pyarrow.py_buffer(self.tables[table][column])
+            if typecode == FIXED_HASH:
+                columns[column] = pyarrow.Array.from_buffers(pyarrow.binary(HASH_SIZE), rows, [None, buffer])
+                continue
+            values = pyarrow.Array.from_buffers(arrow_types[typecode], rows, [None, buffer])
+            dictionary = DICTIONARY_COLUMNS.get((table, column))
+            if dictionary is not None:
+                values = pyarrow.DictionaryArray.from_arrays(values, pyarrow.array([str(value) for value in self.dictionaries[dictionary].values]))
+            columns[column] = values
+        return pyarrow.table(columns)
+
+@dataclass
+class ColumnarExporter:
+    """
+    Flattens deploy results into columnar tables, appended incrementally.
+
+    Keys, block hashes and kinds are dictionary encoded: a column holds ids
+    into the dictionary of its values. Costs are split in two unsigned 64
+    bit columns, cost and cost_high, read back joined by integers() and
+    sum_by(). With a path, every batch_rows
+    deploys the pending rows are written to the file as a record batch,
+    along with the dictionary values added since the previous batch, and
+    memory is released. Without a path, the rows are kept in data.
+
+    Example:
+        with ColumnarExporter("effects.col") as exporter:
+            for crawled in crawler.crawl(start, end):
+                exporter.append_block(crawled)
+        data = read_columnar("effects.col")
+        transforms_per_key = data.count_by("transforms", "key")
+    """
+    path: typing.Optional[str] = None
+    batch_rows: int = 10_000
+    """Deploys per record batch written to the file."""
+    data: ColumnarData = field(default_factory=ColumnarData, init=False)
+    deploys: int = field(default=0, init=False)
+    """Deploys appended, the row index of the next one."""
+    _file: typing.Optional[typing.BinaryIO] = field(default=None, init=False, repr=False)
+    _written: typing.Dict[str, int] = field(default_factory=lambda: collections.defaultdict(int), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.path is not None:
+            self._file = open(self.path, "wb")
+            self._file.write(MAGIC)
+
+    def append(self, res: InfoGetDeployResponse, block_height: int = -1) -> None:
+        """
+        Append the executed deploy, skipped if it has no execution result.
+        """
+        if not res.execution_results:
+            return
+        execution = res.execution_results[0]
+        result = execution.result
+        tables, dictionaries = self.data.tables, self.data.dictionaries
+        row = self.deploys
+        deploys = tables["deploys"]
+        deploys["deploy_hash"] += res.deploy.hash
+        deploys["block_hash"].append(dictionaries["block_hashes"].id(execution.block_hash))
+        deploys["block_height"].append(block_height)
+        cost = int(result.cost)
+        if cost >> 128:
+            raise OverflowError(f"Cost of deploy {res.deploy.hash} exceeds 128 bits: {cost}")
+        deploys["cost"].append(cost & WIDE_MASK)
+        deploys["cost_high"].append(cost >> 64)
+        deploys["success"].append(isinstance(result, ExecutionResultSuccess))
+        key_ids, operation_kinds, transform_kinds = dictionaries["keys"], dictionaries["operation_kinds"], dictionaries["transform_kinds"]
+        operations = tables["operations"]
+        for operation in result.effect.operations:
+            operations["deploy"].append(row)
+            operations["key"].append(key_ids.id(operation.key))
+            operations["kind"].append(operation_kinds.id(operation.kind))
+        transforms = tables["transforms"]
+        for transform in result.effect.transforms:
+            kind = transform.transform if isinstance(transform.transform, str) else next(iter(transform.transform))
+            transforms["deploy"].append(row)
+            transforms["key"].append(key_ids.id(transform.key))
+            transforms["kind"].append(transform_kinds.id(kind))
+        transfers = tables["transfers"]
+        for transfer in result.transfers:
+            transfers["deploy"].append(row)
+            transfers["transfer"].append(key_ids.id(transfer))
+        self.deploys += 1
+        if self._file is not None and self.data.rows("deploys") >= self.batch_rows:
+            self.flush()
+
+    def append_block(self, crawled: typing.Any) -> None:
+        """
+        Append the deploys of a block crawled by a BlockCrawler.
+        """
+        for res in crawled.deploys:
+            self.append(res, crawled.height)
+
+    def flush(self) -> None:
+        """
+        Write the pending rows to the file as a record batch.
+        """
+        if self._file is None or not self.data.rows("deploys"):
+            return
+        header: typing.Dict[str, typing.Any] = {"byteorder": sys.byteorder, "tables": {}, "dictionaries": {}}
+        buffers = []
+        for table, columns in TABLES.items():
+            header["tables"][table] = {"rows": self.data.rows(table), "columns": []}
+            for column, typecode in columns.items():
+                buffer = self.data.tables[table][column]
+                data = bytes(buffer) if typecode == FIXED_HASH else buffer.tobytes()
+                header["tables"][table]["columns"].append([column, typecode, len(data)])
+                buffers.append(data)
+        for name, dictionary in self.data.dictionaries.items():
+            header["dictionaries"][name] = [str(value) for value in dictionary.values[self._written[name]:]]
+            self._written[name] = len(dictionary)
+        blob = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        self._file.write(U32.pack(len(blob)) + blob)
+        for data in buffers:
+            self._file.write(data)
+        # The dictionaries are kept, later batches only write their new values.
+        self.data.tables = _new_tables()
+
+    def close(self) -> None:
+        """
+        Write the pending rows and close the file.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ColumnarExporter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def read_columnar(path: str) -> ColumnarData:
+    """
+    Read the record batches of a columnar file written by a ColumnarExporter.
+    """
+    data = ColumnarData()
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a columnar file: {path}")
+        while True:
+            prefix = f.read(U32.size)
+            if not prefix:
+                return data
+            header = json.loads(f.read(U32.unpack(prefix)[0]))
+            for table, spec in header["tables"].items():
+                for column, typecode, size in spec["columns"]:
+                    raw = f.read(size)
+                    if typecode == FIXED_HASH:
+                        data.tables[table][column] += raw
+                        continue
+                    values = array.array(typecode)
+                    values.frombytes(raw)
+                    if header["byteorder"] != sys.byteorder:
+                        values.byteswap()
+                    data.tables[table][column].extend(values)
+            for name, values in header["dictionaries"].items():
+                decode = DICTIONARY_DECODERS[name]
+                for value in values:
+                    data.dictionaries[name].id(decode(value))
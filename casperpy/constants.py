@@ -1,9 +1,21 @@
+CHAIN_GET_BLOCK = "chain_get_block"
+
+CHAIN_GET_BLOCK_TRANSFERS = "chain_get_block_transfers"
+
 CHAIN_GET_STATE_ROOT_HASH = "chain_get_state_root_hash"
 
+ACCOUNT_PUT_DEPLOY = "account_put_deploy"
+
 INFO_GET_DEPLOY = "info_get_deploy"
 
 STATE_GET_ACCOUNT_INFO = "state_get_account_info"
 
+STATE_GET_ITEM = "state_get_item"
+
+QUERY_GLOBAL_STATE = "query_global_state"
+
+STATE_GET_DICTIONARY_ITEM = "state_get_dictionary_item"
+
 """
 CHAIN_GET_BLOCK = "chain_get_block"
 CHAIN_GET_BLOCK_TRANSFERS = "chain_get_block_transfers"
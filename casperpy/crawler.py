@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future
+import collections
+import time
+import typing
+from .client import Client
+from .errors import RPCError
+from .scheduler import Priority, lane
+from .types_old import Block, BlockTransfer, Digest, InfoGetDeployResponse
+
+@dataclass
+class CrawledBlock:
+    """
+    A block with the deploys it includes.
+    """
+    block: Block
+    deploys: typing.List[InfoGetDeployResponse]
+    """Deploys then transfers of the block, in the order of the block body."""
+    transfers: typing.Optional[typing.List[BlockTransfer]] = None
+    """Transfers of the block, if fetched."""
+
+    @property
+    def height(self) -> int:
+        return self.block.header.height
+
+@dataclass
+class BlockCrawler:
+    """
+    Walks the chain by height, fetching blocks ahead of the consumer.
+
+    Up to window blocks past the one being consumed are fetched concurrently
+    with their deploys, and blocks are yielded in height order. The deploys
+    of a block are fetched as a single JSON RPC batch when the client
+    supports batches.
+
+    checkpoint is the height of the next block to yield, crawling again
+    from it resumes where the last crawl stopped. Its requests go in the
+    BULK lane of clients with a scheduler.
+
+    Example:
+        crawler = BlockCrawler(client, checkpoint=load_checkpoint())
+        for crawled in crawler.crawl(end=tip):
+            index(crawled)
+            save_checkpoint(crawler.checkpoint)
+    """
+    client: Client
+    window: int = 32
+    """Maximum number of blocks fetched ahead."""
+    max_workers: int = 8
+    fetch_deploys: bool = True
+    fetch_transfers: bool = False
+    lazy: bool = True
+    """Build the nested lists of the deploys on access."""
+    poll_interval: float = 10.0
+    """Seconds to wait for a block past the tip of the chain when following it."""
+    checkpoint: int = 0
+    """Height of the next block to yield."""
+
+    def fetch(self, height: int) -> typing.Optional[CrawledBlock]:
+        """
+        Fetch the block at the height with its deploys, None if the node doesn't have it yet.
+        """
+        with lane(Priority.BULK):
+            return self._fetch(height)
+
+    def _fetch(self, height: int) -> typing.Optional[CrawledBlock]:
+        try:
+            res = self.client.chain_get_block(height, self.lazy)
+        except RPCError:
+            return None
+        if res.block is None:
+            return None
+        crawled = CrawledBlock(res.block, [])
+        hashes = res.block.body.deploy_hashes + res.block.body.transfer_hashes
+        if self.fetch_deploys and hashes:
+            crawled.deploys = self._fetch_deploys(hashes)
+        if self.fetch_transfers:
+            crawled.transfers = self.client.chain_get_block_transfers(res.block.hash).transfers
+        return crawled
+
+    def _fetch_deploys(self, hashes: typing.List[Digest]) -> typing.List[InfoGetDeployResponse]:
+        batch = getattr(self.client, "batch", None)
+        if batch is None:
+            return [self.client.info_get_deploy(str(deploy_hash), self.lazy) for deploy_hash in hashes]
+        with batch() as batch:
+            calls = [batch.info_get_deploy(str(deploy_hash), self.lazy) for deploy_hash in hashes]
+        return [call.get() for call in calls]
+
+    def crawl(self, start: typing.Optional[int] = None, end: typing.Optional[int] = None) -> typing.Iterator[CrawledBlock]:
+        """
+        Yield the blocks from start (the checkpoint if None) up to end excluded.
+
+        Without end, the chain is followed forever, waiting poll_interval
+        seconds for each block not produced yet. With end, a missing block
+        raises a LookupError.
+        """
+        height = self.checkpoint if start is None else start
+        self.checkpoint = height
+        ahead = height
+        in_flight: "collections.deque[typing.Tuple[int, Future]]" = collections.deque()
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="casperpy-crawler") as executor:
+            try:
+                while end is None or height < end:
+                    while len(in_flight) < self.window and (end is None or ahead < end):
+                        in_flight.append((ahead, executor.submit(self.fetch, ahead)))
+                        ahead += 1
+                    height, future = in_flight.popleft()
+                    crawled = future.result()
+                    if crawled is None:
+                        if end is not None:
+                            raise LookupError(f"Block {height} not found")
+                        # Past the tip, the blocks fetched ahead are missing too.
+                        for _, pending in in_flight:
+                            pending.cancel()
+                        in_flight.clear()
+                        ahead = height
+                        time.sleep(self.poll_interval)
+                        continue
+                    self.checkpoint = height + 1
+                    yield crawled
+                    height += 1
+            finally:
+                for _, pending in in_flight:
+                    pending.cancel()
@@ -0,0 +1,111 @@
+import collections
+import dataclasses
+import hashlib
+import time
+import typing
+
+import casperpy.types.deploy as deploy_types
+from .signing import PrivateKey
+
+DEFAULT_TTL = 30 * 60 * 1000
+"""Default time to live of a deploy, in milliseconds."""
+
+def blake2b256(data: bytes) -> bytes:
+    """
+    Hash the data with blake2b, 32 bytes digest.
+    """
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+@dataclasses.dataclass
+class DeployBuilder:
+    """
+    Builds, hashes and signs deploys for a chain.
+
+    The body hash covers the serialized payment followed by the session.
+    When the session is a ModuleBytes item, the hasher state after its wasm
+    payload is kept per (payment, payload) pair, so a large module shared by
+    many deploys is hashed once and only the arguments are hashed per deploy.
+    """
+    chain_name: str
+    gas_price: int = 1
+    ttl: int = DEFAULT_TTL
+    """Time to live of the deploys, in milliseconds."""
+    max_cached_modules: int = 16
+    _module_hashers: "collections.OrderedDict[typing.Tuple[bytes, int], typing.Tuple[bytes, typing.Any]]" = dataclasses.field(
+        default_factory=collections.OrderedDict, init=False, repr=False
+    )
+
+    def _module_hasher(self, payment: bytes, session: deploy_types.ModuleBytes) -> typing.Any:
+        key = (payment, id(session.raw_wasm_payload))
+        cached = self._module_hashers.get(key)
+        # The payload is kept in the entry so its id can't be reused by another object.
+        if cached is None or cached[0] is not session.raw_wasm_payload:
+            buf = bytearray(payment)
+            session.encode_module_into(buf)
+            cached = (session.raw_wasm_payload, hashlib.blake2b(buf, digest_size=32))
+            self._module_hashers[key] = cached
+            while len(self._module_hashers) > self.max_cached_modules:
+                self._module_hashers.popitem(last=False)
+        else:
+            self._module_hashers.move_to_end(key)
+        return cached[1].copy()
+
+    def body_hash(self, payment: deploy_types.DeployExecutableItem, session: deploy_types.DeployExecutableItem) -> bytes:
+        """
+        Hash the serialized payment and session of a deploy.
+        """
+        payment_bytes = payment.encode_value()
+        if isinstance(session, deploy_types.ModuleBytes) and session.raw_wasm_payload:
+            hasher = self._module_hasher(payment_bytes, session)
+            buf = bytearray()
+            session.encode_args_into(buf)
+            hasher.update(buf)
+            return hasher.digest()
+        return blake2b256(payment_bytes + session.encode_value())
+
+    def header(
+        self,
+        signer: PrivateKey,
+        body_hash: bytes,
+        timestamp: typing.Optional[int] = None,
+        dependencies: typing.Sequence[bytes] = (),
+    ) -> deploy_types.DeployHeader:
+        """
+        Create the header of a deploy sent from the account of the signer.
+        """
+        return deploy_types.DeployHeader(
+            account=signer.public_key,
+            timestamp=int(time.time() * 1000) if timestamp is None else timestamp,
+            ttl=self.ttl,
+            gas_price=self.gas_price,
+            body_hash=body_hash,
+            dependencies=list(dependencies),
+            chain_name=self.chain_name,
+        )
+
+    def build(
+        self,
+        signer: PrivateKey,
+        payment: deploy_types.DeployExecutableItem,
+        session: deploy_types.DeployExecutableItem,
+        timestamp: typing.Optional[int] = None,
+        dependencies: typing.Sequence[bytes] = (),
+    ) -> deploy_types.Deploy:
+        """
+        Create a deploy from the account of the signer, hashed and signed by it.
+        """
+        header = self.header(signer, self.body_hash(payment, session), timestamp, dependencies)
+        deploy_hash = blake2b256(header.encode_value())
+        deploy = deploy_types.Deploy(approvals=[], hash=deploy_hash, payment=payment, session=session, header=header)
+        return sign(deploy, signer)
+
+def sign(deploy: deploy_types.Deploy, signer: PrivateKey) -> deploy_types.Deploy:
+    """
+    Add the approval of the signer to the deploy.
+    """
+    deploy.approvals.append(deploy_types.DeployApproval(
+        signer=signer.public_key.encode_value().hex(),
+        signature=signer.sign(deploy.hash),
+        signature_type=signer.algo,
+    ))
+    return deploy
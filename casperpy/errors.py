@@ -0,0 +1,14 @@
+import typing
+
+VALUE_NOT_FOUND = -32003
+"""Code of the error answered by the node for a global state query finding no value."""
+
+class RPCError(Exception):
+    """
+    Error object returned by the node in place of a JSON RPC result.
+    """
+    def __init__(self, code: int, message: str, data: typing.Any = None) -> None:
+        super().__init__(f"{message} (code {code})")
+        self.code = code
+        self.message = message
+        self.data = data
@@ -0,0 +1,269 @@
+from dataclasses import dataclass, field
+import enum
+import http.client
+import time
+import typing
+from .codec import Codec, get_codec
+from .types_old import Block, Deploy, Digest, ExecutionResultWrapper
+
+class EventType(enum.Enum):
+    """
+    Enumeration over the events of the node event stream.
+    """
+    API_VERSION = "ApiVersion"
+    BLOCK_ADDED = "BlockAdded"
+    DEPLOY_ACCEPTED = "DeployAccepted"
+    DEPLOY_PROCESSED = "DeployProcessed"
+    DEPLOY_EXPIRED = "DeployExpired"
+    FAULT = "Fault"
+    FINALITY_SIGNATURE = "FinalitySignature"
+    STEP = "Step"
+    SHUTDOWN = "Shutdown"
+
+@dataclass(slots=True)
+class BlockAdded:
+    """
+    A block was added to the linear chain.
+    """
+    block_hash: Digest
+    block: Block
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> "BlockAdded":
+        return cls(block_hash=Digest.from_hex(d["block_hash"]), block=Block.from_json(d["block"], lazy))
+
+@dataclass(slots=True)
+class DeployAccepted:
+    """
+    A deploy was accepted by the node.
+    """
+    deploy: Deploy
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> "DeployAccepted":
+        return cls(deploy=Deploy.from_json(d, lazy))
+
+@dataclass(slots=True)
+class DeployProcessed:
+    """
+    A deploy was executed in a block.
+    """
+    deploy_hash: Digest
+    account: str
+    timestamp: str
+    ttl: str
+    dependencies: typing.List[str]
+    execution_result: ExecutionResultWrapper
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> "DeployProcessed":
+        return cls(
+            deploy_hash=Digest.from_hex(d["deploy_hash"]),
+            account=d["account"],
+            timestamp=d["timestamp"],
+            ttl=d["ttl"],
+            dependencies=d["dependencies"],
+            execution_result=ExecutionResultWrapper.from_json(
+                {"block_hash": d["block_hash"], "result": d["execution_result"]}, lazy
+            ),
+        )
+
+@dataclass(slots=True)
+class FinalitySignature:
+    """
+    A validator signed a block as final.
+    """
+    block_hash: Digest
+    era_id: int
+    signature: str
+    public_key: str
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> "FinalitySignature":
+        return cls(block_hash=Digest.from_hex(d["block_hash"]), era_id=d["era_id"], signature=d["signature"], public_key=d["public_key"])
+
+EVENT_PARSERS: typing.Dict[str, typing.Callable[[typing.Any, bool], typing.Any]] = {
+    EventType.BLOCK_ADDED.value: BlockAdded.from_json,
+    EventType.DEPLOY_ACCEPTED.value: DeployAccepted.from_json,
+    EventType.DEPLOY_PROCESSED.value: DeployProcessed.from_json,
+    EventType.FINALITY_SIGNATURE.value: FinalitySignature.from_json,
+}
+"""Typed parsers of the events, other events keep their raw JSON data."""
+
+@dataclass(slots=True)
+class Event:
+    """
+    An event of the node event stream.
+    """
+    id: typing.Optional[int]
+    type: str
+    data: typing.Any
+    """BlockAdded, DeployAccepted, DeployProcessed or FinalitySignature, the raw JSON data of other events."""
+
+def event_type(data: str) -> typing.Optional[str]:
+    """
+    Get the type of a serialized event from its first key, without decoding it.
+
+    None when the JSON is not laid out as {"Type": ..., the event has to be decoded then.
+    """
+    if not data.startswith('{"'):
+        return None
+    end = data.find('"', 2)
+    return data[2:end] if end > 0 else None
+
+class SSEParser:
+    """
+    Incremental parser of a server-sent event stream, fed one line at a time.
+    """
+    def __init__(self) -> None:
+        self._data: typing.List[str] = []
+        self._id: typing.Optional[str] = None
+
+    def feed(self, line: str) -> typing.Optional[typing.Tuple[typing.Optional[str], str]]:
+        """
+        Feed a line, returning the (id, data) of the event it ends if any.
+        """
+        line = line.rstrip("\r\n")
+        if not line:
+            if not self._data:
+                return None
+            event = (self._id, "\n".join(self._data))
+            self._data, self._id = [], None
+            return event
+        if line.startswith(":"):
+            # Comment, sent as a keep alive.
+            return None
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "id":
+            self._id = value
+        return None
+
+@dataclass(slots=True)
+class EventStream:
+    """
+    Consumer of the event stream of a node, next to the JSON RPC client.
+
+    Events are parsed as lines arrive. With event_types set, other events
+    are skipped from their type alone, before their JSON is decoded. After
+    a disconnect the stream reconnects from the last event id received, so
+    no event is lost or repeated as long as the node still buffers it.
+
+    Example:
+        stream = EventStream("localhost", event_types={EventType.BLOCK_ADDED})
+        for event in stream:
+            print(event.data.block.header.height)
+    """
+    host: str
+    port: int = 9999
+    channel: str = "main"
+    """Stream of the node: main (blocks, processed deploys...), deploys or sigs."""
+    event_types: typing.Optional[typing.Collection[EventType]] = None
+    """Types of the events to yield, all if None."""
+    lazy: bool = True
+    """Build the nested lists of the events on access."""
+    last_event_id: typing.Optional[int] = None
+    """Id of the last event received, the stream resumes after it."""
+    reconnect_delay: float = 1.0
+    max_reconnects: typing.Optional[int] = None
+    """Reconnections allowed in a row without receiving an event, unlimited if None."""
+    timeout: float = 60.0
+    """Seconds without any line, keep alives included, before reconnecting."""
+    codec: Codec = field(default_factory=get_codec, repr=False)
+    _connection: typing.Optional[http.client.HTTPConnection] = field(default=None, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def url_path(self) -> str:
+        """
+        The path of the stream, starting from the event after the last one received.
+        """
+        path = f"/events/{self.channel}"
+        if self.last_event_id is not None:
+            path += f"?start_from={self.last_event_id + 1}"
+        return path
+
+    def _decode(self, data: str) -> typing.Tuple[str, typing.Any]:
+        """
+        Decode a serialized event into its type and data, as {"Type": data} or "Type" for events without data.
+        """
+        decoded = self.codec.loads(data)
+        if isinstance(decoded, str):
+            return decoded, None
+        (name, payload), = decoded.items()
+        return name, payload
+
+    def _lines(self) -> typing.Iterator[str]:
+        self._connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            self._connection.request("GET", self.url_path, headers={"Accept": "text/event-stream"})
+            res = self._connection.getresponse()
+            if res.status != 200:
+                raise http.client.HTTPException(f"HTTP {res.status}: {res.reason}")
+            while True:
+                line = res.readline()
+                if not line:
+                    return
+                yield line.decode("utf-8")
+        finally:
+            if self._connection is not None:
+                self._connection.close()
+
+    def events(self) -> typing.Iterator[Event]:
+        """
+        Yield the events of the stream, reconnecting after disconnects until closed.
+        """
+        wanted = None if self.event_types is None else {event_type.value for event_type in self.event_types}
+        failures = 0
+        self._closed = False
+        while not self._closed:
+            parser = SSEParser()
+            try:
+                for line in self._lines():
+                    parsed = parser.feed(line)
+                    if parsed is None:
+                        continue
+                    raw_id, data = parsed
+                    event_id = int(raw_id) if raw_id else None
+                    if event_id is not None:
+                        if self.last_event_id is not None and event_id <= self.last_event_id:
+                            continue
+                        self.last_event_id = event_id
+                    name = event_type(data)
+                    if name is None:
+                        name, payload = self._decode(data)
+                        if wanted is not None and name not in wanted:
+                            continue
+                    elif wanted is not None and name not in wanted:
+                        continue
+                    else:
+                        payload = self.codec.loads(data)[name]
+                    parser_of = EVENT_PARSERS.get(name)
+                    yield Event(event_id, name, payload if parser_of is None else parser_of(payload, self.lazy))
+                    if self._closed:
+                        return
+                    # Not on the ApiVersion event every connection starts with.
+                    if event_id is not None:
+                        failures = 0
+            except (OSError, http.client.HTTPException):
+                if self._closed:
+                    return
+            failures += 1
+            if self.max_reconnects is not None and failures > self.max_reconnects:
+                raise ConnectionError(f"Event stream lost after {self.max_reconnects} reconnections")
+            if not self._closed:
+                time.sleep(self.reconnect_delay)
+
+    def __iter__(self) -> typing.Iterator[Event]:
+        return self.events()
+
+    def close(self) -> None:
+        """
+        Stop the stream, closing its connection.
+        """
+        self._closed = True
+        if self._connection is not None:
+            self._connection.close()
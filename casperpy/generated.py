@@ -0,0 +1,1707 @@
+# Generated by codegen.py from docs/rpc_schema_hashing_V2.json, do not edit.
+import dataclasses
+import typing
+from sys import intern
+from .types.crypto import Digest
+import casperpy.types.deploy as deploy_types
+import casperpy.types.keys as keys
+
+@dataclasses.dataclass(slots=True)
+class AccountPutDeployResult:
+    """
+    Result for "account_put_deploy" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    deploy_hash: Digest
+    """The deploy hash."""
+
+@dataclasses.dataclass(slots=True)
+class InfoGetDeployResult:
+    """
+    Result for "info_get_deploy" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    deploy: "Deploy"
+    """The deploy."""
+    execution_results: typing.List["JsonExecutionResult"]
+    """The map of block hash to execution result."""
+
+@dataclasses.dataclass(slots=True)
+class StateGetAccountInfoResult:
+    """
+    Result for "state_get_account_info" RPC response.
+    """
+    account: "Account"
+    """The account."""
+    api_version: str
+    """The RPC API version."""
+    merkle_proof: str
+    """The merkle proof."""
+
+@dataclasses.dataclass(slots=True)
+class StateGetDictionaryItemResult:
+    """
+    Result for "state_get_dictionary_item" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    dictionary_key: str
+    """The key under which the value is stored."""
+    merkle_proof: str
+    """The merkle proof."""
+    stored_value: "StoredValue"
+    """The stored value."""
+
+@dataclasses.dataclass(slots=True)
+class QueryGlobalStateResult:
+    """
+    Result for "query_global_state" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    merkle_proof: str
+    """The merkle proof."""
+    stored_value: "StoredValue"
+    """The stored value."""
+    block_header: typing.Optional["JsonBlockHeader"] = None
+    """The block header if a Block hash was provided."""
+
+@dataclasses.dataclass(slots=True)
+class InfoGetPeersResult:
+    """
+    Result for "info_get_peers" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    peers: typing.List["PeerEntry"]
+    """The node ID and network address of each connected peer."""
+
+@dataclasses.dataclass(slots=True)
+class InfoGetStatusResult:
+    """
+    Result for "info_get_status" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    build_version: str
+    """The compiled node version."""
+    chainspec_name: str
+    """The chainspec name."""
+    peers: typing.List["PeerEntry"]
+    """The node ID and network address of each connected peer."""
+    starting_state_root_hash: Digest
+    """The state root hash used at the start of the current session."""
+    uptime: str
+    """Time that passed since the node has started."""
+    last_added_block_info: typing.Optional["MinimalBlockInfo"] = None
+    """The minimal info of the last block from the linear chain."""
+    next_upgrade: typing.Optional["NextUpgrade"] = None
+    """Information about the next scheduled upgrade."""
+    our_public_signing_key: typing.Optional[str] = None
+    """Our public signing key."""
+    round_length: typing.Optional[str] = None
+    """The next round length if this node is a validator."""
+
+@dataclasses.dataclass(slots=True)
+class InfoGetValidatorChangesResult:
+    """
+    Result for the "info_get_validator_changes" RPC.
+    """
+    api_version: str
+    """The RPC API version."""
+    changes: typing.List["JsonValidatorChanges"]
+    """The validators' status changes."""
+
+@dataclasses.dataclass(slots=True)
+class ChainGetBlockResult:
+    """
+    Result for "chain_get_block" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    block: typing.Optional["JsonBlock"] = None
+    """The block, if found."""
+
+@dataclasses.dataclass(slots=True)
+class ChainGetBlockTransfersResult:
+    """
+    Result for "chain_get_block_transfers" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    block_hash: typing.Optional[Digest] = None
+    """The block hash, if found."""
+    transfers: typing.Optional[typing.List["Transfer"]] = None
+    """The block's transfers, if found."""
+
+@dataclasses.dataclass(slots=True)
+class ChainGetStateRootHashResult:
+    """
+    Result for "chain_get_state_root_hash" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    state_root_hash: typing.Optional[Digest] = None
+    """Hex-encoded hash of the state root."""
+
+@dataclasses.dataclass(slots=True)
+class StateGetItemResult:
+    """
+    Result for "state_get_item" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    merkle_proof: str
+    """The merkle proof."""
+    stored_value: "StoredValue"
+    """The stored value."""
+
+@dataclasses.dataclass(slots=True)
+class StateGetBalanceResult:
+    """
+    Result for "state_get_balance" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    balance_value: int
+    """The balance value."""
+    merkle_proof: str
+    """The merkle proof."""
+
+@dataclasses.dataclass(slots=True)
+class ChainGetEraInfoBySwitchBlockResult:
+    """
+    Result for "chain_get_era_info" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    era_summary: typing.Optional["EraSummary"] = None
+    """The era summary."""
+
+@dataclasses.dataclass(slots=True)
+class StateGetAuctionInfoResult:
+    """
+    Result for "state_get_auction_info" RPC response.
+    """
+    api_version: str
+    """The RPC API version."""
+    auction_state: "AuctionState"
+    """The auction state."""
+
+@dataclasses.dataclass(slots=True)
+class Deploy:
+    """
+    A deploy; an item containing a smart contract along with the requester's signature(s).
+    """
+    approvals: typing.List["Approval"]
+    hash: Digest
+    header: "DeployHeader"
+    payment: "ExecutableDeployItem"
+    session: "ExecutableDeployItem"
+
+@dataclasses.dataclass(slots=True)
+class JsonExecutionResult:
+    """
+    The execution result of a single deploy.
+    """
+    block_hash: Digest
+    """The block hash."""
+    result: "ExecutionResult"
+    """Execution result."""
+
+@dataclasses.dataclass(slots=True)
+class Account:
+    """
+    Structure representing a user's account, stored in global state.
+    """
+    account_hash: keys.Key
+    action_thresholds: "ActionThresholds"
+    associated_keys: typing.List["AssociatedKey"]
+    main_purse: keys.Key
+    named_keys: typing.List["NamedKey"]
+
+@dataclasses.dataclass(slots=True)
+class StoredValue:
+    """
+    Representation of a value stored in global state. `Account`, `Contract` and `ContractPackage`
+    have their own `json_compatibility` representations (see their docs for further info).
+    """
+    kind: str
+    """CLValue, Account, ContractWasm, Contract, ContractPackage, Transfer, DeployInfo, EraInfo, Bid, Withdraw."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class JsonBlockHeader:
+    """
+    JSON representation of a block header.
+    """
+    accumulated_seed: Digest
+    """Accumulated seed."""
+    body_hash: Digest
+    """The body hash."""
+    era_id: int
+    """The block era id."""
+    height: int
+    """The block height."""
+    parent_hash: Digest
+    """The parent hash."""
+    protocol_version: str
+    """The protocol version."""
+    random_bit: bool
+    """Randomness bit."""
+    state_root_hash: Digest
+    """The state root hash."""
+    timestamp: str
+    """The block timestamp."""
+    era_end: typing.Optional["JsonEraEnd"] = None
+    """The era end."""
+
+@dataclasses.dataclass(slots=True)
+class PeerEntry:
+    """
+    PeerEntry
+    """
+    address: str
+    node_id: str
+
+@dataclasses.dataclass(slots=True)
+class MinimalBlockInfo:
+    """
+    Minimal info of a `Block`.
+    """
+    creator: str
+    era_id: int
+    hash: Digest
+    height: int
+    state_root_hash: Digest
+    timestamp: str
+
+@dataclasses.dataclass(slots=True)
+class NextUpgrade:
+    """
+    Information about the next protocol upgrade.
+    """
+    activation_point: typing.Any
+    protocol_version: str
+
+@dataclasses.dataclass(slots=True)
+class JsonValidatorChanges:
+    """
+    The changes in a validator's status.
+    """
+    public_key: str
+    """The public key of the validator."""
+    status_changes: typing.List["JsonValidatorStatusChange"]
+    """The set of changes to the validator's status."""
+
+@dataclasses.dataclass(slots=True)
+class JsonBlock:
+    """
+    A JSON-friendly representation of `Block`.
+    """
+    body: "JsonBlockBody"
+    """JSON-friendly block body."""
+    hash: Digest
+    """`BlockHash`"""
+    header: "JsonBlockHeader"
+    """JSON-friendly block header."""
+    proofs: typing.List["JsonProof"]
+    """JSON-friendly list of proofs for this block."""
+
+@dataclasses.dataclass(slots=True)
+class Transfer:
+    """
+    Represents a transfer from one purse to another
+    """
+    amount: int
+    """Transfer amount"""
+    deploy_hash: Digest
+    """Deploy that created the transfer"""
+    from_: keys.Key
+    """Account from which transfer was executed"""
+    gas: int
+    """Gas"""
+    source: keys.Key
+    """Source purse"""
+    target: keys.Key
+    """Target purse"""
+    id: typing.Optional[int] = None
+    """User-defined id"""
+    to: typing.Optional[keys.Key] = None
+    """Account to which funds are transferred"""
+
+@dataclasses.dataclass(slots=True)
+class EraSummary:
+    """
+    The summary of an era
+    """
+    block_hash: Digest
+    """The block hash"""
+    era_id: int
+    """The era id"""
+    merkle_proof: str
+    """The merkle proof"""
+    state_root_hash: Digest
+    """Hex-encoded hash of the state root"""
+    stored_value: "StoredValue"
+    """The StoredValue containing era information"""
+
+@dataclasses.dataclass(slots=True)
+class AuctionState:
+    """
+    Data structure summarizing auction contract data.
+    """
+    bids: typing.List["JsonBids"]
+    """All bids contained within a vector."""
+    block_height: int
+    """Block height."""
+    era_validators: typing.List["JsonEraValidators"]
+    """Era validators."""
+    state_root_hash: Digest
+    """Global state hash."""
+
+@dataclasses.dataclass(slots=True)
+class Approval:
+    """
+    A struct containing a signature and the public key of the signer.
+    """
+    signature: str
+    signer: str
+
+@dataclasses.dataclass(slots=True)
+class DeployHeader:
+    """
+    The header portion of a [`Deploy`](struct.Deploy.html).
+    """
+    account: str
+    body_hash: Digest
+    chain_name: str
+    dependencies: typing.List[Digest]
+    gas_price: int
+    timestamp: str
+    ttl: str
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItem:
+    """
+    Represents possible variants of an executable deploy.
+    """
+    kind: str
+    """ModuleBytes, StoredContractByHash, StoredContractByName, StoredVersionedContractByHash, StoredVersionedContractByName, Transfer."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutionResult:
+    """
+    The result of executing a single deploy.
+    """
+    kind: str
+    """Failure, Success."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class ActionThresholds:
+    """
+    Thresholds that have to be met when executing an action of a certain type.
+    """
+    deployment: int
+    key_management: int
+
+@dataclasses.dataclass(slots=True)
+class AssociatedKey:
+    """
+    AssociatedKey
+    """
+    account_hash: keys.Key
+    weight: int
+
+@dataclasses.dataclass(slots=True)
+class NamedKey:
+    """
+    A named key.
+    """
+    key: keys.Key
+    """The value of the entry: a casper `Key` type."""
+    name: str
+    """The name of the entry."""
+
+@dataclasses.dataclass(slots=True)
+class CLValue:
+    """
+    A Casper value, i.e. a value which can be stored and manipulated by smart contracts. It holds
+    the underlying data as a type-erased, serialized `Vec<u8>` and also holds the CLType of the
+    underlying data as a separate member. The `parsed` field, representing the original value, is a
+    convenience only available when a CLValue is encoded to JSON, and can always be set to null if
+    preferred.
+    """
+    bytes: str
+    cl_type: "CLType"
+    parsed: typing.Optional[typing.Any] = None
+
+@dataclasses.dataclass(slots=True)
+class Contract:
+    """
+    A contract struct that can be serialized as JSON object.
+    """
+    contract_package_hash: str
+    contract_wasm_hash: str
+    entry_points: typing.List["EntryPoint"]
+    named_keys: typing.List["NamedKey"]
+    protocol_version: str
+
+@dataclasses.dataclass(slots=True)
+class ContractPackage:
+    """
+    Contract definition, metadata, and security container.
+    """
+    access_key: keys.Key
+    disabled_versions: typing.List["DisabledVersion"]
+    groups: typing.List["Groups"]
+    versions: typing.List["ContractVersion"]
+
+@dataclasses.dataclass(slots=True)
+class DeployInfo:
+    """
+    Information relating to the given Deploy.
+    """
+    deploy_hash: Digest
+    """The relevant Deploy."""
+    from_: keys.Key
+    """Account identifier of the creator of the Deploy."""
+    gas: int
+    """Gas cost of executing the Deploy."""
+    source: keys.Key
+    """Source purse used for payment of the Deploy."""
+    transfers: typing.List[keys.Key]
+    """Transfers performed by the Deploy."""
+
+@dataclasses.dataclass(slots=True)
+class EraInfo:
+    """
+    Auction metadata. Intended to be recorded at each era.
+    """
+    seigniorage_allocations: typing.List["SeigniorageAllocation"]
+
+@dataclasses.dataclass(slots=True)
+class Bid:
+    """
+    An entry in the validator map.
+    """
+    bonding_purse: keys.Key
+    """The purse that was used for bonding."""
+    delegation_rate: int
+    """Delegation rate"""
+    delegators: typing.Dict[str, "Delegator"]
+    """This validator's delegators, indexed by their public keys"""
+    inactive: bool
+    """`true` if validator has been "evicted\""""
+    staked_amount: int
+    """The amount of tokens staked by a validator (not including delegators)."""
+    validator_public_key: str
+    """Validator public key"""
+    vesting_schedule: typing.Optional["VestingSchedule"] = None
+    """Vesting schedule for a genesis validator. `None` if non-genesis validator."""
+
+@dataclasses.dataclass(slots=True)
+class UnbondingPurse:
+    """
+    Unbonding purse.
+    """
+    amount: int
+    """Unbonding Amount."""
+    bonding_purse: keys.Key
+    """Bonding Purse"""
+    era_of_creation: int
+    """Era in which this unbonding request was created."""
+    unbonder_public_key: str
+    """Unbonders public key."""
+    validator_public_key: str
+    """Validators public key."""
+
+@dataclasses.dataclass(slots=True)
+class JsonEraEnd:
+    """
+    JsonEraEnd
+    """
+    era_report: "JsonEraReport"
+    next_era_validator_weights: typing.List["ValidatorWeight"]
+
+@dataclasses.dataclass(slots=True)
+class JsonValidatorStatusChange:
+    """
+    A single change to a validator's status in the given era.
+    """
+    era_id: int
+    """The era in which the change occurred."""
+    validator_change: str
+    """The change in validator status."""
+
+@dataclasses.dataclass(slots=True)
+class JsonBlockBody:
+    """
+    A JSON-friendly representation of `Body`
+    """
+    deploy_hashes: typing.List[Digest]
+    proposer: str
+    transfer_hashes: typing.List[Digest]
+
+@dataclasses.dataclass(slots=True)
+class JsonProof:
+    """
+    A JSON-friendly representation of a proof, i.e. a block's finality signature.
+    """
+    public_key: str
+    signature: str
+
+@dataclasses.dataclass(slots=True)
+class JsonBids:
+    """
+    A Json representation of a single bid.
+    """
+    bid: "JsonBid"
+    public_key: str
+
+@dataclasses.dataclass(slots=True)
+class JsonEraValidators:
+    """
+    The validators for the given era.
+    """
+    era_id: int
+    validator_weights: typing.List["JsonValidatorWeights"]
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemModuleBytes:
+    """
+    ExecutableDeployItemModuleBytes
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+    module_bytes: str
+    """Hex-encoded raw Wasm bytes."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemStoredContractByHash:
+    """
+    ExecutableDeployItemStoredContractByHash
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+    entry_point: str
+    """Name of an entry point."""
+    hash: str
+    """Hex-encoded hash."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemStoredContractByName:
+    """
+    ExecutableDeployItemStoredContractByName
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+    entry_point: str
+    """Name of an entry point."""
+    name: str
+    """Named key."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemStoredVersionedContractByHash:
+    """
+    ExecutableDeployItemStoredVersionedContractByHash
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+    entry_point: str
+    """Entry point name."""
+    hash: str
+    """Hex-encoded hash."""
+    version: typing.Optional[int] = None
+    """An optional version of the contract to call. It will default to the highest enabled version if no value is specified."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemStoredVersionedContractByName:
+    """
+    ExecutableDeployItemStoredVersionedContractByName
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+    entry_point: str
+    """Entry point name."""
+    name: str
+    """Named key."""
+    version: typing.Optional[int] = None
+    """An optional version of the contract to call. It will default to the highest enabled version if no value is specified."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutableDeployItemTransfer:
+    """
+    ExecutableDeployItemTransfer
+    """
+    args: typing.List[typing.Tuple[str, "CLValue"]]
+    """Runtime arguments."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutionResultFailure:
+    """
+    ExecutionResultFailure
+    """
+    cost: int
+    """The cost of executing the deploy."""
+    effect: "ExecutionEffect"
+    """The effect of executing the deploy."""
+    error_message: str
+    """The error message associated with executing the deploy."""
+    transfers: typing.List[keys.Key]
+    """A record of Transfers performed while executing the deploy."""
+
+@dataclasses.dataclass(slots=True)
+class ExecutionResultSuccess:
+    """
+    ExecutionResultSuccess
+    """
+    cost: int
+    """The cost of executing the deploy."""
+    effect: "ExecutionEffect"
+    """The effect of executing the deploy."""
+    transfers: typing.List[keys.Key]
+    """A record of Transfers performed while executing the deploy."""
+
+@dataclasses.dataclass(slots=True)
+class CLType:
+    """
+    Casper types, i.e. types which can be stored and manipulated by smart contracts. Provides a
+    description of the underlying data type of a [`CLValue`](crate::CLValue).
+    """
+    kind: str
+    """Bool, I32, I64, U8, U32, U64, U128, U256, U512, Unit, String, Key, URef, PublicKey, Any, Option, List, ByteArray, Result, Map, Tuple1, Tuple2, Tuple3."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class EntryPoint:
+    """
+    Type signature of a method. Order of arguments matter since can be referenced by index as well
+    as name.
+    """
+    access: "EntryPointAccess"
+    args: typing.List["Parameter"]
+    entry_point_type: str
+    name: str
+    ret: "CLType"
+
+@dataclasses.dataclass(slots=True)
+class DisabledVersion:
+    """
+    DisabledVersion
+    """
+    contract_version: int
+    protocol_version_major: int
+
+@dataclasses.dataclass(slots=True)
+class Groups:
+    """
+    Groups
+    """
+    group: str
+    keys: typing.List[keys.Key]
+
+@dataclasses.dataclass(slots=True)
+class ContractVersion:
+    """
+    ContractVersion
+    """
+    contract_hash: str
+    contract_version: int
+    protocol_version_major: int
+
+@dataclasses.dataclass(slots=True)
+class SeigniorageAllocation:
+    """
+    Information about a seigniorage allocation
+    """
+    kind: str
+    """Validator, Delegator."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class Delegator:
+    """
+    Represents a party delegating their stake to a validator (or "delegatee")
+    """
+    bonding_purse: keys.Key
+    delegator_public_key: str
+    staked_amount: int
+    validator_public_key: str
+    vesting_schedule: typing.Optional["VestingSchedule"] = None
+
+@dataclasses.dataclass(slots=True)
+class VestingSchedule:
+    """
+    VestingSchedule
+    """
+    initial_release_timestamp_millis: int
+    locked_amounts: typing.Optional[typing.List[int]] = None
+
+@dataclasses.dataclass(slots=True)
+class JsonEraReport:
+    """
+    Equivocation and reward information to be included in the terminal block.
+    """
+    equivocators: typing.List[str]
+    inactive_validators: typing.List[str]
+    rewards: typing.List["Reward"]
+
+@dataclasses.dataclass(slots=True)
+class ValidatorWeight:
+    """
+    ValidatorWeight
+    """
+    validator: str
+    weight: int
+
+@dataclasses.dataclass(slots=True)
+class JsonBid:
+    """
+    An entry in a founding validator map representing a bid.
+    """
+    bonding_purse: keys.Key
+    """The purse that was used for bonding."""
+    delegation_rate: int
+    """The delegation rate."""
+    delegators: typing.List["JsonDelegator"]
+    """The delegators."""
+    inactive: bool
+    """Is this an inactive validator."""
+    staked_amount: int
+    """The amount of tokens staked by a validator (not including delegators)."""
+
+@dataclasses.dataclass(slots=True)
+class JsonValidatorWeights:
+    """
+    A validator's weight.
+    """
+    public_key: str
+    weight: int
+
+NamedArg = typing.Tuple[str, "CLValue"]
+"""
+Named arguments to a contract.
+"""
+
+@dataclasses.dataclass(slots=True)
+class ExecutionEffect:
+    """
+    The effect of executing a single deploy.
+    """
+    operations: typing.List["Operation"]
+    """The resulting operations."""
+    transforms: typing.List["TransformEntry"]
+    """The resulting transformations."""
+
+@dataclasses.dataclass(slots=True)
+class CLTypeResult:
+    """
+    CLTypeResult
+    """
+    err: "CLType"
+    ok: "CLType"
+
+@dataclasses.dataclass(slots=True)
+class CLTypeMap:
+    """
+    CLTypeMap
+    """
+    key: "CLType"
+    value: "CLType"
+
+@dataclasses.dataclass(slots=True)
+class EntryPointAccess:
+    """
+    Enum describing the possible access control options for a contract entry point (method).
+    """
+    kind: str
+    """Public, Groups."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+@dataclasses.dataclass(slots=True)
+class Parameter:
+    """
+    Parameter to a method
+    """
+    cl_type: "CLType"
+    name: str
+
+@dataclasses.dataclass(slots=True)
+class SeigniorageAllocationValidator:
+    """
+    SeigniorageAllocationValidator
+    """
+    amount: int
+    """Allocated amount"""
+    validator_public_key: str
+    """Validator's public key"""
+
+@dataclasses.dataclass(slots=True)
+class SeigniorageAllocationDelegator:
+    """
+    SeigniorageAllocationDelegator
+    """
+    amount: int
+    """Allocated amount"""
+    delegator_public_key: str
+    """Delegator's public key"""
+    validator_public_key: str
+    """Validator's public key"""
+
+@dataclasses.dataclass(slots=True)
+class Reward:
+    """
+    Reward
+    """
+    amount: int
+    validator: str
+
+@dataclasses.dataclass(slots=True)
+class JsonDelegator:
+    """
+    A delegator associated with the given validator.
+    """
+    bonding_purse: keys.Key
+    delegatee: str
+    public_key: str
+    staked_amount: int
+
+@dataclasses.dataclass(slots=True)
+class Operation:
+    """
+    An operation performed while executing a deploy.
+    """
+    key: keys.Key
+    """The formatted string of the `Key`."""
+    kind: str
+    """The type of operation."""
+
+@dataclasses.dataclass(slots=True)
+class TransformEntry:
+    """
+    A transformation performed while executing a deploy.
+    """
+    key: keys.Key
+    """The formatted string of the `Key`."""
+    transform: "Transform"
+    """The transformation."""
+
+@dataclasses.dataclass(slots=True)
+class Transform:
+    """
+    The actual transformation performed while executing a deploy.
+    """
+    kind: str
+    """Identity, WriteContractWasm, WriteContract, WriteContractPackage, WriteCLValue, WriteAccount, WriteDeployInfo, WriteEraInfo, WriteTransfer, WriteBid, WriteWithdraw, AddInt32, AddUInt64, AddUInt128, AddUInt256, AddUInt512, AddKeys, Failure."""
+    value: typing.Any
+    """Model of the variant, None for the variants without data."""
+
+def parse_account_put_deploy_result(d: dict) -> "AccountPutDeployResult":
+    return AccountPutDeployResult(
+        api_version=d["api_version"],
+        deploy_hash=Digest.from_hex(d["deploy_hash"]),
+    )
+
+def parse_info_get_deploy_result(d: dict) -> "InfoGetDeployResult":
+    return InfoGetDeployResult(
+        api_version=d["api_version"],
+        deploy=parse_deploy(d["deploy"]),
+        execution_results=[parse_json_execution_result(x0) for x0 in d["execution_results"]],
+    )
+
+def parse_state_get_account_info_result(d: dict) -> "StateGetAccountInfoResult":
+    return StateGetAccountInfoResult(
+        account=parse_account(d["account"]),
+        api_version=d["api_version"],
+        merkle_proof=d["merkle_proof"],
+    )
+
+def parse_state_get_dictionary_item_result(d: dict) -> "StateGetDictionaryItemResult":
+    return StateGetDictionaryItemResult(
+        api_version=d["api_version"],
+        dictionary_key=d["dictionary_key"],
+        merkle_proof=d["merkle_proof"],
+        stored_value=parse_stored_value(d["stored_value"]),
+    )
+
+def parse_query_global_state_result(d: dict) -> "QueryGlobalStateResult":
+    v_block_header = d.get("block_header")
+    return QueryGlobalStateResult(
+        api_version=d["api_version"],
+        block_header=None if v_block_header is None else parse_json_block_header(v_block_header),
+        merkle_proof=d["merkle_proof"],
+        stored_value=parse_stored_value(d["stored_value"]),
+    )
+
+def parse_info_get_peers_result(d: dict) -> "InfoGetPeersResult":
+    return InfoGetPeersResult(
+        api_version=d["api_version"],
+        peers=[parse_peer_entry(x0) for x0 in d["peers"]],
+    )
+
+def parse_info_get_status_result(d: dict) -> "InfoGetStatusResult":
+    v_last_added_block_info = d.get("last_added_block_info")
+    v_next_upgrade = d.get("next_upgrade")
+    return InfoGetStatusResult(
+        api_version=d["api_version"],
+        build_version=d["build_version"],
+        chainspec_name=d["chainspec_name"],
+        last_added_block_info=None if v_last_added_block_info is None else parse_minimal_block_info(v_last_added_block_info),
+        next_upgrade=None if v_next_upgrade is None else parse_next_upgrade(v_next_upgrade),
+        our_public_signing_key=d.get("our_public_signing_key"),
+        peers=[parse_peer_entry(x0) for x0 in d["peers"]],
+        round_length=d.get("round_length"),
+        starting_state_root_hash=Digest.from_hex(d["starting_state_root_hash"]),
+        uptime=d["uptime"],
+    )
+
+def parse_info_get_validator_changes_result(d: dict) -> "InfoGetValidatorChangesResult":
+    return InfoGetValidatorChangesResult(
+        api_version=d["api_version"],
+        changes=[parse_json_validator_changes(x0) for x0 in d["changes"]],
+    )
+
+def parse_chain_get_block_result(d: dict) -> "ChainGetBlockResult":
+    v_block = d.get("block")
+    return ChainGetBlockResult(
+        api_version=d["api_version"],
+        block=None if v_block is None else parse_json_block(v_block),
+    )
+
+def parse_chain_get_block_transfers_result(d: dict) -> "ChainGetBlockTransfersResult":
+    v_block_hash = d.get("block_hash")
+    v_transfers = d.get("transfers")
+    return ChainGetBlockTransfersResult(
+        api_version=d["api_version"],
+        block_hash=None if v_block_hash is None else Digest.from_hex(v_block_hash),
+        transfers=None if v_transfers is None else [parse_transfer(x0) for x0 in v_transfers],
+    )
+
+def parse_chain_get_state_root_hash_result(d: dict) -> "ChainGetStateRootHashResult":
+    v_state_root_hash = d.get("state_root_hash")
+    return ChainGetStateRootHashResult(
+        api_version=d["api_version"],
+        state_root_hash=None if v_state_root_hash is None else Digest.from_hex(v_state_root_hash),
+    )
+
+def parse_state_get_item_result(d: dict) -> "StateGetItemResult":
+    return StateGetItemResult(
+        api_version=d["api_version"],
+        merkle_proof=d["merkle_proof"],
+        stored_value=parse_stored_value(d["stored_value"]),
+    )
+
+def parse_state_get_balance_result(d: dict) -> "StateGetBalanceResult":
+    return StateGetBalanceResult(
+        api_version=d["api_version"],
+        balance_value=int(d["balance_value"]),
+        merkle_proof=d["merkle_proof"],
+    )
+
+def parse_chain_get_era_info_by_switch_block_result(d: dict) -> "ChainGetEraInfoBySwitchBlockResult":
+    v_era_summary = d.get("era_summary")
+    return ChainGetEraInfoBySwitchBlockResult(
+        api_version=d["api_version"],
+        era_summary=None if v_era_summary is None else parse_era_summary(v_era_summary),
+    )
+
+def parse_state_get_auction_info_result(d: dict) -> "StateGetAuctionInfoResult":
+    return StateGetAuctionInfoResult(
+        api_version=d["api_version"],
+        auction_state=parse_auction_state(d["auction_state"]),
+    )
+
+def parse_deploy(d: dict) -> "Deploy":
+    return Deploy(
+        approvals=[parse_approval(x0) for x0 in d["approvals"]],
+        hash=Digest.from_hex(d["hash"]),
+        header=parse_deploy_header(d["header"]),
+        payment=parse_executable_deploy_item(d["payment"]),
+        session=parse_executable_deploy_item(d["session"]),
+    )
+
+def parse_json_execution_result(d: dict) -> "JsonExecutionResult":
+    return JsonExecutionResult(
+        block_hash=Digest.from_hex(d["block_hash"]),
+        result=parse_execution_result(d["result"]),
+    )
+
+def parse_account(d: dict) -> "Account":
+    return Account(
+        account_hash=keys.from_string(d["account_hash"]),
+        action_thresholds=parse_action_thresholds(d["action_thresholds"]),
+        associated_keys=[parse_associated_key(x0) for x0 in d["associated_keys"]],
+        main_purse=keys.from_string(d["main_purse"]),
+        named_keys=[parse_named_key(x0) for x0 in d["named_keys"]],
+    )
+
+def parse_stored_value(d: typing.Any) -> "StoredValue":
+    (kind, value), = d.items()
+    if kind == "CLValue":
+        return StoredValue("CLValue", parse_cl_value(value))
+    if kind == "Account":
+        return StoredValue("Account", parse_account(value))
+    if kind == "Contract":
+        return StoredValue("Contract", parse_contract(value))
+    if kind == "ContractPackage":
+        return StoredValue("ContractPackage", parse_contract_package(value))
+    if kind == "Transfer":
+        return StoredValue("Transfer", parse_transfer(value))
+    if kind == "DeployInfo":
+        return StoredValue("DeployInfo", parse_deploy_info(value))
+    if kind == "EraInfo":
+        return StoredValue("EraInfo", parse_era_info(value))
+    if kind == "Bid":
+        return StoredValue("Bid", parse_bid(value))
+    if kind == "Withdraw":
+        return StoredValue("Withdraw", [parse_unbonding_purse(x0) for x0 in value])
+    return StoredValue(intern(kind), value)
+
+def parse_json_block_header(d: dict) -> "JsonBlockHeader":
+    v_era_end = d.get("era_end")
+    return JsonBlockHeader(
+        accumulated_seed=Digest.from_hex(d["accumulated_seed"]),
+        body_hash=Digest.from_hex(d["body_hash"]),
+        era_end=None if v_era_end is None else parse_json_era_end(v_era_end),
+        era_id=d["era_id"],
+        height=d["height"],
+        parent_hash=Digest.from_hex(d["parent_hash"]),
+        protocol_version=d["protocol_version"],
+        random_bit=d["random_bit"],
+        state_root_hash=Digest.from_hex(d["state_root_hash"]),
+        timestamp=d["timestamp"],
+    )
+
+def parse_peer_entry(d: dict) -> "PeerEntry":
+    return PeerEntry(
+        address=d["address"],
+        node_id=d["node_id"],
+    )
+
+def parse_minimal_block_info(d: dict) -> "MinimalBlockInfo":
+    return MinimalBlockInfo(
+        creator=d["creator"],
+        era_id=d["era_id"],
+        hash=Digest.from_hex(d["hash"]),
+        height=d["height"],
+        state_root_hash=Digest.from_hex(d["state_root_hash"]),
+        timestamp=d["timestamp"],
+    )
+
+def parse_next_upgrade(d: dict) -> "NextUpgrade":
+    return NextUpgrade(
+        activation_point=d["activation_point"],
+        protocol_version=d["protocol_version"],
+    )
+
+def parse_json_validator_changes(d: dict) -> "JsonValidatorChanges":
+    return JsonValidatorChanges(
+        public_key=d["public_key"],
+        status_changes=[parse_json_validator_status_change(x0) for x0 in d["status_changes"]],
+    )
+
+def parse_json_block(d: dict) -> "JsonBlock":
+    return JsonBlock(
+        body=parse_json_block_body(d["body"]),
+        hash=Digest.from_hex(d["hash"]),
+        header=parse_json_block_header(d["header"]),
+        proofs=[parse_json_proof(x0) for x0 in d["proofs"]],
+    )
+
+def parse_transfer(d: dict) -> "Transfer":
+    v_to = d.get("to")
+    return Transfer(
+        amount=int(d["amount"]),
+        deploy_hash=Digest.from_hex(d["deploy_hash"]),
+        from_=keys.from_string(d["from"]),
+        gas=int(d["gas"]),
+        id=d.get("id"),
+        source=keys.from_string(d["source"]),
+        target=keys.from_string(d["target"]),
+        to=None if v_to is None else keys.from_string(v_to),
+    )
+
+def parse_era_summary(d: dict) -> "EraSummary":
+    return EraSummary(
+        block_hash=Digest.from_hex(d["block_hash"]),
+        era_id=d["era_id"],
+        merkle_proof=d["merkle_proof"],
+        state_root_hash=Digest.from_hex(d["state_root_hash"]),
+        stored_value=parse_stored_value(d["stored_value"]),
+    )
+
+def parse_auction_state(d: dict) -> "AuctionState":
+    return AuctionState(
+        bids=[parse_json_bids(x0) for x0 in d["bids"]],
+        block_height=d["block_height"],
+        era_validators=[parse_json_era_validators(x0) for x0 in d["era_validators"]],
+        state_root_hash=Digest.from_hex(d["state_root_hash"]),
+    )
+
+def parse_approval(d: dict) -> "Approval":
+    return Approval(
+        signature=d["signature"],
+        signer=d["signer"],
+    )
+
+def parse_deploy_header(d: dict) -> "DeployHeader":
+    return DeployHeader(
+        account=d["account"],
+        body_hash=Digest.from_hex(d["body_hash"]),
+        chain_name=d["chain_name"],
+        dependencies=[Digest.from_hex(x0) for x0 in d["dependencies"]],
+        gas_price=d["gas_price"],
+        timestamp=d["timestamp"],
+        ttl=d["ttl"],
+    )
+
+def parse_executable_deploy_item(d: typing.Any) -> "ExecutableDeployItem":
+    (kind, value), = d.items()
+    if kind == "ModuleBytes":
+        return ExecutableDeployItem("ModuleBytes", parse_executable_deploy_item_module_bytes(value))
+    if kind == "StoredContractByHash":
+        return ExecutableDeployItem("StoredContractByHash", parse_executable_deploy_item_stored_contract_by_hash(value))
+    if kind == "StoredContractByName":
+        return ExecutableDeployItem("StoredContractByName", parse_executable_deploy_item_stored_contract_by_name(value))
+    if kind == "StoredVersionedContractByHash":
+        return ExecutableDeployItem("StoredVersionedContractByHash", parse_executable_deploy_item_stored_versioned_contract_by_hash(value))
+    if kind == "StoredVersionedContractByName":
+        return ExecutableDeployItem("StoredVersionedContractByName", parse_executable_deploy_item_stored_versioned_contract_by_name(value))
+    if kind == "Transfer":
+        return ExecutableDeployItem("Transfer", parse_executable_deploy_item_transfer(value))
+    return ExecutableDeployItem(intern(kind), value)
+
+def parse_execution_result(d: typing.Any) -> "ExecutionResult":
+    (kind, value), = d.items()
+    if kind == "Failure":
+        return ExecutionResult("Failure", parse_execution_result_failure(value))
+    if kind == "Success":
+        return ExecutionResult("Success", parse_execution_result_success(value))
+    return ExecutionResult(intern(kind), value)
+
+def parse_action_thresholds(d: dict) -> "ActionThresholds":
+    return ActionThresholds(
+        deployment=d["deployment"],
+        key_management=d["key_management"],
+    )
+
+def parse_associated_key(d: dict) -> "AssociatedKey":
+    return AssociatedKey(
+        account_hash=keys.from_string(d["account_hash"]),
+        weight=d["weight"],
+    )
+
+def parse_named_key(d: dict) -> "NamedKey":
+    return NamedKey(
+        key=keys.from_string(d["key"]),
+        name=d["name"],
+    )
+
+def parse_cl_value(d: dict) -> "CLValue":
+    return CLValue(
+        bytes=d["bytes"],
+        cl_type=parse_cl_type(d["cl_type"]),
+        parsed=d.get("parsed"),
+    )
+
+def parse_contract(d: dict) -> "Contract":
+    return Contract(
+        contract_package_hash=d["contract_package_hash"],
+        contract_wasm_hash=d["contract_wasm_hash"],
+        entry_points=[parse_entry_point(x0) for x0 in d["entry_points"]],
+        named_keys=[parse_named_key(x0) for x0 in d["named_keys"]],
+        protocol_version=d["protocol_version"],
+    )
+
+def parse_contract_package(d: dict) -> "ContractPackage":
+    return ContractPackage(
+        access_key=keys.from_string(d["access_key"]),
+        disabled_versions=[parse_disabled_version(x0) for x0 in d["disabled_versions"]],
+        groups=[parse_groups(x0) for x0 in d["groups"]],
+        versions=[parse_contract_version(x0) for x0 in d["versions"]],
+    )
+
+def parse_deploy_info(d: dict) -> "DeployInfo":
+    return DeployInfo(
+        deploy_hash=Digest.from_hex(d["deploy_hash"]),
+        from_=keys.from_string(d["from"]),
+        gas=int(d["gas"]),
+        source=keys.from_string(d["source"]),
+        transfers=[keys.from_string(x0) for x0 in d["transfers"]],
+    )
+
+def parse_era_info(d: dict) -> "EraInfo":
+    return EraInfo(
+        seigniorage_allocations=[parse_seigniorage_allocation(x0) for x0 in d["seigniorage_allocations"]],
+    )
+
+def parse_bid(d: dict) -> "Bid":
+    v_vesting_schedule = d.get("vesting_schedule")
+    return Bid(
+        bonding_purse=keys.from_string(d["bonding_purse"]),
+        delegation_rate=d["delegation_rate"],
+        delegators={k0: parse_delegator(v0) for k0, v0 in d["delegators"].items()},
+        inactive=d["inactive"],
+        staked_amount=int(d["staked_amount"]),
+        validator_public_key=d["validator_public_key"],
+        vesting_schedule=None if v_vesting_schedule is None else parse_vesting_schedule(v_vesting_schedule),
+    )
+
+def parse_unbonding_purse(d: dict) -> "UnbondingPurse":
+    return UnbondingPurse(
+        amount=int(d["amount"]),
+        bonding_purse=keys.from_string(d["bonding_purse"]),
+        era_of_creation=d["era_of_creation"],
+        unbonder_public_key=d["unbonder_public_key"],
+        validator_public_key=d["validator_public_key"],
+    )
+
+def parse_json_era_end(d: dict) -> "JsonEraEnd":
+    return JsonEraEnd(
+        era_report=parse_json_era_report(d["era_report"]),
+        next_era_validator_weights=[parse_validator_weight(x0) for x0 in d["next_era_validator_weights"]],
+    )
+
+def parse_json_validator_status_change(d: dict) -> "JsonValidatorStatusChange":
+    return JsonValidatorStatusChange(
+        era_id=d["era_id"],
+        validator_change=intern(d["validator_change"]),
+    )
+
+def parse_json_block_body(d: dict) -> "JsonBlockBody":
+    return JsonBlockBody(
+        deploy_hashes=[Digest.from_hex(x0) for x0 in d["deploy_hashes"]],
+        proposer=d["proposer"],
+        transfer_hashes=[Digest.from_hex(x0) for x0 in d["transfer_hashes"]],
+    )
+
+def parse_json_proof(d: dict) -> "JsonProof":
+    return JsonProof(
+        public_key=d["public_key"],
+        signature=d["signature"],
+    )
+
+def parse_json_bids(d: dict) -> "JsonBids":
+    return JsonBids(
+        bid=parse_json_bid(d["bid"]),
+        public_key=d["public_key"],
+    )
+
+def parse_json_era_validators(d: dict) -> "JsonEraValidators":
+    return JsonEraValidators(
+        era_id=d["era_id"],
+        validator_weights=[parse_json_validator_weights(x0) for x0 in d["validator_weights"]],
+    )
+
+def parse_executable_deploy_item_module_bytes(d: dict) -> "ExecutableDeployItemModuleBytes":
+    return ExecutableDeployItemModuleBytes(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+        module_bytes=d["module_bytes"],
+    )
+
+def parse_executable_deploy_item_stored_contract_by_hash(d: dict) -> "ExecutableDeployItemStoredContractByHash":
+    return ExecutableDeployItemStoredContractByHash(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+        entry_point=d["entry_point"],
+        hash=d["hash"],
+    )
+
+def parse_executable_deploy_item_stored_contract_by_name(d: dict) -> "ExecutableDeployItemStoredContractByName":
+    return ExecutableDeployItemStoredContractByName(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+        entry_point=d["entry_point"],
+        name=d["name"],
+    )
+
+def parse_executable_deploy_item_stored_versioned_contract_by_hash(d: dict) -> "ExecutableDeployItemStoredVersionedContractByHash":
+    return ExecutableDeployItemStoredVersionedContractByHash(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+        entry_point=d["entry_point"],
+        hash=d["hash"],
+        version=d.get("version"),
+    )
+
+def parse_executable_deploy_item_stored_versioned_contract_by_name(d: dict) -> "ExecutableDeployItemStoredVersionedContractByName":
+    return ExecutableDeployItemStoredVersionedContractByName(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+        entry_point=d["entry_point"],
+        name=d["name"],
+        version=d.get("version"),
+    )
+
+def parse_executable_deploy_item_transfer(d: dict) -> "ExecutableDeployItemTransfer":
+    return ExecutableDeployItemTransfer(
+        args=[parse_named_arg(x0) for x0 in d["args"]],
+    )
+
+def parse_execution_result_failure(d: dict) -> "ExecutionResultFailure":
+    return ExecutionResultFailure(
+        cost=int(d["cost"]),
+        effect=parse_execution_effect(d["effect"]),
+        error_message=d["error_message"],
+        transfers=[keys.from_string(x0) for x0 in d["transfers"]],
+    )
+
+def parse_execution_result_success(d: dict) -> "ExecutionResultSuccess":
+    return ExecutionResultSuccess(
+        cost=int(d["cost"]),
+        effect=parse_execution_effect(d["effect"]),
+        transfers=[keys.from_string(x0) for x0 in d["transfers"]],
+    )
+
+def parse_cl_type(d: typing.Any) -> "CLType":
+    if d.__class__ is str:
+        return CLType(intern(d), None)
+    (kind, value), = d.items()
+    if kind == "Option":
+        return CLType("Option", parse_cl_type(value))
+    if kind == "List":
+        return CLType("List", parse_cl_type(value))
+    if kind == "Result":
+        return CLType("Result", parse_cl_type_result(value))
+    if kind == "Map":
+        return CLType("Map", parse_cl_type_map(value))
+    if kind == "Tuple1":
+        return CLType("Tuple1", [parse_cl_type(x0) for x0 in value])
+    if kind == "Tuple2":
+        return CLType("Tuple2", [parse_cl_type(x0) for x0 in value])
+    if kind == "Tuple3":
+        return CLType("Tuple3", [parse_cl_type(x0) for x0 in value])
+    return CLType(intern(kind), value)
+
+def parse_entry_point(d: dict) -> "EntryPoint":
+    return EntryPoint(
+        access=parse_entry_point_access(d["access"]),
+        args=[parse_parameter(x0) for x0 in d["args"]],
+        entry_point_type=intern(d["entry_point_type"]),
+        name=d["name"],
+        ret=parse_cl_type(d["ret"]),
+    )
+
+def parse_disabled_version(d: dict) -> "DisabledVersion":
+    return DisabledVersion(
+        contract_version=d["contract_version"],
+        protocol_version_major=d["protocol_version_major"],
+    )
+
+def parse_groups(d: dict) -> "Groups":
+    return Groups(
+        group=d["group"],
+        keys=[keys.from_string(x0) for x0 in d["keys"]],
+    )
+
+def parse_contract_version(d: dict) -> "ContractVersion":
+    return ContractVersion(
+        contract_hash=d["contract_hash"],
+        contract_version=d["contract_version"],
+        protocol_version_major=d["protocol_version_major"],
+    )
+
+def parse_seigniorage_allocation(d: typing.Any) -> "SeigniorageAllocation":
+    (kind, value), = d.items()
+    if kind == "Validator":
+        return SeigniorageAllocation("Validator", parse_seigniorage_allocation_validator(value))
+    if kind == "Delegator":
+        return SeigniorageAllocation("Delegator", parse_seigniorage_allocation_delegator(value))
+    return SeigniorageAllocation(intern(kind), value)
+
+def parse_delegator(d: dict) -> "Delegator":
+    v_vesting_schedule = d.get("vesting_schedule")
+    return Delegator(
+        bonding_purse=keys.from_string(d["bonding_purse"]),
+        delegator_public_key=d["delegator_public_key"],
+        staked_amount=int(d["staked_amount"]),
+        validator_public_key=d["validator_public_key"],
+        vesting_schedule=None if v_vesting_schedule is None else parse_vesting_schedule(v_vesting_schedule),
+    )
+
+def parse_vesting_schedule(d: dict) -> "VestingSchedule":
+    v_locked_amounts = d.get("locked_amounts")
+    return VestingSchedule(
+        initial_release_timestamp_millis=d["initial_release_timestamp_millis"],
+        locked_amounts=None if v_locked_amounts is None else [int(x0) for x0 in v_locked_amounts],
+    )
+
+def parse_json_era_report(d: dict) -> "JsonEraReport":
+    return JsonEraReport(
+        equivocators=d["equivocators"],
+        inactive_validators=d["inactive_validators"],
+        rewards=[parse_reward(x0) for x0 in d["rewards"]],
+    )
+
+def parse_validator_weight(d: dict) -> "ValidatorWeight":
+    return ValidatorWeight(
+        validator=d["validator"],
+        weight=int(d["weight"]),
+    )
+
+def parse_json_bid(d: dict) -> "JsonBid":
+    return JsonBid(
+        bonding_purse=keys.from_string(d["bonding_purse"]),
+        delegation_rate=d["delegation_rate"],
+        delegators=[parse_json_delegator(x0) for x0 in d["delegators"]],
+        inactive=d["inactive"],
+        staked_amount=int(d["staked_amount"]),
+    )
+
+def parse_json_validator_weights(d: dict) -> "JsonValidatorWeights":
+    return JsonValidatorWeights(
+        public_key=d["public_key"],
+        weight=int(d["weight"]),
+    )
+
+def parse_named_arg(d: list) -> typing.Tuple[str, "CLValue"]:
+    return (d[0], parse_cl_value(d[1]),)
+
+def parse_execution_effect(d: dict) -> "ExecutionEffect":
+    return ExecutionEffect(
+        operations=[parse_operation(x0) for x0 in d["operations"]],
+        transforms=[parse_transform_entry(x0) for x0 in d["transforms"]],
+    )
+
+def parse_cl_type_result(d: dict) -> "CLTypeResult":
+    return CLTypeResult(
+        err=parse_cl_type(d["err"]),
+        ok=parse_cl_type(d["ok"]),
+    )
+
+def parse_cl_type_map(d: dict) -> "CLTypeMap":
+    return CLTypeMap(
+        key=parse_cl_type(d["key"]),
+        value=parse_cl_type(d["value"]),
+    )
+
+def parse_entry_point_access(d: typing.Any) -> "EntryPointAccess":
+    if d.__class__ is str:
+        return EntryPointAccess(intern(d), None)
+    (kind, value), = d.items()
+    return EntryPointAccess(intern(kind), value)
+
+def parse_parameter(d: dict) -> "Parameter":
+    return Parameter(
+        cl_type=parse_cl_type(d["cl_type"]),
+        name=d["name"],
+    )
+
+def parse_seigniorage_allocation_validator(d: dict) -> "SeigniorageAllocationValidator":
+    return SeigniorageAllocationValidator(
+        amount=int(d["amount"]),
+        validator_public_key=d["validator_public_key"],
+    )
+
+def parse_seigniorage_allocation_delegator(d: dict) -> "SeigniorageAllocationDelegator":
+    return SeigniorageAllocationDelegator(
+        amount=int(d["amount"]),
+        delegator_public_key=d["delegator_public_key"],
+        validator_public_key=d["validator_public_key"],
+    )
+
+def parse_reward(d: dict) -> "Reward":
+    return Reward(
+        amount=d["amount"],
+        validator=d["validator"],
+    )
+
+def parse_json_delegator(d: dict) -> "JsonDelegator":
+    return JsonDelegator(
+        bonding_purse=keys.from_string(d["bonding_purse"]),
+        delegatee=d["delegatee"],
+        public_key=d["public_key"],
+        staked_amount=int(d["staked_amount"]),
+    )
+
+def parse_operation(d: dict) -> "Operation":
+    return Operation(
+        key=keys.from_string(d["key"]),
+        kind=intern(d["kind"]),
+    )
+
+def parse_transform_entry(d: dict) -> "TransformEntry":
+    return TransformEntry(
+        key=keys.from_string(d["key"]),
+        transform=parse_transform(d["transform"]),
+    )
+
+def parse_transform(d: typing.Any) -> "Transform":
+    if d.__class__ is str:
+        return Transform(intern(d), None)
+    (kind, value), = d.items()
+    if kind == "WriteCLValue":
+        return Transform("WriteCLValue", parse_cl_value(value))
+    if kind == "WriteAccount":
+        return Transform("WriteAccount", keys.from_string(value))
+    if kind == "WriteDeployInfo":
+        return Transform("WriteDeployInfo", parse_deploy_info(value))
+    if kind == "WriteEraInfo":
+        return Transform("WriteEraInfo", parse_era_info(value))
+    if kind == "WriteTransfer":
+        return Transform("WriteTransfer", parse_transfer(value))
+    if kind == "WriteBid":
+        return Transform("WriteBid", parse_bid(value))
+    if kind == "WriteWithdraw":
+        return Transform("WriteWithdraw", [parse_unbonding_purse(x0) for x0 in value])
+    if kind == "AddUInt128":
+        return Transform("AddUInt128", int(value))
+    if kind == "AddUInt256":
+        return Transform("AddUInt256", int(value))
+    if kind == "AddUInt512":
+        return Transform("AddUInt512", int(value))
+    if kind == "AddKeys":
+        return Transform("AddKeys", [parse_named_key(x0) for x0 in value])
+    return Transform(intern(kind), value)
+
+RESULT_PARSERS: typing.Dict[str, typing.Callable[[dict], typing.Any]] = {
+    "account_put_deploy": parse_account_put_deploy_result,
+    "info_get_deploy": parse_info_get_deploy_result,
+    "state_get_account_info": parse_state_get_account_info_result,
+    "state_get_dictionary_item": parse_state_get_dictionary_item_result,
+    "query_global_state": parse_query_global_state_result,
+    "info_get_peers": parse_info_get_peers_result,
+    "info_get_status": parse_info_get_status_result,
+    "info_get_validator_changes": parse_info_get_validator_changes_result,
+    "chain_get_block": parse_chain_get_block_result,
+    "chain_get_block_transfers": parse_chain_get_block_transfers_result,
+    "chain_get_state_root_hash": parse_chain_get_state_root_hash_result,
+    "state_get_item": parse_state_get_item_result,
+    "state_get_balance": parse_state_get_balance_result,
+    "chain_get_era_info_by_switch_block": parse_chain_get_era_info_by_switch_block_result,
+    "state_get_auction_info": parse_state_get_auction_info_result,
+}
+"""Parsers of the results, by method name."""
+
+class RPCMethods:
+    """
+    Typed methods of every RPC endpoint of the schema, sending their calls through the send function
+    of a client.
+    """
+    __slots__ = ("send",)
+
+    def __init__(self, send: typing.Callable[[str, dict], dict]) -> None:
+        self.send = send
+
+    def account_put_deploy(self, deploy: deploy_types.Deploy) -> AccountPutDeployResult:
+        """
+        Receives a Deploy to be executed by the network.
+        """
+        return parse_account_put_deploy_result(self.send("account_put_deploy", {"deploy": deploy.to_json()}))
+
+    def info_get_deploy(self, deploy_hash: typing.Union[str, Digest]) -> InfoGetDeployResult:
+        """
+        Returns a Deploy from the network.
+        """
+        return parse_info_get_deploy_result(self.send("info_get_deploy", {"deploy_hash": str(deploy_hash)}))
+
+    def state_get_account_info(self, public_key: str, block_identifier: typing.Optional[dict] = None) -> StateGetAccountInfoResult:
+        """
+        Returns an Account from the network.
+        """
+        params: dict = {"public_key": public_key}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_state_get_account_info_result(self.send("state_get_account_info", params))
+
+    def state_get_dictionary_item(self, state_root_hash: typing.Union[str, Digest], dictionary_identifier: dict) -> StateGetDictionaryItemResult:
+        """
+        Returns an item from a Dictionary.
+        """
+        return parse_state_get_dictionary_item_result(self.send("state_get_dictionary_item", {"state_root_hash": str(state_root_hash), "dictionary_identifier": dictionary_identifier}))
+
+    def query_global_state(self, state_identifier: dict, key: str, path: typing.Optional[typing.List[str]] = None) -> QueryGlobalStateResult:
+        """
+        A query to global state using either a Block hash or state root hash.
+        """
+        params: dict = {"state_identifier": state_identifier, "key": key}
+        if path is not None:
+            params["path"] = path
+        return parse_query_global_state_result(self.send("query_global_state", params))
+
+    def info_get_peers(self) -> InfoGetPeersResult:
+        """
+        Returns a list of peers connected to the node.
+        """
+        return parse_info_get_peers_result(self.send("info_get_peers", {}))
+
+    def info_get_status(self) -> InfoGetStatusResult:
+        """
+        Returns the current status of the node.
+        """
+        return parse_info_get_status_result(self.send("info_get_status", {}))
+
+    def info_get_validator_changes(self) -> InfoGetValidatorChangesResult:
+        """
+        Returns status changes of active validators.
+        """
+        return parse_info_get_validator_changes_result(self.send("info_get_validator_changes", {}))
+
+    def chain_get_block(self, block_identifier: typing.Optional[dict] = None) -> ChainGetBlockResult:
+        """
+        Returns a Block from the network.
+        """
+        params: dict = {}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_chain_get_block_result(self.send("chain_get_block", params))
+
+    def chain_get_block_transfers(self, block_identifier: typing.Optional[dict] = None) -> ChainGetBlockTransfersResult:
+        """
+        Returns all transfers for a Block from the network.
+        """
+        params: dict = {}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_chain_get_block_transfers_result(self.send("chain_get_block_transfers", params))
+
+    def chain_get_state_root_hash(self, block_identifier: typing.Optional[dict] = None) -> ChainGetStateRootHashResult:
+        """
+        Returns a state root hash at a given Block.
+        """
+        params: dict = {}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_chain_get_state_root_hash_result(self.send("chain_get_state_root_hash", params))
+
+    def state_get_item(self, state_root_hash: typing.Union[str, Digest], key: str, path: typing.Optional[typing.List[str]] = None) -> StateGetItemResult:
+        """
+        Returns a stored value from the network. This RPC is deprecated, use `query_global_state`
+        instead..
+        """
+        params: dict = {"state_root_hash": str(state_root_hash), "key": key}
+        if path is not None:
+            params["path"] = path
+        return parse_state_get_item_result(self.send("state_get_item", params))
+
+    def state_get_balance(self, state_root_hash: typing.Union[str, Digest], purse_uref: str) -> StateGetBalanceResult:
+        """
+        Returns a purse's balance from the network.
+        """
+        return parse_state_get_balance_result(self.send("state_get_balance", {"state_root_hash": str(state_root_hash), "purse_uref": purse_uref}))
+
+    def chain_get_era_info_by_switch_block(self, block_identifier: typing.Optional[dict] = None) -> ChainGetEraInfoBySwitchBlockResult:
+        """
+        Returns an EraInfo from the network.
+        """
+        params: dict = {}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_chain_get_era_info_by_switch_block_result(self.send("chain_get_era_info_by_switch_block", params))
+
+    def state_get_auction_info(self, block_identifier: typing.Optional[dict] = None) -> StateGetAuctionInfoResult:
+        """
+        Returns the bids and validators as of either a specific block (by height or hash), or the
+        most recently added block.
+        """
+        params: dict = {}
+        if block_identifier is not None:
+            params["block_identifier"] = block_identifier
+        return parse_state_get_auction_info_result(self.send("state_get_auction_info", params))
@@ -0,0 +1,262 @@
+from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+import bisect
+import contextvars
+import threading
+import time
+import typing
+
+T = typing.TypeVar("T")
+
+@dataclass(slots=True)
+class CallRecord:
+    """
+    Measurements of a JSON RPC call.
+
+    Calls sent as a batch are recorded once, under the method "batch".
+    """
+    method: str
+    request_bytes: int = 0
+    response_bytes: int = 0
+    network_time: float = 0.0
+    """Seconds spent posting the request and reading the response."""
+    decode_time: float = 0.0
+    """Seconds spent decoding the JSON response."""
+    parse_time: float = 0.0
+    """Seconds spent building the typed models of the result, 0 for raw sends."""
+    error: typing.Optional[str] = None
+    """Type name of the error the call failed with."""
+
+    @property
+    def total_time(self) -> float:
+        return self.network_time + self.decode_time + self.parse_time
+
+class Sink(ABC):
+    """
+    Destination of the call records.
+    """
+    @abstractmethod
+    def record(self, call: CallRecord) -> None:
+        """
+        Record a finished call.
+        """
+        pass
+
+class CallbackSink(Sink):
+    """
+    Sink passing each record to a function.
+    """
+    def __init__(self, callback: typing.Callable[[CallRecord], None]) -> None:
+        self.callback = callback
+
+    def record(self, call: CallRecord) -> None:
+        self.callback(call)
+
+TIME_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the time histograms."""
+
+SIZE_BUCKETS = tuple(256 * 4 ** i for i in range(10))
+"""Upper bounds in bytes of the size histograms, 256B to 64MB."""
+
+METRICS = {
+    "request_bytes": SIZE_BUCKETS,
+    "response_bytes": SIZE_BUCKETS,
+    "network_time": TIME_BUCKETS,
+    "decode_time": TIME_BUCKETS,
+    "parse_time": TIME_BUCKETS,
+}
+"""Histogram buckets of the recorded measurements."""
+
+class Histogram:
+    """
+    Counts of observations per bucket, with their sum.
+    """
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: typing.Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        """Observations per bucket, the last one past the highest bound."""
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the quantile by interpolating within its bucket, as Prometheus does.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                low = self.bounds[i - 1] if i else 0.0
+                return low + (self.bounds[i] - low) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+@dataclass
+class MethodStats:
+    """
+    Aggregated records of a method.
+    """
+    calls: int = 0
+    errors: typing.Dict[str, int] = field(default_factory=dict)
+    """Failed calls by error type name."""
+    histograms: typing.Dict[str, Histogram] = field(default_factory=lambda: {name: Histogram(bounds) for name, bounds in METRICS.items()})
+
+class HistogramSink(Sink):
+    """
+    Sink aggregating the records in memory, as histograms per method.
+
+    Example:
+        sink = HistogramSink()
+        client = JRPCClient(host, port, instruments=Instruments([sink]))
+        ...
+        print(sink.quantile("info_get_deploy", "network_time", 0.99))
+        print(sink.to_prometheus())
+    """
+    def __init__(self) -> None:
+        self.methods: typing.Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, call: CallRecord) -> None:
+        with self._lock:
+            stats = self.methods.get(call.method)
+            if stats is None:
+                stats = self.methods[call.method] = MethodStats()
+            stats.calls += 1
+            if call.error is not None:
+                stats.errors[call.error] = stats.errors.get(call.error, 0) + 1
+            histograms = stats.histograms
+            histograms["request_bytes"].observe(call.request_bytes)
+            histograms["response_bytes"].observe(call.response_bytes)
+            histograms["network_time"].observe(call.network_time)
+            histograms["decode_time"].observe(call.decode_time)
+            histograms["parse_time"].observe(call.parse_time)
+
+    def quantile(self, method: str, metric: str, q: float) -> float:
+        """
+        Estimate the quantile of a metric (network_time, response_bytes...) of the method.
+        """
+        with self._lock:
+            return self.methods[method].histograms[metric].quantile(q)
+
+    def to_prometheus(self, prefix: str = "casperpy_rpc") -> str:
+        """
+        Dump the metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            f"# HELP {prefix}_calls_total JSON RPC calls by method.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        with self._lock:
+            methods = sorted(self.methods.items())
+            for method, stats in methods:
+                lines.append(f'{prefix}_calls_total{{method="{method}"}} {stats.calls}')
+            lines += [
+                f"# HELP {prefix}_errors_total Failed JSON RPC calls by method and error.",
+                f"# TYPE {prefix}_errors_total counter",
+            ]
+            for method, stats in methods:
+                for error, count in sorted(stats.errors.items()):
+                    lines.append(f'{prefix}_errors_total{{method="{method}",error="{error}"}} {count}')
+            for metric in METRICS:
+                name = f"{prefix}_{metric.replace('_time', '_seconds')}"
+                lines += [f"# HELP {name} {metric.replace('_', ' ').capitalize()} of the calls.", f"# TYPE {name} histogram"]
+                for method, stats in methods:
+                    histogram = stats.histograms[metric]
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{method="{method}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{method="{method}",le="+Inf"}} {histogram.count}')
+                    lines.append(f'{name}_sum{{method="{method}"}} {histogram.sum}')
+                    lines.append(f'{name}_count{{method="{method}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+_current: contextvars.ContextVar[typing.Optional[CallRecord]] = contextvars.ContextVar("casperpy_call", default=None)
+"""Record of the typed call in progress, filled in by the send it makes."""
+
+class Instruments:
+    """
+    Records the calls of a client into sinks.
+
+    Clients hold None instead of Instruments when not instrumented, so an
+    uninstrumented call only pays for that check.
+    """
+    def __init__(self, sinks: typing.Optional[typing.List[Sink]] = None) -> None:
+        self.sinks: typing.List[Sink] = list(sinks or [])
+
+    def emit(self, call: CallRecord) -> None:
+        """
+        Pass the record of a finished call to the sinks.
+        """
+        for sink in self.sinks:
+            sink.record(call)
+
+    def begin(self, method: str) -> typing.Tuple[CallRecord, bool]:
+        """
+        Get the record of a send: the one of the typed call making it, or a new one.
+
+        Returns whether the record is owned by the send, which then emits it.
+        """
+        call = _current.get()
+        if call is not None and call.method == method:
+            # Taken once, a second send of the typed call gets its own record.
+            _current.set(None)
+            return call, False
+        return CallRecord(method), True
+
+    def call(self, send: typing.Callable[[str, dict], typing.Any], method: str, params: dict, parser: typing.Callable[..., T], *args: typing.Any) -> T:
+        """
+        Send the request and build its result with parser(result, *args), recording the call.
+        """
+        call = CallRecord(method)
+        token = _current.set(call)
+        try:
+            try:
+                res = send(method, params)
+            finally:
+                _current.reset(token)
+            start = time.perf_counter()
+            parsed = parser(res, *args)
+            call.parse_time = time.perf_counter() - start
+            return parsed
+        except Exception as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            self.emit(call)
+
+    async def call_async(self, send: typing.Callable[[str, dict], typing.Awaitable[typing.Any]], method: str, params: dict, parser: typing.Callable[..., T], *args: typing.Any) -> T:
+        """
+        Send the request with the coroutine function and build its result with parser(result, *args), recording the call.
+        """
+        call = CallRecord(method)
+        token = _current.set(call)
+        try:
+            try:
+                res = await send(method, params)
+            finally:
+                _current.reset(token)
+            start = time.perf_counter()
+            parsed = parser(res, *args)
+            call.parse_time = time.perf_counter() - start
+            return parsed
+        except Exception as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            self.emit(call)
@@ -0,0 +1,257 @@
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+import collections
+import contextvars
+import threading
+import time
+import typing
+from .client import BaseClient, JRPCClient
+from .errors import RPCError
+from .constants import CHAIN_GET_BLOCK, CHAIN_GET_BLOCK_TRANSFERS, CHAIN_GET_STATE_ROOT_HASH, STATE_GET_ACCOUNT_INFO, STATE_GET_ITEM, STATE_GET_DICTIONARY_ITEM, QUERY_GLOBAL_STATE, INFO_GET_DEPLOY
+
+IDEMPOTENT_METHODS = frozenset({
+    CHAIN_GET_BLOCK,
+    CHAIN_GET_BLOCK_TRANSFERS,
+    CHAIN_GET_STATE_ROOT_HASH,
+    STATE_GET_ACCOUNT_INFO,
+    STATE_GET_ITEM,
+    STATE_GET_DICTIONARY_ITEM,
+    QUERY_GLOBAL_STATE,
+    INFO_GET_DEPLOY,
+})
+"""Read methods safe to retry on another node."""
+
+@dataclass
+class NodeHealth:
+    """
+    Latency and error tracking of a node.
+    """
+    latency: float = 0.0
+    """Exponentially weighted moving average of the latency, in seconds."""
+    error_rate: float = 0.0
+    """Exponentially weighted moving average of the share of failed requests."""
+    requests: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    down_until: float = 0.0
+    """Monotonic time until which the node is left out of the rotation."""
+    samples: typing.Deque[float] = field(default_factory=lambda: collections.deque(maxlen=256), repr=False)
+    """Latencies of the last answered requests."""
+
+    def percentile(self, q: float) -> typing.Optional[float]:
+        """
+        Get the q-th quantile (0 to 1) of the recent latencies, if enough were sampled.
+        """
+        if len(self.samples) < 10:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def is_up(self, now: float) -> bool:
+        return self.down_until <= now
+
+    @property
+    def score(self) -> float:
+        """
+        Expected cost of sending a request to the node, lower is better.
+        """
+        return self.latency * (1 + 10 * self.error_rate) + self.error_rate
+
+@dataclass
+class MultiNodeClient(BaseClient):
+    """
+    Client spreading requests over a pool of nodes.
+
+    Each request goes to the node with the best latency and error score.
+    Idempotent reads are retried on the next best node when a node fails,
+    and a node failing failure_threshold times in a row is dropped from the
+    rotation for down_time seconds.
+
+    With hedge enabled, an idempotent read not answered within the
+    hedge_percentile latency of its node is also sent to the next best
+    node, and the first valid reply wins. Hedges are paid from a budget
+    earning hedge_budget of a request per request sent, so they add at most
+    that share of load. The losing request is cancelled if it has not
+    started yet; otherwise its reply is discarded. Hedged requests are sent
+    from worker threads, shut down by close().
+    """
+    nodes: typing.List[JRPCClient]
+    max_attempts: int = 3
+    failure_threshold: int = 3
+    down_time: float = 30.0
+    smoothing: float = 0.2
+    """Weight of the last observation in the latency and error rate averages."""
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_delay: float = 0.05
+    """Hedge delay in seconds, used until enough latencies were sampled and as a floor."""
+    hedge_budget: float = 0.1
+    """Maximum share of extra requests sent as hedges."""
+    hedges_sent: int = field(default=0, init=False)
+    hedges_won: int = field(default=0, init=False)
+    _hedge_tokens: float = field(default=1.0, init=False, repr=False)
+    _executor: typing.Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _health: typing.List[NodeHealth] = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._health = [NodeHealth() for _ in self.nodes]
+
+    @classmethod
+    def from_endpoints(cls, endpoints: typing.List[typing.Tuple[str, int]], **kwargs) -> "MultiNodeClient":
+        """
+        Create a MultiNodeClient from (host, port) endpoints.
+        """
+        return cls([JRPCClient(host, port) for host, port in endpoints], **kwargs)
+
+    def health(self, node: JRPCClient) -> NodeHealth:
+        """
+        Get the health tracking of the node.
+        """
+        return self._health[self.nodes.index(node)]
+
+    def ranked_nodes(self) -> typing.List[int]:
+        """
+        Indexes of the nodes by preference: healthy nodes by score, then dropped nodes by recovery time.
+        """
+        now = time.monotonic()
+        with self._lock:
+            up = [i for i, health in enumerate(self._health) if health.is_up(now)]
+            down = [i for i, health in enumerate(self._health) if not health.is_up(now)]
+            up.sort(key=lambda i: self._health[i].score)
+            down.sort(key=lambda i: self._health[i].down_until)
+        return up + down
+
+    def record_success(self, index: int, latency: float) -> None:
+        """
+        Record a request answered by the node.
+        """
+        with self._lock:
+            health = self._health[index]
+            if not health.samples:
+                health.latency = latency
+            else:
+                health.latency += self.smoothing * (latency - health.latency)
+            health.samples.append(latency)
+            health.error_rate -= self.smoothing * health.error_rate
+            health.requests += 1
+            health.consecutive_errors = 0
+            health.down_until = 0.0
+
+    def record_failure(self, index: int) -> None:
+        """
+        Record a request the node failed to answer, dropping it after too many failures in a row.
+        """
+        with self._lock:
+            health = self._health[index]
+            health.error_rate += self.smoothing * (1 - health.error_rate)
+            health.requests += 1
+            health.errors += 1
+            health.consecutive_errors += 1
+            if health.consecutive_errors >= self.failure_threshold:
+                health.down_until = time.monotonic() + self.down_time
+
+    def hedge_delay(self, index: int) -> float:
+        """
+        Time to wait for the node before hedging the request on another node.
+        """
+        with self._lock:
+            delay = self._health[index].percentile(self.hedge_percentile)
+        return max(self.hedge_min_delay, delay or 0.0)
+
+    def _take_hedge_token(self) -> bool:
+        with self._lock:
+            if self._hedge_tokens < 1:
+                return False
+            self._hedge_tokens -= 1
+            self.hedges_sent += 1
+            return True
+
+    def _send_to(self, index: int, method: str, params: dict) -> dict:
+        start = time.monotonic()
+        try:
+            res = self.nodes[index].send(method, params)
+        except RPCError:
+            # The node is up and answered, the error belongs to the request.
+            self.record_success(index, time.monotonic() - start)
+            raise
+        except Exception:
+            self.record_failure(index)
+            raise
+        self.record_success(index, time.monotonic() - start)
+        return res
+
+    def _send_hedged(self, ranked: typing.List[int], method: str, params: dict) -> typing.Tuple[bool, typing.Any, typing.List[int]]:
+        """
+        Race the best node against the next one, returning (answered, result or error, indexes of the nodes tried).
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="casperpy-hedge")
+            executor = self._executor
+        # Each request runs in a copy of the context, carrying the record of the call.
+        primary = executor.submit(contextvars.copy_context().run, self._send_to, ranked[0], method, params)
+        pending: typing.Set[Future] = {primary}
+        tried = ranked[:1]
+        done, _ = wait(pending, timeout=self.hedge_delay(ranked[0]))
+        if not done and self._take_hedge_token():
+            pending.add(executor.submit(contextvars.copy_context().run, self._send_to, ranked[1], method, params))
+            tried = ranked[:2]
+        error: typing.Optional[Exception] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    res = future.result()
+                except RPCError as e:
+                    res = e
+                except Exception as e:
+                    error = e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is not primary:
+                    with self._lock:
+                        self.hedges_won += 1
+                return True, res, tried
+        return False, error, tried
+
+    def send(self, method: str, params: dict) -> dict:
+        """
+        Send a JSON RPC request to the best node, retrying idempotent reads on other nodes.
+        """
+        idempotent = method in IDEMPOTENT_METHODS
+        ranked = self.ranked_nodes()[:self.max_attempts if idempotent else 1]
+        error: typing.Optional[Exception] = None
+        if self.hedge and idempotent and len(ranked) > 1:
+            with self._lock:
+                self._hedge_tokens = min(1.0, self._hedge_tokens + self.hedge_budget)
+            answered, res, tried = self._send_hedged(ranked, method, params)
+            if answered:
+                if isinstance(res, RPCError):
+                    raise res
+                return res
+            error, ranked = res, ranked[len(tried):]
+        for index in ranked:
+            try:
+                return self._send_to(index, method, params)
+            except RPCError:
+                raise
+            except Exception as e:
+                error = e
+        raise error
+
+    def close(self) -> None:
+        """
+        Shut the hedging worker threads down.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "MultiNodeClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,251 @@
+from dataclasses import dataclass, field
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import random
+import threading
+import time
+import typing
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+from .constants import ACCOUNT_PUT_DEPLOY
+from .transport import Transport, TransportError
+
+class Priority(enum.IntEnum):
+    """
+    Lanes of the requests waiting for a node, lower goes first.
+    """
+    HIGH = 0
+    NORMAL = 1
+    BULK = 2
+
+METHOD_PRIORITIES: typing.Dict[str, Priority] = {
+    ACCOUNT_PUT_DEPLOY: Priority.HIGH,
+}
+"""Default lanes of the methods, NORMAL for the others."""
+
+NON_IDEMPOTENT_METHODS = frozenset({ACCOUNT_PUT_DEPLOY})
+"""Methods only retried when they failed before reaching the node."""
+
+_lane: contextvars.ContextVar[typing.Optional[Priority]] = contextvars.ContextVar("casperpy_lane", default=None)
+
+@contextlib.contextmanager
+def lane(priority: Priority) -> typing.Iterator[None]:
+    """
+    Send the requests made within the block, in the current thread, in the lane.
+
+    Example:
+        with lane(Priority.BULK):
+            backfill(client)
+    """
+    token = _lane.set(priority)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+class TokenBucket:
+    """
+    Thread safe token bucket, refilled with rate tokens per second up to burst tokens.
+
+    Waiters are served by priority, then in arrival order: a request of a
+    higher lane takes the next token even if lower ones waited longer.
+    """
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: typing.List[typing.Tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: Priority = Priority.NORMAL) -> float:
+        """
+        Take a token, waiting for it if needed. Returns the seconds waited.
+        """
+        with self._cond:
+            start = time.monotonic()
+            ticket = (int(priority), next(self._arrivals))
+            heapq.heappush(self._waiters, ticket)
+            # A new head must recompute its wait, a new waiter may have taken its place.
+            self._cond.notify_all()
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] != ticket:
+                        self._cond.wait()
+                    elif self.tokens >= 1:
+                        self.tokens -= 1
+                        return now - start
+                    else:
+                        self._cond.wait((1 - self.tokens) / self.rate)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every waiter for seconds, as when the node throttles the client.
+        """
+        with self._cond:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+            self._cond.notify_all()
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for the failures of the transport.
+
+    The n-th retry waits a random delay up to base_delay * 2 ** n, capped at
+    max_delay. Error replies of the node are not retried: it answered, and
+    would answer the same.
+
+    Requests of non_idempotent methods are only retried when they were not
+    sent: connection failures and throttling. After a timeout or a server
+    error the node may have processed them, the caller has to check, as
+    DeploySubmitter does for deploys.
+    """
+    max_attempts: int = 5
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    retry_statuses: typing.FrozenSet[int] = frozenset({429, 502, 503, 504})
+    """HTTP statuses worth retrying."""
+    throttle_statuses: typing.FrozenSet[int] = frozenset({429, 503})
+    """HTTP statuses pausing every request to the node for the backoff delay."""
+    non_idempotent: typing.FrozenSet[str] = NON_IDEMPOTENT_METHODS
+
+    def is_idempotent(self, methods: typing.Iterable[str]) -> bool:
+        return not any(method in self.non_idempotent for method in methods)
+
+    def is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        if not idempotent:
+            return self.is_unsent(error)
+        if isinstance(error, TransportError):
+            return error.status in self.retry_statuses
+        return isinstance(error, (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout))
+
+    def is_unsent(self, error: Exception) -> bool:
+        """
+        Whether the request failed before the node could process it.
+        """
+        if isinstance(error, TransportError):
+            return error.status == 429
+        if isinstance(error, (requests.ConnectTimeout, ConnectionRefusedError)):
+            return True
+        if isinstance(error, requests.ConnectionError) and error.args:
+            # Connection failures of urllib3 are wrapped in a MaxRetryError.
+            return isinstance(getattr(error.args[0], "reason", None), ConnectTimeoutError)
+        return False
+
+    def is_throttled(self, error: Exception) -> bool:
+        return isinstance(error, TransportError) and error.status in self.throttle_statuses
+
+    def delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before the retry following the attempt, counted from 0.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+@dataclass
+class SchedulerStats:
+    """
+    Counters of the requests sent through a scheduler.
+    """
+    requests: int = 0
+    """Attempts sent to the nodes, retries included."""
+    retries: int = 0
+    throttled: int = 0
+    """Failures telling the client to slow down."""
+    wait_time: float = 0.0
+    """Seconds spent waiting for the rate limit, summed over the requests."""
+
+@dataclass
+class Scheduler:
+    """
+    Rate limits, prioritizes and retries the requests of clients.
+
+    Each node gets its own token bucket of rate requests per second with
+    bursts of burst requests. Requests waiting for a token are served by
+    lane: account_put_deploy is sent in the HIGH lane, so deploys are not
+    stuck behind bulk reads, which can be put in the BULK lane with
+    lane(Priority.BULK). Transport failures are retried with backoff per
+    retry; on a throttling status the backoff pauses the bucket of the node,
+    holding back its other requests too.
+
+    A scheduler can be shared by the clients of several nodes, each node is
+    limited separately.
+
+    Example:
+        scheduler = Scheduler(rate=20, burst=40)
+        client = JRPCClient(host, port, scheduler=scheduler)
+    """
+    rate: float = 10.0
+    """Requests per second allowed per node."""
+    burst: int = 20
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    priorities: typing.Dict[str, Priority] = field(default_factory=lambda: dict(METHOD_PRIORITIES))
+    """Lanes of the methods, NORMAL for the others."""
+    stats: SchedulerStats = field(default_factory=SchedulerStats, init=False)
+    _buckets: typing.Dict[str, TokenBucket] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Get the token bucket of the node at the url.
+        """
+        with self._lock:
+            bucket = self._buckets.get(url)
+            if bucket is None:
+                bucket = self._buckets[url] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def priority_of(self, *methods: str) -> Priority:
+        """
+        Get the lane of a request calling the methods: the one set with lane(), else the highest of the methods.
+        """
+        priority = _lane.get()
+        if priority is not None:
+            return priority
+        return min((self.priorities.get(method, Priority.NORMAL) for method in methods), default=Priority.NORMAL)
+
+    def post(self, transport: Transport, url: str, body: bytes, methods: typing.Sequence[str] = ()) -> bytes:
+        """
+        Post the body of a request calling the methods through the transport once the rate limit of the node allows, retrying its failures.
+        """
+        bucket = self.bucket(url)
+        priority = self.priority_of(*methods)
+        idempotent = self.retry.is_idempotent(methods)
+        attempt = 0
+        while True:
+            waited = bucket.acquire(priority)
+            with self._lock:
+                self.stats.requests += 1
+                self.stats.wait_time += waited
+            try:
+                return transport.post(url, body)
+            except Exception as e:
+                if attempt + 1 >= self.retry.max_attempts or not self.retry.is_retryable(e, idempotent):
+                    raise
+                delay = self.retry.delay(attempt)
+                throttled = self.retry.is_throttled(e)
+                with self._lock:
+                    self.stats.retries += 1
+                    self.stats.throttled += throttled
+            if throttled:
+                # The next acquire waits for the pause.
+                bucket.pause(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
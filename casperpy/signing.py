@@ -0,0 +1,77 @@
+import dataclasses
+import typing
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+import casperpy.types.cl_values as cl_values
+import casperpy.types.crypto as crypto_types
+
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+@dataclasses.dataclass(frozen=True)
+class PrivateKey:
+    """
+    Secret key of an account, signing deploys with Ed25519 or secp256k1.
+
+    Only the raw secret bytes are held, so keys can be pickled to worker processes.
+    """
+    algo: crypto_types.KeyAlgorithm
+    secret: bytes = dataclasses.field(repr=False)
+    """32 bytes raw secret key."""
+
+    @classmethod
+    def from_pem(cls, pem: typing.Union[str, bytes]) -> "PrivateKey":
+        """
+        Create a PrivateKey from the content of a secret_key.pem file.
+        """
+        if isinstance(pem, str):
+            pem = pem.encode("ascii")
+        key = serialization.load_pem_private_key(pem, password=None)
+        if isinstance(key, ed25519.Ed25519PrivateKey):
+            secret = key.private_bytes(serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption())
+            return cls(crypto_types.KeyAlgorithm.ED25519, secret)
+        elif isinstance(key, ec.EllipticCurvePrivateKey) and isinstance(key.curve, ec.SECP256K1):
+            return cls(crypto_types.KeyAlgorithm.SECP256K1, key.private_numbers().private_value.to_bytes(32, "big"))
+        raise ValueError(f"Unsupported key type: {type(key).__name__}")
+
+    @classmethod
+    def generate(cls, algo: crypto_types.KeyAlgorithm = crypto_types.KeyAlgorithm.ED25519) -> "PrivateKey":
+        """
+        Generate a new random key.
+        """
+        if algo == crypto_types.KeyAlgorithm.ED25519:
+            key = ed25519.Ed25519PrivateKey.generate()
+            return cls(algo, key.private_bytes(serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption()))
+        key = ec.generate_private_key(ec.SECP256K1())
+        return cls(algo, key.private_numbers().private_value.to_bytes(32, "big"))
+
+    def _key(self) -> typing.Union[ed25519.Ed25519PrivateKey, ec.EllipticCurvePrivateKey]:
+        if self.algo == crypto_types.KeyAlgorithm.ED25519:
+            return ed25519.Ed25519PrivateKey.from_private_bytes(self.secret)
+        return ec.derive_private_key(int.from_bytes(self.secret, "big"), ec.SECP256K1())
+
+    @property
+    def public_key(self) -> cl_values.CL_PublicKey:
+        """
+        The public key: 32 raw bytes for Ed25519, 33 compressed bytes for secp256k1.
+        """
+        public = self._key().public_key()
+        if self.algo == crypto_types.KeyAlgorithm.ED25519:
+            value = public.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        else:
+            value = public.public_bytes(serialization.Encoding.X962, serialization.PublicFormat.CompressedPoint)
+        return cl_values.CL_PublicKey(value, self.algo)
+
+    def sign(self, message: bytes) -> bytes:
+        """
+        Sign the message, returning the 64 bytes signature without its algorithm tag.
+        """
+        key = self._key()
+        if self.algo == crypto_types.KeyAlgorithm.ED25519:
+            return key.sign(message)
+        r, s = decode_dss_signature(key.sign(message, ec.ECDSA(hashes.SHA256())))
+        # Normalize to the low-s form expected by verifiers.
+        s = min(s, SECP256K1_ORDER - s)
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+import typing
+from .client import Client
+from .errors import RPCError, VALUE_NOT_FOUND
+from .generated import StoredValue
+import casperpy.types.keys as keys
+
+Path = typing.Union[str, typing.Sequence[str]]
+"""A key followed by the names to walk from it, as "hash-.../balances/<account>" or a sequence."""
+
+_Walk = typing.Tuple[str, ...]
+
+def path_components(path: Path) -> _Walk:
+    """
+    Split a path into its key and the names following it.
+    """
+    components = tuple(path.split("/")) if isinstance(path, str) else tuple(path)
+    if not components or not components[0]:
+        raise ValueError(f"Empty global state path: {path!r}")
+    return components
+
+@dataclass
+class StateReader:
+    """
+    Reads many global state paths at one state root hash.
+
+    The state root hash is pinned on the first read, so every value comes
+    from the same state. Paths are walked on the client, level by level: each
+    step follows a named key of the Account or Contract reached so far, and a
+    URef followed by a name is read as an item of the dictionary it seeds,
+    as contracts keep their balances. A value shared by several paths, like
+    the contract of "hash-.../balances/<account>", is fetched once, and the
+    lookups of a level are sent concurrently on max_workers threads.
+
+    Values are cached for the life of the reader, the state at a root never
+    changes. Only a "value not found" error of the node reads as None, other
+    errors are raised.
+
+    Example:
+        reader = StateReader(client)
+        balances = reader.read_many([f"{contract}/balances/{account}" for account in accounts])
+    """
+    client: Client
+    state_root_hash: typing.Optional[str] = None
+    """State root hash the paths are read at, the latest one when first needed if None."""
+    max_workers: int = 16
+    _values: typing.Dict[keys.Key, typing.Optional[StoredValue]] = field(default_factory=dict, init=False, repr=False)
+    """Values by key, None if the key holds nothing."""
+    _items: typing.Dict[typing.Tuple[keys.Key, str], typing.Optional[keys.Key]] = field(default_factory=dict, init=False, repr=False)
+    """Keys of the dictionary items by seed URef and item name, None if missing."""
+    _named_keys: typing.Dict[keys.Key, typing.Dict[str, keys.Key]] = field(default_factory=dict, init=False, repr=False)
+
+    def pin(self) -> str:
+        """
+        Get the state root hash the paths are read at, fetching the latest one if not pinned yet.
+        """
+        if self.state_root_hash is None:
+            self.state_root_hash = str(self.client.chain_get_state_root_hash().state_root_hash)
+        return self.state_root_hash
+
+    def read(self, path: Path) -> typing.Optional[StoredValue]:
+        """
+        Read the value at the path, None if the path leads nowhere.
+        """
+        return self.read_many([path])[path if isinstance(path, str) else tuple(path)]
+
+    def read_many(self, paths: typing.Iterable[Path]) -> typing.Dict[typing.Union[str, _Walk], typing.Optional[StoredValue]]:
+        """
+        Read the values at the paths, None for the paths leading nowhere.
+
+        Results are keyed by path, sequences being turned into tuples.
+        """
+        walks = {path if isinstance(path, str) else tuple(path): path_components(path) for path in paths}
+        if not walks:
+            return {}
+        self.pin()
+        resolved: typing.Dict[_Walk, typing.Optional[keys.Key]] = {walk[:1]: keys.from_string(walk[0]) for walk in walks.values()}
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="casperpy-state") as executor:
+            depth = 1
+            while True:
+                steps = {walk[:depth + 1] for walk in walks.values() if len(walk) > depth and resolved[walk[:depth]] is not None}
+                if not steps:
+                    break
+                parents = {resolved[step[:-1]] for step in steps}
+                self._fetch_values(executor, {key for key in parents if not isinstance(key, keys.URef)})
+                self._fetch_items(executor, {(resolved[step[:-1]], step[-1]) for step in steps if isinstance(resolved[step[:-1]], keys.URef)})
+                for step in steps:
+                    parent = resolved[step[:-1]]
+                    if isinstance(parent, keys.URef):
+                        resolved[step] = self._items[parent, step[-1]]
+                    else:
+                        resolved[step] = self._named_key(parent, step[-1])
+                depth += 1
+            # A walk stopped at a missing prefix has no key.
+            ends = {path: resolved.get(walk) for path, walk in walks.items()}
+            self._fetch_values(executor, {key for key in ends.values() if key is not None})
+        return {path: None if key is None else self._values[key] for path, key in ends.items()}
+
+    def _fetch_values(self, executor: ThreadPoolExecutor, wanted: typing.Set[keys.Key]) -> None:
+        missing = [key for key in wanted if key not in self._values]
+        for key, value in zip(missing, executor.map(self._query, missing)):
+            self._values[key] = value
+
+    def _query(self, key: keys.Key) -> typing.Optional[StoredValue]:
+        try:
+            return self.client.query_global_state(str(key), state_root_hash=self.state_root_hash).stored_value
+        except RPCError as e:
+            # The node answers an error for a key holding nothing, other errors are failures.
+            if e.code != VALUE_NOT_FOUND:
+                raise
+            return None
+
+    def _fetch_items(self, executor: ThreadPoolExecutor, wanted: typing.Set[typing.Tuple[keys.Key, str]]) -> None:
+        missing = [item for item in wanted if item not in self._items]
+        for item, found in zip(missing, executor.map(self._query_item, missing)):
+            if found is None:
+                self._items[item] = None
+                continue
+            key, value = found
+            self._items[item] = key
+            self._values[key] = value
+
+    def _query_item(self, item: typing.Tuple[keys.Key, str]) -> typing.Optional[typing.Tuple[keys.Key, StoredValue]]:
+        seed_uref, name = item
+        identifier = {"URef": {"seed_uref": str(seed_uref), "dictionary_item_key": name}}
+        try:
+            res = self.client.rpc.state_get_dictionary_item(self.state_root_hash, identifier)
+        except RPCError as e:
+            if e.code != VALUE_NOT_FOUND:
+                raise
+            return None
+        return keys.from_string(res.dictionary_key), res.stored_value
+
+    def _named_key(self, parent: keys.Key, name: str) -> typing.Optional[keys.Key]:
+        named = self._named_keys.get(parent)
+        if named is None:
+            value = self._values[parent]
+            if value is None or value.kind not in ("Account", "Contract"):
+                named = {}
+            else:
+                named = {named_key.name: named_key.key for named_key in value.value.named_keys}
+            self._named_keys[parent] = named
+        return named.get(name)
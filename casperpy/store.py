@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+import typing
+import zlib
+from abc import ABC, abstractmethod
+from .codec import Codec, get_codec
+
+DEPLOY = "deploy"
+BLOCK = "block"
+BLOCK_TRANSFERS = "block_transfers"
+
+class ChainStore(ABC):
+    """
+    Persistent store for chain data that never changes once finalized.
+    """
+    @abstractmethod
+    def get(self, kind: str, key: str) -> typing.Optional[dict]:
+        """
+        Get the stored JSON RPC result of the kind (deploy, block...) under the hash key.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, kind: str, key: str, value: dict) -> None:
+        """
+        Store the JSON RPC result of the kind under the hash key.
+        """
+        pass
+
+    def block_hash(self, height: int) -> typing.Optional[str]:
+        """
+        Get the hash of the block stored at the height, None if unknown or not indexed by the store.
+        """
+        return None
+
+    def put_block_hash(self, height: int, block_hash: str) -> None:
+        """
+        Index the hash of the block at the height, ignored by stores without a height index.
+        """
+        pass
+
+class SQLiteChainStore(ChainStore):
+    """
+    Chain store backed by a SQLite file, shareable between worker processes.
+
+    Hashes are stored as raw bytes and results as zlib compressed JSON. The
+    hashes of the blocks are indexed by height, so blocks fetched by height
+    are found again after a restart. The database runs in WAL mode so
+    readers in other processes are not blocked by a writer.
+    """
+    def __init__(self, path: str, compression_level: int = 6, timeout: float = 30.0, codec: typing.Optional[Codec] = None) -> None:
+        self.path = path
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self.codec = codec or get_codec()
+        self._local = threading.local()
+        self._connection().executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS chain_data (
+                kind TEXT NOT NULL,
+                key BLOB NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (kind, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS block_heights (
+                height INTEGER PRIMARY KEY,
+                hash BLOB NOT NULL
+            );
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, keep one per thread.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(key: typing.Union[str, bytes]) -> bytes:
+        # Digests are bytes already.
+        if isinstance(key, (bytes, bytearray)):
+            return bytes(key)
+        key = str(key)
+        try:
+            return bytes.fromhex(key)
+        except ValueError:
+            return key.encode("utf-8")
+
+    def get(self, kind: str, key: str) -> typing.Optional[dict]:
+        """
+        Get the stored JSON RPC result of the kind under the hash key.
+        """
+        row = self._connection().execute(
+            "SELECT value FROM chain_data WHERE kind = ? AND key = ?", (kind, self._key(key))
+        ).fetchone()
+        if row is None:
+            return None
+        return self.codec.loads(zlib.decompress(row[0]))
+
+    def put(self, kind: str, key: str, value: dict) -> None:
+        """
+        Store the JSON RPC result of the kind under the hash key.
+        """
+        blob = zlib.compress(self.codec.dumps(value), self.compression_level)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO chain_data (kind, key, value) VALUES (?, ?, ?)", (kind, self._key(key), blob)
+        )
+
+    def block_hash(self, height: int) -> typing.Optional[str]:
+        """
+        Get the hash of the block stored at the height, None if unknown.
+        """
+        row = self._connection().execute("SELECT hash FROM block_heights WHERE height = ?", (height,)).fetchone()
+        return None if row is None else row[0].hex()
+
+    def put_block_hash(self, height: int, block_hash: str) -> None:
+        """
+        Index the hash of the block at the height.
+        """
+        self._connection().execute(
+            "INSERT OR REPLACE INTO block_heights (height, hash) VALUES (?, ?)", (height, self._key(block_hash))
+        )
+
+    def close(self) -> None:
+        """
+        Close the connection of the calling thread.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
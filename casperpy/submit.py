@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+import enum
+import threading
+import time
+import typing
+from .client import Client
+from .errors import RPCError
+import casperpy.types.deploy as deploy_types
+
+class SubmissionStatus(enum.Enum):
+    """
+    Enumeration over the states of a deploy submission.
+    """
+    PENDING = "pending"
+    ACCEPTED = "accepted"
+    FAILED = "failed"
+    UNKNOWN = "unknown"
+    """Every attempt failed in transit, the node may have the deploy or not."""
+
+@dataclass
+class Submission:
+    """
+    Outcome of sending a deploy to the node.
+    """
+    deploy_hash: str
+    status: SubmissionStatus = SubmissionStatus.PENDING
+    attempts: int = 0
+    """Number of account_put_deploy requests sent for the deploy."""
+    error: typing.Optional[Exception] = None
+    """Last error, the reason of the failure if the deploy failed or its status is unknown."""
+
+@dataclass
+class SubmitStats:
+    """
+    Counters of a DeploySubmitter.
+    """
+    accepted: int = 0
+    failed: int = 0
+    unknown: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    """Seconds spent submitting."""
+
+    @property
+    def deploys_per_second(self) -> float:
+        """
+        Accepted deploys per second of submission.
+        """
+        return self.accepted / self.elapsed if self.elapsed else 0.0
+
+@dataclass
+class DeploySubmitter:
+    """
+    Pipeline sending a stream of signed deploys with account_put_deploy.
+
+    At most max_in_flight deploys are being sent at once, the stream is only
+    read as submissions complete. A transient failure (anything but an error
+    answered by the node) leaves the outcome unknown, so before sending the
+    deploy again the node is asked for it with info_get_deploy, and a deploy
+    it already knows is accepted without being sent twice. A deploy hash is
+    only ever submitted once per submitter, unless its status was left
+    unknown: the node did not know it after the last attempt, and it is sent
+    again if submitted again.
+    """
+    client: Client
+    max_in_flight: int = 16
+    max_attempts: int = 3
+    retry_delay: float = 0.5
+    """Seconds to wait before retrying a transient failure, doubled on each attempt."""
+    stats: SubmitStats = field(default_factory=SubmitStats, init=False)
+    _submissions: typing.Dict[str, Submission] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def status(self, deploy_hash: str) -> typing.Optional[Submission]:
+        """
+        Get the submission of the deploy hash, None if it was never submitted.
+        """
+        with self._lock:
+            return self._submissions.get(deploy_hash)
+
+    def _is_known(self, deploy_hash: str) -> bool:
+        try:
+            self.client.info_get_deploy(deploy_hash, lazy=True)
+        except RPCError:
+            return False
+        return True
+
+    def _submit(self, deploy: deploy_types.Deploy, submission: Submission) -> Submission:
+        for attempt in range(self.max_attempts):
+            try:
+                # Sent before, by this or an earlier submission.
+                if submission.attempts and self._is_known(submission.deploy_hash):
+                    submission.status = SubmissionStatus.ACCEPTED
+                    return submission
+                submission.attempts += 1
+                self.client.account_put_deploy(deploy)
+            except RPCError as e:
+                # The node answered, the deploy was rejected.
+                submission.status, submission.error = SubmissionStatus.FAILED, e
+                return submission
+            except Exception as e:
+                submission.error = e
+                if attempt + 1 < self.max_attempts:
+                    with self._lock:
+                        self.stats.retries += 1
+                    time.sleep(self.retry_delay * 2 ** attempt)
+                continue
+            submission.status, submission.error = SubmissionStatus.ACCEPTED, None
+            return submission
+        # The last attempt may have reached the node.
+        try:
+            known = self._is_known(submission.deploy_hash)
+        except Exception:
+            known = False
+        if known:
+            submission.status, submission.error = SubmissionStatus.ACCEPTED, None
+        else:
+            submission.status = SubmissionStatus.UNKNOWN
+        return submission
+
+    def _complete(self, future: Future) -> Submission:
+        submission = future.result()
+        with self._lock:
+            if submission.status == SubmissionStatus.ACCEPTED:
+                self.stats.accepted += 1
+            elif submission.status == SubmissionStatus.UNKNOWN:
+                self.stats.unknown += 1
+            else:
+                self.stats.failed += 1
+        return submission
+
+    def submit_all(self, deploys: typing.Iterable[deploy_types.Deploy]) -> typing.Iterator[Submission]:
+        """
+        Send the deploys, yielding their submissions as they complete.
+
+        Deploys whose hash was already submitted are skipped, unless their status is unknown.
+        """
+        start = time.monotonic()
+        pending: typing.Set[Future] = set()
+        with ThreadPoolExecutor(self.max_in_flight, thread_name_prefix="casperpy-submit") as executor:
+            try:
+                for deploy in deploys:
+                    deploy_hash = deploy.hash.hex()
+                    with self._lock:
+                        submission = self._submissions.get(deploy_hash)
+                        if submission is None:
+                            submission = self._submissions[deploy_hash] = Submission(deploy_hash)
+                        elif submission.status == SubmissionStatus.UNKNOWN:
+                            submission.status = SubmissionStatus.PENDING
+                        else:
+                            continue
+                    if len(pending) >= self.max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield self._complete(future)
+                    pending.add(executor.submit(self._submit, deploy, submission))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self._complete(future)
+            finally:
+                self.stats.elapsed += time.monotonic() - start
+
+    def submit(self, deploys: typing.Iterable[deploy_types.Deploy]) -> typing.List[Submission]:
+        """
+        Send the deploys, returning their submissions once all completed.
+        """
+        return list(self.submit_all(deploys))
@@ -0,0 +1,177 @@
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+import threading
+import time
+import typing
+from .client import JRPCClient
+from .types_old import ExecutionResult
+
+@dataclass
+class DeployTracker:
+    """
+    Waits for the execution results of many deploys with batched polling.
+
+    Each polling round sends a chain_get_state_root_hash call and an
+    info_get_deploy call per pending deploy as JSON RPC batches of at most
+    chunk_size calls. Deploys are dropped from the rounds as soon as their
+    execution result is known.
+
+    The block time is estimated from the rounds seeing a new state root
+    hash, and the next round is scheduled for when the next block is
+    expected, within min_interval and max_interval seconds.
+
+    Example:
+        with DeployTracker(client) as tracker:
+            futures = [tracker.track(h) for h in deploy_hashes]
+            results = [future.result() for future in futures]
+    """
+    client: JRPCClient
+    chunk_size: int = 100
+    block_time: float = 32.768
+    """Initial estimate of the block time in seconds."""
+    min_interval: float = 1.0
+    max_interval: float = 60.0
+    smoothing: float = 0.2
+    """Weight of the last observation in the block time average."""
+    timeout: typing.Optional[float] = None
+    """Seconds after which a deploy still pending fails with a TimeoutError."""
+    rounds: int = field(default=0, init=False)
+    _pending: typing.Dict[str, typing.Tuple[Future, float]] = field(default_factory=dict, init=False, repr=False)
+    _state_root: typing.Optional[str] = field(default=None, init=False, repr=False)
+    _state_root_at: typing.Optional[float] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _wake: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _thread: typing.Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False, repr=False)
+
+    def track(
+        self,
+        deploy_hash: str,
+        callback: typing.Optional[typing.Callable[[ExecutionResult], None]] = None,
+    ) -> "Future[ExecutionResult]":
+        """
+        Track the deploy hash, returning a future of its ExecutionResultSuccess or ExecutionResultFailure.
+
+        The callback, if any, is called with the execution result once known.
+        """
+        with self._lock:
+            idle = not self._pending
+            entry = self._pending.get(deploy_hash)
+            if entry is None:
+                entry = self._pending[deploy_hash] = (Future(), time.monotonic())
+        future = entry[0]
+        if callback is not None:
+            def done(f: Future) -> None:
+                if f.exception() is None:
+                    callback(f.result())
+            future.add_done_callback(done)
+        if idle:
+            # New deploys otherwise wait for the next round.
+            self._wake.set()
+        return future
+
+    def pending(self) -> int:
+        """
+        Number of deploys still waiting for their execution result.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def _observe_state_root(self, state_root: str, now: float) -> None:
+        if state_root == self._state_root:
+            return
+        if self._state_root_at is not None:
+            self.block_time += self.smoothing * (now - self._state_root_at - self.block_time)
+        self._state_root, self._state_root_at = state_root, now
+
+    def next_interval(self) -> float:
+        """
+        Seconds to wait before the next round: until the next block is expected, within the interval bounds.
+        """
+        if self._state_root_at is None:
+            return self.min_interval
+        wait = self._state_root_at + self.block_time - time.monotonic()
+        return min(self.max_interval, max(self.min_interval, wait))
+
+    def poll(self) -> int:
+        """
+        Run a polling round, returning the number of deploys resolved.
+
+        Deploys whose future was cancelled are dropped without being polled.
+        """
+        with self._lock:
+            for deploy_hash in [h for h, (future, _) in self._pending.items() if future.cancelled()]:
+                del self._pending[deploy_hash]
+            hashes = list(self._pending)
+        if not hashes:
+            return 0
+        with self.client.batch(self.chunk_size) as batch:
+            root_call = batch.chain_get_state_root_hash()
+            calls = [batch.info_get_deploy(deploy_hash, lazy=True) for deploy_hash in hashes]
+        now = time.monotonic()
+        self.rounds += 1
+        if root_call.error is None:
+            self._observe_state_root(root_call.result.state_root_hash, now)
+        resolved = 0
+        for deploy_hash, call in zip(hashes, calls):
+            # Unknown deploys fail the call, they are still propagating.
+            if call.error is None and call.result.execution_results:
+                result: typing.Any = call.result.execution_results[0].result
+            elif self.timeout is not None and now - self._pending[deploy_hash][1] > self.timeout:
+                result = TimeoutError(f"Deploy {deploy_hash} not executed after {self.timeout}s")
+            else:
+                continue
+            with self._lock:
+                future, _ = self._pending.pop(deploy_hash)
+            # Cancelled by the user, or can no longer be.
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+            resolved += 1
+        return resolved
+
+    def _run(self) -> None:
+        while True:
+            # Cleared before the round, a deploy tracked during it wakes the next one.
+            self._wake.clear()
+            if self._stopped:
+                return
+            if not self.pending():
+                self._wake.wait()
+                continue
+            try:
+                self.poll()
+            except Exception:
+                # Transient node failures, retried on the next round.
+                pass
+            if not self._stopped:
+                self._wake.wait(self.next_interval())
+
+    def start(self) -> None:
+        """
+        Poll in a background thread until stopped.
+        """
+        if self._thread is None:
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="casperpy-tracker", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background polling, leaving the pending futures unresolved.
+        """
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "DeployTracker":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,251 @@
+import asyncio
+import dataclasses
+import ssl
+import typing
+import urllib.parse
+from abc import ABC, abstractmethod
+
+import requests
+from requests.adapters import HTTPAdapter
+
+class TransportError(IOError):
+    """
+    The node answered with an unexpected HTTP status or a malformed response.
+    """
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+@dataclasses.dataclass
+class PoolStats:
+    """
+    Connection pool statistics of a transport.
+    """
+    requests: int
+    """Number of requests sent through the pools."""
+    connections_opened: int
+    """Number of TCP connections opened to the nodes."""
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        Share of the requests served over an already opened connection.
+        """
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+class Transport(ABC):
+    @abstractmethod
+    def post(self, url: str, body: bytes) -> bytes:
+        """
+        Post a JSON body to the url and return the raw response body.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> PoolStats:
+        """
+        Get the connection pool statistics of the transport.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Close the connections held by the transport.
+        """
+        pass
+
+@dataclasses.dataclass
+class HTTPTransport(Transport):
+    """
+    Keep-alive HTTP transport, holding a connection pool per node.
+    """
+    pool_connections: int = 10
+    """Number of node pools to keep."""
+    pool_maxsize: int = 10
+    """Maximum number of idle connections kept per node."""
+    pool_block: bool = False
+    """Block when the pool of a node is exhausted instead of opening a throwaway connection."""
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    _session: requests.Session = dataclasses.field(init=False, repr=False)
+    _adapter: HTTPAdapter = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._session.headers.update({"Content-Type": "application/json"})
+
+    @property
+    def timeout(self) -> typing.Tuple[float, float]:
+        """
+        The (connect, read) timeouts of a request.
+        """
+        return (self.connect_timeout, self.read_timeout)
+
+    def post(self, url: str, body: bytes) -> bytes:
+        """
+        Post a JSON body to the url and return the raw response body.
+        """
+        res = self._session.post(url, data=body, timeout=self.timeout)
+        if res.status_code != 200:
+            raise TransportError(res.status_code, res.reason)
+        return res.content
+
+    def stats(self) -> PoolStats:
+        """
+        Get the connection pool statistics, summed over the pools of every node.
+        """
+        pools = self._adapter.poolmanager.pools
+        requests_count = 0
+        connections_opened = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_count += pool.num_requests
+            connections_opened += pool.num_connections
+        return PoolStats(requests_count, connections_opened)
+
+    def close(self) -> None:
+        """
+        Close the connections held by the transport.
+        """
+        self._session.close()
+
+_Connection = typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+_Node = typing.Tuple[str, str, int]
+"""Scheme, host and port of a node."""
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+@dataclasses.dataclass
+class AsyncHTTPTransport:
+    """
+    Keep-alive HTTP/1.1 transport for asyncio, holding a pool of idle connections per node.
+    """
+    pool_maxsize: int = 100
+    """Maximum number of idle connections kept per node."""
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    ssl_context: typing.Optional[ssl.SSLContext] = None
+    """Context of the https connections, the default one if None."""
+    _idle: typing.Dict[_Node, typing.List[_Connection]] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _requests: int = dataclasses.field(default=0, init=False, repr=False)
+    _connections_opened: int = dataclasses.field(default=0, init=False, repr=False)
+
+    async def post(self, url: str, body: bytes) -> bytes:
+        """
+        Post a JSON body to the url and return the raw response body.
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in DEFAULT_PORTS:
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        node = (parts.scheme, parts.hostname, parts.port or DEFAULT_PORTS[parts.scheme])
+        request = (
+            f"POST {parts.path or '/'} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("ascii") + body
+        self._requests += 1
+        idle = self._idle.setdefault(node, [])
+        while idle:
+            conn = idle.pop()
+            reader, writer = conn
+            if reader.at_eof() or writer.is_closing():
+                # The node closed the idle connection, try the next one. A
+                # request written to a connection is never sent again, the
+                # node may have processed it.
+                writer.close()
+                continue
+            return await self._exchange(node, conn, request)
+        conn = await self._connect(node)
+        return await self._exchange(node, conn, request)
+
+    async def _connect(self, node: _Node) -> _Connection:
+        scheme, host, port = node
+        tls = (self.ssl_context or True) if scheme == "https" else None
+        conn = await asyncio.wait_for(asyncio.open_connection(host, port, ssl=tls), self.connect_timeout)
+        self._connections_opened += 1
+        return conn
+
+    async def _exchange(self, node: _Node, conn: _Connection, request: bytes) -> bytes:
+        reader, writer = conn
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive, body = await asyncio.wait_for(self._read_response(reader), self.read_timeout)
+        except BaseException:
+            writer.close()
+            raise
+        idle = self._idle.setdefault(node, [])
+        if keep_alive and len(idle) < self.pool_maxsize:
+            idle.append(conn)
+        else:
+            writer.close()
+        if status != 200:
+            raise TransportError(status, body[:200].decode("utf-8", "replace"))
+        return body
+
+    @classmethod
+    async def _read_response(cls, reader: asyncio.StreamReader) -> typing.Tuple[int, bool, bytes]:
+        try:
+            return await cls._parse_response(reader)
+        except ValueError as e:
+            raise TransportError(0, f"Malformed response: {e}") from e
+
+    @staticmethod
+    async def _parse_response(reader: asyncio.StreamReader) -> typing.Tuple[int, bool, bytes]:
+        status_line = await reader.readuntil(b"\r\n")
+        # The reason phrase may be missing, as in "HTTP/1.1 200".
+        version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+        status = rest.partition(" ")[0]
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = headers.get("connection", "").lower() != "close" and version != "HTTP/1.0"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return int(status), keep_alive, body
+
+    def stats(self) -> PoolStats:
+        """
+        Get the connection pool statistics, summed over every node.
+        """
+        return PoolStats(self._requests, self._connections_opened)
+
+    async def close(self) -> None:
+        """
+        Close the idle connections held by the transport.
+        """
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+            idle.clear()
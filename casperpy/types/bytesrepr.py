@@ -0,0 +1,222 @@
+import struct
+import typing
+
+import casperpy.types.cl_types as cl_types
+import casperpy.types.cl_values as cl_values
+import casperpy.types.crypto as crypto_types
+
+CL_TypeKey = cl_types.CL_TypeKey
+
+Buffer = typing.Union[bytes, bytearray, memoryview]
+
+RESULT_ERR_TAG = 0
+RESULT_OK_TAG = 1
+
+PUBLIC_KEY_SIZES = {
+    crypto_types.KeyAlgorithm.ED25519: 32,
+    crypto_types.KeyAlgorithm.SECP256K1: 33,
+}
+
+FIXED_WIDTH_INTS = {
+    CL_TypeKey.I32: (struct.Struct("<i"), cl_values.CL_I32),
+    CL_TypeKey.I64: (struct.Struct("<q"), cl_values.CL_I64),
+    CL_TypeKey.U8: (struct.Struct("<B"), cl_values.CL_U8),
+    CL_TypeKey.U32: (struct.Struct("<I"), cl_values.CL_U32),
+    CL_TypeKey.U64: (struct.Struct("<Q"), cl_values.CL_U64),
+}
+"""Struct formats and value classes of the fixed width integers."""
+
+BIG_INTS = {
+    CL_TypeKey.U128: cl_values.CL_U128,
+    CL_TypeKey.U256: cl_values.CL_U256,
+    CL_TypeKey.U512: cl_values.CL_U512,
+}
+"""Value classes of the length prefixed integers."""
+
+U32 = struct.Struct("<I")
+U64 = struct.Struct("<Q")
+
+def check_length(data: memoryview, offset: int, size: int, what: typing.Union[str, cl_types.CL_Type]) -> None:
+    """
+    Raise a ValueError if fewer than size bytes are left at the offset to decode the what.
+    """
+    if size > len(data) - offset:
+        name = what.to_json() if isinstance(what, cl_types.CL_Type) else what
+        raise ValueError(f"Truncated {name} at offset {offset}: {size} bytes needed, {max(len(data) - offset, 0)} left")
+
+def decode_u32(data: memoryview, offset: int, what: typing.Union[str, cl_types.CL_Type] = "U32") -> typing.Tuple[int, int]:
+    """
+    Decode a 32-bit unsigned integer at the offset, returning it with the offset past it.
+
+    what names the value the integer belongs to in the error raised if the data is too short.
+    """
+    check_length(data, offset, 4, what)
+    return U32.unpack_from(data, offset)[0], offset + 4
+
+def decode_type(data: Buffer, offset: int = 0) -> typing.Tuple[cl_types.CL_Type, int]:
+    """
+    Decode a serialized CL type at the offset, returning it with the offset past it.
+    """
+    data = memoryview(data)
+    check_length(data, offset, 1, "CL type")
+    type_key = CL_TypeKey(data[offset])
+    offset += 1
+    if type_key == CL_TypeKey.OPTION:
+        inner, offset = decode_type(data, offset)
+        return cl_types.CL_OptionType(inner), offset
+    elif type_key == CL_TypeKey.LIST:
+        inner, offset = decode_type(data, offset)
+        return cl_types.CL_ListType(inner), offset
+    elif type_key == CL_TypeKey.BYTE_ARRAY:
+        size, offset = decode_u32(data, offset, "CL type")
+        return cl_types.CL_ByteArrayType(size), offset
+    elif type_key == CL_TypeKey.RESULT:
+        ok, offset = decode_type(data, offset)
+        err, offset = decode_type(data, offset)
+        return cl_types.CL_ResultType(ok, err), offset
+    elif type_key == CL_TypeKey.MAP:
+        key, offset = decode_type(data, offset)
+        value, offset = decode_type(data, offset)
+        return cl_types.CL_MapType(key, value), offset
+    elif type_key in (CL_TypeKey.TUPLE_1, CL_TypeKey.TUPLE_2, CL_TypeKey.TUPLE_3):
+        items = []
+        for _ in range(type_key.value - CL_TypeKey.TUPLE_1.value + 1):
+            item, offset = decode_type(data, offset)
+            items.append(item)
+        return cl_types.CL_TupleType(tuple(items)), offset
+    else:
+        return cl_types.CL_SimpleType(type_key), offset
+
+def decode_key(data: memoryview, offset: int) -> typing.Tuple[cl_values.CL_Key, int]:
+    """
+    Decode a key at the offset, returning it with the offset past it.
+    """
+    check_length(data, offset, 1, "Key")
+    key_type = cl_values.CL_KeyType(data[offset])
+    offset += 1
+    if key_type == cl_values.CL_KeyType.ERA_INFO:
+        check_length(data, offset, 8, "Key")
+        return cl_values.CL_Key(key_type, bytes(data[offset:offset + 8])), offset + 8
+    check_length(data, offset, 33 if key_type == cl_values.CL_KeyType.UREF else 32, "Key")
+    value = bytes(data[offset:offset + 32])
+    offset += 32
+    if key_type == cl_values.CL_KeyType.UREF:
+        return cl_values.CL_Key(key_type, value, cl_values.CL_UrefAccessRights(data[offset])), offset + 1
+    return cl_values.CL_Key(key_type, value), offset
+
+def decode_value(cl_type: cl_types.CL_Type, data: Buffer, offset: int = 0) -> typing.Tuple[cl_values.CL_Value, int]:
+    """
+    Decode a value of the CL type at the offset, returning it with the offset past it.
+
+    The data is read through a memoryview, nested values are decoded in
+    place without slicing copies of the buffer. Truncated data raises a
+    ValueError naming the type and the offset.
+    """
+    if not isinstance(data, memoryview):
+        data = memoryview(data)
+    if isinstance(cl_type, cl_types.CL_SimpleType):
+        type_key = cl_type.type_key
+        if type_key in FIXED_WIDTH_INTS:
+            fmt, value_class = FIXED_WIDTH_INTS[type_key]
+            check_length(data, offset, fmt.size, cl_type)
+            return value_class(fmt.unpack_from(data, offset)[0]), offset + fmt.size
+        elif type_key in BIG_INTS:
+            check_length(data, offset, 1, cl_type)
+            length = data[offset]
+            offset += 1
+            check_length(data, offset, length, cl_type)
+            value = int.from_bytes(data[offset:offset + length], "little")
+            return BIG_INTS[type_key](value), offset + length
+        elif type_key == CL_TypeKey.BOOL:
+            check_length(data, offset, 1, cl_type)
+            return cl_values.CL_Bool(data[offset] == 1), offset + 1
+        elif type_key == CL_TypeKey.UNIT:
+            return cl_values.CL_Unit(), offset
+        elif type_key == CL_TypeKey.STRING:
+            length, offset = decode_u32(data, offset, cl_type)
+            check_length(data, offset, length, cl_type)
+            return cl_values.CL_String(str(data[offset:offset + length], "utf-8")), offset + length
+        elif type_key == CL_TypeKey.KEY:
+            return decode_key(data, offset)
+        elif type_key == CL_TypeKey.UREF:
+            check_length(data, offset, 33, cl_type)
+            value = bytes(data[offset:offset + 32])
+            return cl_values.CL_Uref(value, cl_values.CL_UrefAccessRights(data[offset + 32])), offset + 33
+        elif type_key == CL_TypeKey.PUBLIC_KEY:
+            check_length(data, offset, 1, cl_type)
+            algo = crypto_types.KeyAlgorithm(data[offset])
+            offset += 1
+            size = PUBLIC_KEY_SIZES[algo]
+            check_length(data, offset, size, cl_type)
+            return cl_values.CL_PublicKey(bytes(data[offset:offset + size]), algo), offset + size
+        elif type_key == CL_TypeKey.ANY:
+            # Any has no defined layout, keep the remaining bytes as they are.
+            return cl_values.CL_Any(bytes(data[offset:])), len(data)
+    elif isinstance(cl_type, cl_types.CL_OptionType):
+        check_length(data, offset, 1, cl_type)
+        tag = data[offset]
+        offset += 1
+        if tag == 0:
+            return cl_values.CL_Union(None, cl_type.inner), offset
+        value, offset = decode_value(cl_type.inner, data, offset)
+        return cl_values.CL_Union(value, cl_type.inner), offset
+    elif isinstance(cl_type, cl_types.CL_ListType):
+        length, offset = decode_u32(data, offset, cl_type)
+        inner = cl_type.inner
+        if isinstance(inner, cl_types.CL_SimpleType) and inner.type_key in FIXED_WIDTH_INTS:
+            # Unpack the whole run of fixed width integers at once.
+            fmt, value_class = FIXED_WIDTH_INTS[inner.type_key]
+            check_length(data, offset, length * fmt.size, cl_type)
+            end = offset + length * fmt.size
+            items = [value_class(v) for v, in fmt.iter_unpack(data[offset:end])]
+            return cl_values.CL_List(items, inner), end
+        items = []
+        for _ in range(length):
+            item, offset = decode_value(inner, data, offset)
+            items.append(item)
+        return cl_values.CL_List(items, inner), offset
+    elif isinstance(cl_type, cl_types.CL_ByteArrayType):
+        check_length(data, offset, cl_type.size, cl_type)
+        return cl_values.CL_ByteArray(bytes(data[offset:offset + cl_type.size])), offset + cl_type.size
+    elif isinstance(cl_type, cl_types.CL_ResultType):
+        check_length(data, offset, 1, cl_type)
+        tag = data[offset]
+        offset += 1
+        is_ok = tag == RESULT_OK_TAG
+        value, offset = decode_value(cl_type.ok if is_ok else cl_type.err, data, offset)
+        return cl_values.CL_Result(value, is_ok, cl_type), offset
+    elif isinstance(cl_type, cl_types.CL_MapType):
+        length, offset = decode_u32(data, offset, cl_type)
+        items = []
+        for _ in range(length):
+            key, offset = decode_value(cl_type.key, data, offset)
+            value, offset = decode_value(cl_type.value, data, offset)
+            items.append((key, value))
+        return cl_values.CL_Map(items, cl_type.key, cl_type.value), offset
+    elif isinstance(cl_type, cl_types.CL_TupleType):
+        items = []
+        for item_type in cl_type.items:
+            item, offset = decode_value(item_type, data, offset)
+            items.append(item)
+        return cl_values.CL_Tuple(tuple(items)), offset
+    raise ValueError(f"Invalid CL type: {cl_type}")
+
+def from_bytes(cl_type: cl_types.CL_Type, data: Buffer) -> cl_values.CL_Value:
+    """
+    Decode a value of the CL type spanning the whole buffer.
+    """
+    value, offset = decode_value(cl_type, data)
+    if offset != len(data):
+        raise ValueError(f"Trailing bytes after {cl_type}: {len(data) - offset}")
+    return value
+
+def decode_cl_value(data: Buffer, offset: int = 0) -> typing.Tuple[cl_values.CL_Value, int]:
+    """
+    Decode a serialized CLValue (length prefixed bytes followed by their CL type).
+    """
+    data = memoryview(data)
+    length, start = decode_u32(data, offset, "CLValue")
+    check_length(data, start, length, "CLValue")
+    cl_type, end = decode_type(data, start + length)
+    value = from_bytes(cl_type, data[start:start + length])
+    return value, end
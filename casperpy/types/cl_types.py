@@ -3,6 +3,55 @@ import enum
 import typing
 import abc
 
+class CL_TypeKey(enum.Enum):
+    """
+    Enumeration over set of CL type keys.
+    """
+    ANY = 21
+    BOOL = 0
+    BYTE_ARRAY = 15
+    I32 = 1
+    I64 = 2
+    KEY = 11
+    LIST = 14
+    MAP = 17
+    OPTION = 13
+    PUBLIC_KEY = 22
+    RESULT = 16
+    STRING = 10
+    TUPLE_1 = 18
+    TUPLE_2 = 19
+    TUPLE_3 = 20
+    U8 = 3
+    U32 = 4
+    U64 = 5
+    U128 = 6
+    U256 = 7
+    U512 = 8
+    UNIT = 9
+    UREF = 12
+
+SIMPLE_TYPE_NAMES = {
+    "Any": CL_TypeKey.ANY,
+    "Bool": CL_TypeKey.BOOL,
+    "I32": CL_TypeKey.I32,
+    "I64": CL_TypeKey.I64,
+    "Key": CL_TypeKey.KEY,
+    "PublicKey": CL_TypeKey.PUBLIC_KEY,
+    "String": CL_TypeKey.STRING,
+    "U8": CL_TypeKey.U8,
+    "U32": CL_TypeKey.U32,
+    "U64": CL_TypeKey.U64,
+    "U128": CL_TypeKey.U128,
+    "U256": CL_TypeKey.U256,
+    "U512": CL_TypeKey.U512,
+    "Unit": CL_TypeKey.UNIT,
+    "URef": CL_TypeKey.UREF,
+}
+"""JSON names of the types without inner types."""
+
+SIMPLE_TYPE_JSON = {type_key: name for name, type_key in SIMPLE_TYPE_NAMES.items()}
+
 @dataclasses.dataclass
 class CL_Type(abc.ABC):
     """
@@ -10,4 +59,148 @@ class CL_Type(abc.ABC):
     """
     @abc.abstractmethod
     def __eq__(self, other: object) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    def encode_into(self, buf: bytearray) -> None:
+        """
+        Append the serialized type to the buffer.
+        """
+        raise NotImplementedError()
+
+    def encode(self) -> bytes:
+        """
+        Encode the type to a byte array.
+        """
+        buf = bytearray()
+        self.encode_into(buf)
+        return bytes(buf)
+
+    def to_json(self) -> typing.Union[str, dict]:
+        """
+        Get the JSON representation of the type, e.g. "U512" or {"List": "U8"}.
+        """
+        raise NotImplementedError()
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_SimpleType(CL_Type):
+    """
+    CL type without inner types, e.g. Bool, U512 or Key.
+    """
+    type_key: CL_TypeKey
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(self.type_key.value)
+
+    def to_json(self) -> str:
+        return SIMPLE_TYPE_JSON[self.type_key]
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_OptionType(CL_Type):
+    """
+    CL type for an optional value.
+    """
+    inner: CL_Type
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.OPTION.value)
+        self.inner.encode_into(buf)
+
+    def to_json(self) -> dict:
+        return {"Option": self.inner.to_json()}
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_ListType(CL_Type):
+    """
+    CL type for a list of values of the same type.
+    """
+    inner: CL_Type
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.LIST.value)
+        self.inner.encode_into(buf)
+
+    def to_json(self) -> dict:
+        return {"List": self.inner.to_json()}
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_ByteArrayType(CL_Type):
+    """
+    CL type for a fixed size byte array.
+    """
+    size: int
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.BYTE_ARRAY.value)
+        buf += self.size.to_bytes(4, "little")
+
+    def to_json(self) -> dict:
+        return {"ByteArray": self.size}
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_ResultType(CL_Type):
+    """
+    CL type for a result, holding either an ok or an err value.
+    """
+    ok: CL_Type
+    err: CL_Type
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.RESULT.value)
+        self.ok.encode_into(buf)
+        self.err.encode_into(buf)
+
+    def to_json(self) -> dict:
+        return {"Result": {"ok": self.ok.to_json(), "err": self.err.to_json()}}
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_MapType(CL_Type):
+    """
+    CL type for a map.
+    """
+    key: CL_Type
+    value: CL_Type
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.MAP.value)
+        self.key.encode_into(buf)
+        self.value.encode_into(buf)
+
+    def to_json(self) -> dict:
+        return {"Map": {"key": self.key.to_json(), "value": self.value.to_json()}}
+
+@dataclasses.dataclass(unsafe_hash=True)
+class CL_TupleType(CL_Type):
+    """
+    CL type for a tuple of 1 to 3 values.
+    """
+    items: typing.Tuple[CL_Type, ...]
+
+    def encode_into(self, buf: bytearray) -> None:
+        buf.append(CL_TypeKey.TUPLE_1.value + len(self.items) - 1)
+        for item in self.items:
+            item.encode_into(buf)
+
+    def to_json(self) -> dict:
+        return {f"Tuple{len(self.items)}": [item.to_json() for item in self.items]}
+
+def from_json(cl_type: typing.Union[str, dict]) -> CL_Type:
+    """
+    Create a CL_Type from its JSON representation, e.g. "U512" or {"List": "U8"}.
+    """
+    if isinstance(cl_type, str):
+        return CL_SimpleType(SIMPLE_TYPE_NAMES[cl_type])
+    (name, inner), = cl_type.items()
+    if name == "Option":
+        return CL_OptionType(from_json(inner))
+    elif name == "List":
+        return CL_ListType(from_json(inner))
+    elif name == "ByteArray":
+        return CL_ByteArrayType(inner)
+    elif name == "Result":
+        return CL_ResultType(from_json(inner["ok"]), from_json(inner["err"]))
+    elif name == "Map":
+        return CL_MapType(from_json(inner["key"]), from_json(inner["value"]))
+    elif name in ("Tuple1", "Tuple2", "Tuple3"):
+        return CL_TupleType(tuple(map(from_json, inner)))
+    else:
+        raise ValueError(f"Invalid CL type: {cl_type}")
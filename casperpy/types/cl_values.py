@@ -1,86 +1,102 @@
 import dataclasses
 import enum
+import struct
 import typing
 import abc
 
 import casperpy.types.cl_types as cl_types
 import casperpy.types.crypto as crypto_types
-
-KEY_ACCOUNT_PREFIX = "account-hash"
-KEY_HASH_PREFIX = "hash"
-KEY_UREF_PREFIX = "uref"
-
-class CL_TypeKey(enum.Enum):
-    """
-    Enumeration over set of CL type keys.
-    """
-    ANY = 21
-    BOOL = 0
-    BYTE_ARRAY = 15
-    I32 = 1
-    I64 = 2
-    KEY = 11
-    LIST = 14
-    MAP = 17
-    OPTION = 13
-    PUBLIC_KEY = 22
-    RESULT = 16
-    STRING = 10
-    TUPLE_1 = 18
-    TUPLE_2 = 19
-    TUPLE_3 = 20
-    U8 = 3
-    U32 = 4
-    U64 = 5
-    U128 = 6
-    U256 = 7
-    U512 = 8
-    UNIT = 9
-    UREF = 12
+import casperpy.types.keys as keys
+from casperpy.types.keys import (
+    KEY_ACCOUNT_PREFIX,
+    KEY_HASH_PREFIX,
+    KEY_UREF_PREFIX,
+    KEY_TRANSFER_PREFIX,
+    KEY_DEPLOY_INFO_PREFIX,
+    KEY_ERA_INFO_PREFIX,
+    KEY_BALANCE_PREFIX,
+    KEY_BID_PREFIX,
+    KEY_WITHDRAW_PREFIX,
+    KEY_DICTIONARY_PREFIX,
+)
+
+CL_TypeKey = cl_types.CL_TypeKey
+CL_KeyType = keys.CL_KeyType
+CL_UrefAccessRights = keys.CL_UrefAccessRights
+KEY_PREFIXES = keys.KEY_PREFIXES
+
+U32 = struct.Struct("<I")
 
 @dataclasses.dataclass
 class CL_Value(abc.ABC):
     """
     CL value.
     """
+    TYPE_KEY: typing.ClassVar[typing.Optional[CL_TypeKey]] = None
+    """ Type key of the values without inner types """
+
     @abc.abstractmethod
     def __eq__(self, other: object) -> bool:
         pass
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        """
+        Append the serialized value to the buffer.
+        """
+        raise NotImplementedError()
+
     def encode_value(self) -> bytes:
         """
         Encode the value to a byte array.
         """
-        raise NotImplementedError()
+        buf = bytearray()
+        self.encode_value_into(buf)
+        return bytes(buf)
 
-    @staticmethod
-    def encode_type() -> bytes:
+    def cl_type(self) -> cl_types.CL_Type:
         """
-        Encode the type of the value to a byte array.
+        Get the CL type of the value.
         """
-        raise NotImplementedError()
+        if self.TYPE_KEY is None:
+            raise NotImplementedError()
+        return cl_types.CL_SimpleType(self.TYPE_KEY)
 
+    def encode_type(self) -> bytes:
+        """
+        Encode the type of the value to a byte array.
+        """
+        return self.cl_type().encode()
 
 @dataclasses.dataclass
 class CL_Any(CL_Value):
     """
     CL type for any value.
     """
+    TYPE_KEY = CL_TypeKey.ANY
     value: object
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        if not isinstance(self.value, (bytes, bytearray)):
+            raise ValueError("Only serialized bytes can be encoded as Any")
+        buf += self.value
+
 @dataclasses.dataclass
 class CL_Bool(CL_Value):
     """
     CL type for boolean value.
     """
+    TYPE_KEY = CL_TypeKey.BOOL
     value: bool
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf.append(1 if self.value else 0)
+
 @dataclasses.dataclass
 class CL_ByteArray(CL_Value):
     """
@@ -91,73 +107,71 @@ class CL_ByteArray(CL_Value):
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf += self.value
+
+    def cl_type(self) -> cl_types.CL_Type:
+        return cl_types.CL_ByteArrayType(len(self.value))
+
 @dataclasses.dataclass
 class CL_Int(CL_Value):
     """
     CL type for integer value.
     """
+    STRUCT: typing.ClassVar[typing.Optional[struct.Struct]] = None
+    """ Layout of the fixed width integers """
+    MAX_BYTES: typing.ClassVar[typing.Optional[int]] = None
+    """ Maximum size of the length prefixed integers """
     value: int
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        if self.STRUCT is not None:
+            buf += self.STRUCT.pack(self.value)
+        elif self.MAX_BYTES is not None:
+            encode_big_int_into(int(self.value), self.MAX_BYTES, buf)
+        else:
+            raise NotImplementedError()
+
 @dataclasses.dataclass
 class CL_I32(CL_Int):
     """
     CL type for 32-bit integer value.
     """
-    pass
+    TYPE_KEY = CL_TypeKey.I32
+    STRUCT = struct.Struct("<i")
 
 
 @dataclasses.dataclass
 class CL_I64(CL_Int):
     """
-    CL type for 32-bit integer value.
+    CL type for 64-bit integer value.
     """
-    pass
-
-@dataclasses.dataclass
-class CL_KeyType(enum.Enum):
-    """
-    CL type for key type.
-    """
-    ACCOUNT = 0
-    HASH = 1
-    UREF = 2
-
-    @staticmethod
-    def from_key(key: str) -> 'CL_KeyType':
-        if key.startswith(KEY_ACCOUNT_PREFIX):
-            return CL_KeyType.ACCOUNT
-        elif key.startswith(KEY_HASH_PREFIX):
-            return CL_KeyType.HASH
-        elif key.startswith(KEY_UREF_PREFIX):
-            return CL_KeyType.UREF
-        else:
-            raise ValueError(f"Invalid key: {key}")
-    
-    def __str__(self) -> str:
-        if self == CL_KeyType.ACCOUNT:
-            return KEY_ACCOUNT_PREFIX
-        elif self == CL_KeyType.HASH:
-            return KEY_HASH_PREFIX
-        elif self == CL_KeyType.UREF:
-            return KEY_UREF_PREFIX
-        else:
-            raise ValueError(f"Invalid key type: {self}")
-        
+    TYPE_KEY = CL_TypeKey.I64
+    STRUCT = struct.Struct("<q")
 
 @dataclasses.dataclass
 class CL_Key(CL_Value):
     """
     CL type for key value.
     """
+    TYPE_KEY = CL_TypeKey.KEY
     key_type: CL_KeyType
     value: bytes
     """ 32 bytes key """
+    access_rights: typing.Optional['CL_UrefAccessRights'] = None
+    """ Access rights of an uref key """
 
     def __eq__(self, other: object) -> bool:
-        return self.value == other.value and self.key_type == other.key_type
+        return self.value == other.value and self.key_type == other.key_type and self.access_rights == other.access_rights
+
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf.append(self.key_type.value)
+        buf += self.value
+        if self.key_type == CL_KeyType.UREF:
+            buf.append((self.access_rights or CL_UrefAccessRights.NONE).value)
 
     @staticmethod
     def from_string(key: str) -> 'CL_Key':
@@ -165,12 +179,10 @@ class CL_Key(CL_Value):
         Create CL_Key from string. Key could be in format:
         - account-hash-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c
         - hash-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c
-        - uref-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c
+        - uref-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c-007
         """
-        hex = key.split('-')[-1]
-        value = bytes.fromhex(hex)
-        key_type = CL_KeyType.from_key(key)
-        return CL_Key(key_type, value)
+        parsed = keys.from_string(key)
+        return CL_Key(parsed.key_type, parsed.value, getattr(parsed, "access_rights", None))
     
 
 @dataclasses.dataclass
@@ -179,10 +191,24 @@ class CL_List(CL_Value):
     CL type for list value.
     """
     value: typing.List[CL_Value]
+    item_type: typing.Optional[cl_types.CL_Type] = None
+    """ Type of the items, required to encode an empty list """
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf += U32.pack(len(self.value))
+        for item in self.value:
+            item.encode_value_into(buf)
+
+    def cl_type(self) -> cl_types.CL_Type:
+        if self.item_type is not None:
+            return cl_types.CL_ListType(self.item_type)
+        if not self.value:
+            raise ValueError("The item type of an empty list must be given")
+        return cl_types.CL_ListType(self.value[0].cl_type())
+
 
 @dataclasses.dataclass
 class CL_Map(CL_Value):
@@ -190,10 +216,26 @@ class CL_Map(CL_Value):
     CL type for map value. Key and value are CL_Value.
     """
     value: typing.List[typing.Tuple[CL_Value, CL_Value]]
+    key_type: typing.Optional[cl_types.CL_Type] = None
+    value_type: typing.Optional[cl_types.CL_Type] = None
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf += U32.pack(len(self.value))
+        for key, value in self.value:
+            key.encode_value_into(buf)
+            value.encode_value_into(buf)
+
+    def cl_type(self) -> cl_types.CL_Type:
+        if self.key_type is not None and self.value_type is not None:
+            return cl_types.CL_MapType(self.key_type, self.value_type)
+        if not self.value:
+            raise ValueError("The key and value types of an empty map must be given")
+        key, value = self.value[0]
+        return cl_types.CL_MapType(key.cl_type(), value.cl_type())
+
 @dataclasses.dataclass
 class CL_Union(CL_Value):
     """
@@ -205,50 +247,93 @@ class CL_Union(CL_Value):
     def __eq__(self, other: object) -> bool:
         return self.value == other.value and self.option_type == other.option_type
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        if self.value is None:
+            buf.append(0)
+        else:
+            buf.append(1)
+            self.value.encode_value_into(buf)
+
+    def cl_type(self) -> cl_types.CL_Type:
+        return cl_types.CL_OptionType(self.option_type)
+
 @dataclasses.dataclass
 class CL_PublicKey(CL_Value):
     """
     CL type for public key value.
     """
+    TYPE_KEY = CL_TypeKey.PUBLIC_KEY
     value: bytes
     algo: crypto_types.KeyAlgorithm
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value and self.algo == other.algo
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf.append(self.algo.value)
+        buf += self.value
+
 @dataclasses.dataclass
 class CL_Result(CL_Value):
     """
     CL type for result value coming from a function call.
     """
     value: object
+    is_ok: bool = True
+    result_type: typing.Optional[cl_types.CL_ResultType] = None
+
+    def __eq__(self, other: object) -> bool:
+        return self.value == other.value and self.is_ok == other.is_ok
+
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf.append(1 if self.is_ok else 0)
+        self.value.encode_value_into(buf)
+
+    def cl_type(self) -> cl_types.CL_Type:
+        if self.result_type is None:
+            raise ValueError("The result type must be given to encode a result")
+        return self.result_type
+
+@dataclasses.dataclass
+class CL_Tuple(CL_Value):
+    """
+    CL type for tuple value of 1 to 3 items.
+    """
+    value: typing.Tuple[CL_Value, ...]
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
+    def encode_value_into(self, buf: bytearray) -> None:
+        for item in self.value:
+            item.encode_value_into(buf)
+
+    def cl_type(self) -> cl_types.CL_Type:
+        return cl_types.CL_TupleType(tuple(item.cl_type() for item in self.value))
+
 @dataclasses.dataclass
 class CL_String(CL_Value):
     """
     CL type for string value.
     """
+    TYPE_KEY = CL_TypeKey.STRING
     value: str
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value
 
-    def encode_value(self) -> bytes:
-        """
-        Encode the value to a byte array.
-        """
+    def encode_value_into(self, buf: bytearray) -> None:
         encoded: bytes = (self.value or "").encode("utf-8")
-        return CL_U32(len(encoded)).encode_value() + encoded
+        buf += U32.pack(len(encoded))
+        buf += encoded
 
 @dataclasses.dataclass
 class CL_U8(CL_Int):
     """
     CL type for 8-bit integer value.
     """
-    pass
+    TYPE_KEY = CL_TypeKey.U8
+    STRUCT = struct.Struct("<B")
 
 @dataclasses.dataclass
 class CL_U16(CL_Int):
@@ -262,99 +347,102 @@ class CL_U32(CL_Int):
     """
     CL type for 32-bit integer value.
     """
-    
-    def encode_value(self) -> bytes:
-        return encode_int(self.value, (4, ), signed=False, trim=False)
+    TYPE_KEY = CL_TypeKey.U32
+    STRUCT = U32
 
 @dataclasses.dataclass
 class CL_U64(CL_Int):
     """
     CL type for 64-bit integer value.
     """
-    pass
+    TYPE_KEY = CL_TypeKey.U64
+    STRUCT = struct.Struct("<Q")
 
 @dataclasses.dataclass
 class CL_U128(CL_Int):
     """
     CL type for 128-bit integer value.
     """
-    pass
+    TYPE_KEY = CL_TypeKey.U128
+    MAX_BYTES = 16
 
 @dataclasses.dataclass
 class CL_U256(CL_Int):
     """
     CL type for 256-bit integer value.
     """
-    pass
+    TYPE_KEY = CL_TypeKey.U256
+    MAX_BYTES = 32
 
 @dataclasses.dataclass
 class CL_U512(CL_Int):
     """
     CL type for 512-bit integer value.
     """
-
-    def encode_value(self) -> bytes:
-        return encode_int(self.value, (1, 4, 8, 16, 32, 64), signed=False, trim=True)
-    
-    @staticmethod
-    def encode_type() -> bytes:
-        return bytes([CL_TypeKey.U512.value])
+    TYPE_KEY = CL_TypeKey.U512
+    MAX_BYTES = 64
 
 @dataclasses.dataclass
 class CL_Unit(CL_Value):
     """
     CL type for unit value (none value).
     """
-    pass
+    TYPE_KEY = CL_TypeKey.UNIT
 
-@dataclasses.dataclass
-class CL_UrefAccessRights(enum.Enum):
-    """
-    CL type for uref access rights value.
-    """
+    def encode_value_into(self, buf: bytearray) -> None:
+        pass
 
-    NONE = 0
-    READ = 1
-    WRITE = 2
-    ADD = 4
-    READ_WRITE = 3
-    READ_ADD = 5
-    ADD_WRITE = 6
-    READ_ADD_WRITE = 7
 
 @dataclasses.dataclass
 class CL_Uref(CL_Value):
     """
     CL type for uref value.
     """
+    TYPE_KEY = CL_TypeKey.UREF
     value: str
     access_rights: CL_UrefAccessRights
 
     def __eq__(self, other: object) -> bool:
         return self.value == other.value and self.access_rights == other.access_rights
+
+    def encode_value_into(self, buf: bytearray) -> None:
+        buf += bytes.fromhex(self.value) if isinstance(self.value, str) else self.value
+        buf.append(self.access_rights.value)
     
     @staticmethod
     def from_string(uref: str) -> 'CL_Uref':
         """
         Create CL_Uref from string. Uref could be in format:
-        - uref-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c-0
+        - uref-0c92e754d41013212318d26be504e0f491199b92bdf4ca375b92f8986d1cfd3c-007
         """
-        parts = uref.split('-')
-        access_rights = CL_UrefAccessRights(int(parts[-1]))
-        value = bytes.fromhex(parts[-2])
-        return CL_Uref(value, access_rights)
+        parsed = keys.from_string(uref)
+        if not isinstance(parsed, keys.URef):
+            raise ValueError(f"Invalid uref: {uref}")
+        return CL_Uref(parsed.value, parsed.access_rights)
 
 def encode_u8_array(values: typing.List[int]) -> bytes:
     """
     Encode list of 8-bit integers into bytes.
     """
-    return CL_U32(len(values)).encode_value() + bytes(values)
+    return U32.pack(len(values)) + bytes(values)
 
 def encode_vector(values: typing.List) -> bytes:
     """
-    Encode list of CL_Value into bytes.
+    Encode list of already encoded items into bytes.
     """
-    return CL_U32(len(values)).encode_value() + bytes([i for j in values for i in j])
+    return U32.pack(len(values)) + b"".join(values)
+
+def encode_big_int_into(value: int, max_bytes: int, buf: bytearray) -> None:
+    """
+    Append a length prefixed, trimmed little endian unsigned integer to the buffer.
+    """
+    if value < 0:
+        raise ValueError("Invalid integer: unsigned value expected")
+    length = (value.bit_length() + 7) // 8
+    if length > max_bytes:
+        raise ValueError("Invalid integer: max size exceeded")
+    buf.append(length)
+    buf += value.to_bytes(length, "little")
 
 def encode_int(
     value: int,
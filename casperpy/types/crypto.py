@@ -14,3 +14,23 @@ class HashAlgorithm(enum.Enum):
 
     """
     BLAKE2B = enum.auto()
+
+
+class Digest(bytes):
+    """A 32 bytes hash, such as a deploy or block hash.
+
+    Held as raw bytes rather than 64 hex characters, it compares and hashes
+    as the bytes and prints as its hex representation: use str(digest) or
+    Digest.from_hex at the boundary with hex strings.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_hex(cls, value: str) -> "Digest":
+        return cls(bytes.fromhex(value))
+
+    def __str__(self) -> str:
+        return self.hex()
+
+    def __repr__(self) -> str:
+        return f"Digest('{self.hex()}')"
@@ -1,5 +1,7 @@
 import dataclasses
+import datetime
 import enum
+import struct
 import typing
 import abc
 
@@ -19,15 +21,35 @@ class DeployArgument:
     def __eq__(self, other: object) -> bool:
         return self.name == other.name and self.value == other.value
 
+    def encode_into(self, buf: bytearray) -> None:
+        """
+        Append the argument to the buffer: its name, then its value as length prefixed bytes followed by its type.
+        """
+        cl_values.CL_String(self.name).encode_value_into(buf)
+        length_at = len(buf)
+        buf += bytes(4)
+        self.value.encode_value_into(buf)
+        cl_values.U32.pack_into(buf, length_at, len(buf) - length_at - 4)
+        self.value.cl_type().encode_into(buf)
+
     def encode_value(self) -> bytes:
         """
         Encode the argument to a byte array.
         """
-        print(f"Encoding argument {self.name}")
-        return cl_values.CL_String(self.name).encode_value() + \
-        cl_values.encode_u8_array(self.value.encode_value()) + \
-        self.value.encode_type()
-    
+        buf = bytearray()
+        self.encode_into(buf)
+        return bytes(buf)
+
+    def to_json(self) -> list:
+        """
+        Get the JSON representation of the argument, as sent to the node.
+        """
+        return [self.name, {
+            "cl_type": self.value.cl_type().to_json(),
+            "bytes": self.value.encode_value().hex(),
+            "parsed": None,
+        }]
+
 @dataclasses.dataclass
 class DeployExecutableItem:
     """
@@ -51,6 +73,15 @@ class DeployExecutableItem:
         else:
             raise ValueError("Invalid type for args: {}".format(type(self.args)))
 
+    def encode_args_into(self, buf: bytearray) -> None:
+        """
+        Append the runtime arguments to the buffer.
+        """
+        args = self.args_list
+        buf += cl_values.U32.pack(len(args))
+        for arg in args:
+            arg.encode_into(buf)
+
 @dataclasses.dataclass
 class ModuleBytes(DeployExecutableItem):
     """
@@ -61,12 +92,37 @@ class ModuleBytes(DeployExecutableItem):
     def __eq__(self, other: object) -> bool:
         return self.raw_wasm_payload == other.raw_wasm_payload
 
+    def encode_module_into(self, buf: bytearray) -> None:
+        """
+        Append the item tag and the length prefixed wasm payload to the buffer.
+        """
+        buf.append(0)
+        buf += cl_values.U32.pack(len(self.raw_wasm_payload))
+        buf += self.raw_wasm_payload
+
+    def encode_into(self, buf: bytearray) -> None:
+        """
+        Append the module bytes item to the buffer.
+        """
+        self.encode_module_into(buf)
+        self.encode_args_into(buf)
+
     def encode_value(self) -> bytes:
-        leading_byte = bytes([0])
-        length_byte = cl_values.CL_U32(len(self.raw_wasm_payload)).encode_value()
-        return bytes([0]) \
-            + cl_values.encode_u8_array(self.raw_wasm_payload)\
-            + cl_values.encode_vector([arg.encode_value() for arg in self.args_list])
+        """
+        Encode the module bytes item to a byte array.
+        """
+        buf = bytearray()
+        self.encode_into(buf)
+        return bytes(buf)
+
+    def to_json(self) -> dict:
+        """
+        Get the JSON representation of the item, as sent to the node.
+        """
+        return {"ModuleBytes": {
+            "module_bytes": self.raw_wasm_payload.hex(),
+            "args": [arg.to_json() for arg in self.args_list],
+        }}
 
 @dataclasses.dataclass
 class DeployApproval:
@@ -76,14 +132,75 @@ class DeployApproval:
     signer: str
     """Account that signed the deploy."""
     signature: bytes
-    signature_type = crypto_types.KeyAlgorithm
+    signature_type: crypto_types.KeyAlgorithm = crypto_types.KeyAlgorithm.ED25519
 
     def __eq__(self, other: object) -> bool:
         return self.signer == other.signer and self.signature == other.signature and self.signature_type == other.signature_type
 
     @property
     def signature_with_type(self) -> bytes:
-        return self.signature_type.value + self.signature
+        return bytes([self.signature_type.value]) + self.signature
+
+    def to_json(self) -> dict:
+        """
+        Get the JSON representation of the approval, as sent to the node.
+        """
+        return {"signer": self.signer, "signature": self.signature_with_type.hex()}
+
+@dataclasses.dataclass
+class DeployHeader:
+    """
+    Header of a deploy, its hash being the deploy hash.
+    """
+    account: cl_values.CL_PublicKey
+    """Public key of the account the deploy is executed in."""
+    timestamp: int
+    """Creation time, in milliseconds since epoch."""
+    ttl: int
+    """Time to live, in milliseconds."""
+    gas_price: int
+    body_hash: bytes
+    """Blake2b-256 hash of the serialized payment and session."""
+    dependencies: typing.List[bytes]
+    chain_name: str
+
+    def encode_into(self, buf: bytearray) -> None:
+        """
+        Append the serialized header to the buffer.
+        """
+        self.account.encode_value_into(buf)
+        buf += HEADER_NUMBERS.pack(self.timestamp, self.ttl, self.gas_price)
+        buf += self.body_hash
+        buf += cl_values.U32.pack(len(self.dependencies))
+        for dependency in self.dependencies:
+            buf += dependency
+        cl_values.CL_String(self.chain_name).encode_value_into(buf)
+
+    def encode_value(self) -> bytes:
+        """
+        Encode the header to a byte array.
+        """
+        buf = bytearray()
+        self.encode_into(buf)
+        return bytes(buf)
+
+    def to_json(self) -> dict:
+        """
+        Get the JSON representation of the header, as sent to the node.
+        """
+        timestamp = datetime.datetime.fromtimestamp(self.timestamp / 1000, tz=datetime.timezone.utc)
+        return {
+            "account": self.account.encode_value().hex(),
+            "timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.") + f"{self.timestamp % 1000:03d}Z",
+            "ttl": f"{self.ttl}ms",
+            "gas_price": self.gas_price,
+            "body_hash": self.body_hash.hex(),
+            "dependencies": [dependency.hex() for dependency in self.dependencies],
+            "chain_name": self.chain_name,
+        }
+
+HEADER_NUMBERS = struct.Struct("<QQQ")
+"""Layout of the timestamp, ttl and gas price of a header."""
 
 
 @dataclasses.dataclass
@@ -96,6 +213,19 @@ class Deploy:
     hash: bytes
     payment: DeployExecutableItem
     session: DeployExecutableItem
+    header: typing.Optional[DeployHeader] = None
 
     def __eq__(self, other: object) -> bool:
-        return self.approvals == other.approvals and self.hash == other.hash and self.payment == other.payment and self.session == other.session
\ No newline at end of file
+        return self.approvals == other.approvals and self.hash == other.hash and self.payment == other.payment and self.session == other.session
+
+    def to_json(self) -> dict:
+        """
+        Get the JSON representation of the deploy, as sent to the node.
+        """
+        return {
+            "hash": self.hash.hex(),
+            "header": self.header.to_json(),
+            "payment": self.payment.to_json(),
+            "session": self.session.to_json(),
+            "approvals": [approval.to_json() for approval in self.approvals],
+        }
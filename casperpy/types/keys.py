@@ -0,0 +1,218 @@
+import enum
+import typing
+import weakref
+
+KEY_ACCOUNT_PREFIX = "account-hash"
+KEY_HASH_PREFIX = "hash"
+KEY_UREF_PREFIX = "uref"
+KEY_TRANSFER_PREFIX = "transfer"
+KEY_DEPLOY_INFO_PREFIX = "deploy"
+KEY_ERA_INFO_PREFIX = "era"
+KEY_BALANCE_PREFIX = "balance"
+KEY_BID_PREFIX = "bid"
+KEY_WITHDRAW_PREFIX = "withdraw"
+KEY_DICTIONARY_PREFIX = "dictionary"
+
+class CL_KeyType(enum.Enum):
+    """
+    CL type for key type.
+    """
+    ACCOUNT = 0
+    HASH = 1
+    UREF = 2
+    TRANSFER = 3
+    DEPLOY_INFO = 4
+    ERA_INFO = 5
+    BALANCE = 6
+    BID = 7
+    WITHDRAW = 8
+    DICTIONARY = 9
+
+    @staticmethod
+    def from_key(key: str) -> 'CL_KeyType':
+        for key_type, prefix in KEY_PREFIXES.items():
+            if key.startswith(prefix + "-"):
+                return key_type
+        raise ValueError(f"Invalid key: {key}")
+
+    def __str__(self) -> str:
+        return KEY_PREFIXES[self]
+
+KEY_PREFIXES = {
+    CL_KeyType.ACCOUNT: KEY_ACCOUNT_PREFIX,
+    CL_KeyType.HASH: KEY_HASH_PREFIX,
+    CL_KeyType.UREF: KEY_UREF_PREFIX,
+    CL_KeyType.TRANSFER: KEY_TRANSFER_PREFIX,
+    CL_KeyType.DEPLOY_INFO: KEY_DEPLOY_INFO_PREFIX,
+    CL_KeyType.ERA_INFO: KEY_ERA_INFO_PREFIX,
+    CL_KeyType.BALANCE: KEY_BALANCE_PREFIX,
+    CL_KeyType.BID: KEY_BID_PREFIX,
+    CL_KeyType.WITHDRAW: KEY_WITHDRAW_PREFIX,
+    CL_KeyType.DICTIONARY: KEY_DICTIONARY_PREFIX,
+}
+"""String prefixes of the key types."""
+
+class CL_UrefAccessRights(enum.Enum):
+    """
+    CL type for uref access rights value.
+    """
+
+    NONE = 0
+    READ = 1
+    WRITE = 2
+    ADD = 4
+    READ_WRITE = 3
+    READ_ADD = 5
+    ADD_WRITE = 6
+    READ_ADD_WRITE = 7
+
+_interned: "weakref.WeakValueDictionary[tuple, Key]" = weakref.WeakValueDictionary()
+"""Keys in use by (class, key type, bytes, access rights)."""
+
+_parsed: "weakref.WeakValueDictionary[str, Key]" = weakref.WeakValueDictionary()
+"""Keys in use by the strings they were parsed from."""
+
+class Key:
+    """
+    Immutable key of global state: a key type and its bytes.
+
+    Keys are interned, creating a key equal to one still in use returns
+    that same object. Their hash is computed once, so they are cheap dict
+    and set keys. A key prints as its string form, e.g. "hash-0c92...3c",
+    but only compares equal to keys: use str(key) or from_string at the
+    boundary with strings.
+    """
+    __slots__ = ("key_type", "value", "_hash", "__weakref__")
+
+    key_type: CL_KeyType
+    value: bytes
+    """32 bytes, or the 8 bytes little endian era id of an era info key."""
+
+    def __new__(cls, key_type: CL_KeyType, value: bytes) -> "Key":
+        return cls._intern((cls, key_type, bytes(value), None), key_type, value)
+
+    @classmethod
+    def _intern(cls, ident: tuple, key_type: CL_KeyType, value: bytes, *extra: typing.Any) -> "Key":
+        key = _interned.get(ident)
+        if key is None:
+            key = object.__new__(cls)
+            object.__setattr__(key, "key_type", key_type)
+            object.__setattr__(key, "value", bytes(value))
+            key._init_extra(*extra)
+            object.__setattr__(key, "_hash", hash(ident))
+            key = _interned.setdefault(ident, key)
+        return key
+
+    def _init_extra(self) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple:
+        return Key, (self.key_type, self.value)
+
+    def _ident(self) -> tuple:
+        return (type(self), self.key_type, self.value, getattr(self, "access_rights", None))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Key):
+            return self._hash == other._hash and self._ident() == other._ident()
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __str__(self) -> str:
+        if self.key_type == CL_KeyType.ERA_INFO:
+            return f"{KEY_ERA_INFO_PREFIX}-{int.from_bytes(self.value, 'little')}"
+        return f"{KEY_PREFIXES[self.key_type]}-{self.value.hex()}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+class AccountHash(Key):
+    """
+    Hash of the public key of an account.
+    """
+    __slots__ = ()
+
+    def __new__(cls, value: bytes) -> "AccountHash":
+        return cls._intern((cls, CL_KeyType.ACCOUNT, bytes(value), None), CL_KeyType.ACCOUNT, value)
+
+    def __reduce__(self) -> tuple:
+        return AccountHash, (self.value,)
+
+class Hash(Key):
+    """
+    Hash of a contract, contract package or contract wasm.
+    """
+    __slots__ = ()
+
+    def __new__(cls, value: bytes) -> "Hash":
+        return cls._intern((cls, CL_KeyType.HASH, bytes(value), None), CL_KeyType.HASH, value)
+
+    def __reduce__(self) -> tuple:
+        return Hash, (self.value,)
+
+class URef(Key):
+    """
+    Unforgeable reference to a value, with the rights it grants on it.
+    """
+    __slots__ = ("access_rights",)
+
+    access_rights: CL_UrefAccessRights
+
+    def __new__(cls, value: bytes, access_rights: CL_UrefAccessRights = CL_UrefAccessRights.NONE) -> "URef":
+        return cls._intern((cls, CL_KeyType.UREF, bytes(value), access_rights), CL_KeyType.UREF, value, access_rights)
+
+    def _init_extra(self, access_rights: CL_UrefAccessRights) -> None:
+        object.__setattr__(self, "access_rights", access_rights)
+
+    def __reduce__(self) -> tuple:
+        return URef, (self.value, self.access_rights)
+
+    def __str__(self) -> str:
+        return f"{KEY_UREF_PREFIX}-{self.value.hex()}-{self.access_rights.value:03o}"
+
+def from_string(key: str) -> Key:
+    """
+    Get the key of its string form, e.g. account-hash-<hex>, hash-<hex>, uref-<hex>-007 or era-<id>.
+
+    Strings already parsed are looked up without parsing them again while their key is in use.
+    """
+    parsed = _parsed.get(key)
+    if parsed is not None:
+        return parsed
+    key_type = CL_KeyType.from_key(key)
+    body = key[len(KEY_PREFIXES[key_type]) + 1:]
+    if key_type == CL_KeyType.UREF:
+        value, _, access_rights = body.rpartition("-")
+        parsed = URef(bytes.fromhex(value), CL_UrefAccessRights(int(access_rights, 8)))
+    elif key_type == CL_KeyType.ACCOUNT:
+        parsed = AccountHash(bytes.fromhex(body))
+    elif key_type == CL_KeyType.HASH:
+        parsed = Hash(bytes.fromhex(body))
+    elif key_type == CL_KeyType.ERA_INFO:
+        parsed = Key(key_type, int(body).to_bytes(8, "little"))
+    else:
+        parsed = Key(key_type, bytes.fromhex(body))
+    return _parsed.setdefault(key, parsed)
+
+def of(key_type: CL_KeyType, value: bytes, access_rights: typing.Optional[CL_UrefAccessRights] = None) -> Key:
+    """
+    Get the key of the key type and bytes, as its AccountHash, Hash or URef class if any.
+    """
+    if key_type == CL_KeyType.ACCOUNT:
+        return AccountHash(value)
+    elif key_type == CL_KeyType.HASH:
+        return Hash(value)
+    elif key_type == CL_KeyType.UREF:
+        return URef(value, access_rights or CL_UrefAccessRights.NONE)
+    return Key(key_type, value)
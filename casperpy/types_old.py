@@ -1,9 +1,70 @@
+import collections.abc
 import dataclasses
-from sys import api_version
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Sequence, TypeVar, Union
 import enum
+import sys
 from abc import ABC, abstractclassmethod
 
+import casperpy.types.bytesrepr as bytesrepr
+import casperpy.types.cl_types as cl_types
+import casperpy.types.cl_values as cl_values
+import casperpy.types.crypto as crypto_types
+import casperpy.types.keys as keys
+
+T = TypeVar("T")
+
+Digest = crypto_types.Digest
+
+def digest_or_none(value: Optional[str]) -> Optional[Digest]:
+    """
+    Get the Digest of an optional hex hash.
+    """
+    return None if value is None else Digest.from_hex(value)
+
+class LazyList(collections.abc.Sequence):
+    """
+    List of raw JSON items, each turned into a dataclass on first access.
+    """
+    __slots__ = ("_raw", "_convert", "_items")
+
+    def __init__(self, raw: list, convert: Callable[[dict], T]) -> None:
+        self._raw = raw
+        self._convert = convert
+        self._items: Optional[list] = None
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        if self._items is None:
+            self._items = [None] * len(self._raw)
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._convert(self._raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self._raw)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+def decode_list(raw: list, convert: Callable[[dict], T], lazy: bool) -> Sequence[T]:
+    """
+    Turn a list of raw JSON items into dataclasses, now or on access if lazy.
+    """
+    if lazy:
+        return LazyList(raw, convert)
+    return list(map(convert, raw))
+
 class CL_TypeKey(enum.Enum):
     """
     Enumeration over set of CL type keys.
@@ -34,13 +95,13 @@ class CL_TypeKey(enum.Enum):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChainGetStateRootHashResponse:
     """
     The state root hash of the chain.
     """
     api_version: str
-    state_root_hash: str
+    state_root_hash: Digest
 
     @classmethod
     def from_json(cls, d: dict) -> "ChainGetStateRootHashResponse":
@@ -49,27 +110,45 @@ class ChainGetStateRootHashResponse:
         """
         return ChainGetStateRootHashResponse(
             api_version=d["api_version"],
-            state_root_hash=d["state_root_hash"]
+            state_root_hash=Digest.from_hex(d["state_root_hash"])
         )
     
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
+class AccountPutDeployResponse:
+    """
+    The hash of a deploy accepted by the node.
+    """
+    api_version: str
+    deploy_hash: Digest
+
+    @classmethod
+    def from_json(cls, d: dict) -> "AccountPutDeployResponse":
+        """
+        Create an AccountPutDeployResponse from the API response.
+        """
+        return AccountPutDeployResponse(
+            api_version=d["api_version"],
+            deploy_hash=Digest.from_hex(d["deploy_hash"])
+        )
+
+@dataclasses.dataclass(slots=True)
 class NamedKey:
     """
     A named key.
     """
     name: str
-    key: str
+    key: keys.Key
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssociatedKey:
     """
     An associated key.
     """
 
-    account_hash: str
+    account_hash: keys.AccountHash
     weight: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ActionThresholds:
     """
     The action thresholds.
@@ -77,18 +156,18 @@ class ActionThresholds:
     deployment: int
     key_management: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Account:
     """
     The account info of the public key.
     """
-    account_hash: str
+    account_hash: keys.AccountHash
     named_keys: List[NamedKey]
-    main_purse: str
+    main_purse: keys.URef
     associated_keys: List[AssociatedKey]
     action_thresholds: ActionThresholds
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StateGetAccountInfoResponse:
     """
     The account info of the public key.
@@ -104,10 +183,10 @@ class StateGetAccountInfoResponse:
         """
         api_version=d['api_version']
         account = Account(
-            account_hash=d["account"]["account_hash"],
-            named_keys=[NamedKey(**key) for key in d["account"]["named_keys"]],
-            main_purse=d["account"]["main_purse"],
-            associated_keys=[AssociatedKey(**key) for key in d["account"]["associated_keys"]],
+            account_hash=keys.from_string(d["account"]["account_hash"]),
+            named_keys=[NamedKey(key["name"], keys.from_string(key["key"])) for key in d["account"]["named_keys"]],
+            main_purse=keys.from_string(d["account"]["main_purse"]),
+            associated_keys=[AssociatedKey(keys.from_string(key["account_hash"]), key["weight"]) for key in d["account"]["associated_keys"]],
             action_thresholds=ActionThresholds(**d["account"]["action_thresholds"])
         )
         merkle_proof=d['merkle_proof']
@@ -117,7 +196,7 @@ class StateGetAccountInfoResponse:
             merkle_proof,
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Approval:
     """
     The approval info deploy.
@@ -135,15 +214,15 @@ class Approval:
             signer=d["signer"]
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeployHeader:
     """
     The deploy header.
     """
     account: str
-    body_hash: str
+    body_hash: Digest
     chain_name: str
-    dependencies: List[str]
+    dependencies: List[Digest]
     gas_price: int
     timestamp: str
     ttl: str
@@ -155,27 +234,44 @@ class DeployHeader:
         """
         return DeployHeader(
             account=d["account"],
-            body_hash=d["body_hash"],
+            body_hash=Digest.from_hex(d["body_hash"]),
             chain_name=d["chain_name"],
-            dependencies=d["dependencies"],
+            dependencies=list(map(Digest.from_hex, d["dependencies"])),
             gas_price=d["gas_price"],
             timestamp=d["timestamp"],
             ttl=d["ttl"]
         )
 
-@dataclasses.dataclass
-class Transfer:
+@dataclasses.dataclass(slots=True)
+class BlockTransfer:
     """Represents a transfer from one purse to another."""
     amount: int
-    deploy_hash: str
-    sender: str
+    deploy_hash: Digest
+    sender: keys.AccountHash
     """Sender is named `from` in the docs, but that's a reserved keyword."""
     gas: int
     id: Optional[int]
-    source: str
-    to: Optional[str]
+    source: keys.URef
+    target: keys.URef
+    to: Optional[keys.AccountHash]
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'BlockTransfer':
+        """
+        Create a BlockTransfer from the API response.
+        """
+        return BlockTransfer(
+            amount=int(d["amount"]),
+            deploy_hash=Digest.from_hex(d["deploy_hash"]),
+            sender=keys.from_string(d["from"]),
+            gas=int(d["gas"]),
+            id=d.get("id"),
+            source=keys.from_string(d["source"]),
+            target=keys.from_string(d["target"]),
+            to=None if d.get("to") is None else keys.from_string(d["to"])
+        )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CLType:
     """A Casper value, i.e. a value which can be stored and manipulated by smart contracts.\n\nIt holds the underlying data as a type-erased, serialized `Vec<u8>` and also holds the CLType of the underlying data as a separate member.\n\nThe `parsed` field, representing the original value, is a convenience only available when a CLValue is encoded to JSON, and can always be set to null if preferred."""
     bytes: str
@@ -193,7 +289,13 @@ class CLType:
             parsed=d["parsed"] if "parsed" in d else None
         )
 
-@dataclasses.dataclass
+    def decode(self) -> cl_values.CL_Value:
+        """
+        Decode the hex encoded bytes into a typed CL value.
+        """
+        return bytesrepr.from_bytes(cl_types.from_json(self.cl_type), bytes.fromhex(self.bytes))
+
+@dataclasses.dataclass(slots=True)
 class NamedArg:
     """Named arguments to a contract."""
     name: str
@@ -211,6 +313,8 @@ class NamedArg:
 
 
 class ExecutableDeployItem(ABC):
+    __slots__ = ()
+
     @abstractclassmethod
     def from_json(cls, d: dict) -> 'ExecutableDeployItem':
         """
@@ -232,7 +336,7 @@ class ExecutableDeployItem(ABC):
         """
         pass
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModuleBytes(ExecutableDeployItem):
     """ specified as raw bytes that represent WASM code and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
@@ -255,11 +359,11 @@ class ModuleBytes(ExecutableDeployItem):
             module_bytes=d["module_bytes"]
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StoredContractByHash(ExecutableDeployItem):
     """Stored contract referenced by its [`ContractHash`], entry point and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
-    hash: str
+    hash: Digest
     entry_point: str
 
     def get_type(self) -> str:
@@ -275,11 +379,11 @@ class StoredContractByHash(ExecutableDeployItem):
         """
         return StoredContractByHash(
             args=list(map(NamedArg.from_json, d["args"])),
-            hash=d["hash"],
+            hash=Digest.from_hex(d["hash"]),
             entry_point=d["entry_point"]
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StoredContractByName(ExecutableDeployItem):
     """Stored contract referenced by a named key existing in the signer's account context, entry point and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
@@ -303,11 +407,11 @@ class StoredContractByName(ExecutableDeployItem):
             entry_point=d["entry_point"]
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StoredVersionedContractByHash(ExecutableDeployItem):
     """Stored versioned contract referenced by its [`ContractPackageHash`], entry point and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
-    hash: str
+    hash: Digest
     entry_point: str
     version: Optional[int]
 
@@ -324,12 +428,12 @@ class StoredVersionedContractByHash(ExecutableDeployItem):
         """
         return StoredVersionedContractByHash(
             args=list(map(NamedArg.from_json, d["args"])),
-            hash=d["hash"],
+            hash=Digest.from_hex(d["hash"]),
             entry_point=d["entry_point"],
             version=d["version"]
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StoredVersionedContractByName(ExecutableDeployItem):
     """Stored versioned contract referenced by its [`ContractPackageName`], entry point and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
@@ -356,7 +460,7 @@ class StoredVersionedContractByName(ExecutableDeployItem):
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Transfer(ExecutableDeployItem):
     """Stored versioned contract referenced by its [`ContractPackageName`], entry point and an instance of [`RuntimeArgs`]."""
     args: List[NamedArg]
@@ -376,38 +480,40 @@ class Transfer(ExecutableDeployItem):
             args=list(map(NamedArg.from_json, d["args"]))
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Operation:
     """
     The operation info deploy.
     """
-    key: str
+    key: keys.Key
     kind: str # Write or Read
 
     @classmethod
     def from_json(cls, d: dict) -> 'Operation':
         return cls(
-            key=d["key"],
-            kind=d["kind"],
+            key=keys.from_string(d["key"]),
+            kind=sys.intern(d["kind"]),
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Transform:
     """
     The transforms info deploy.
     """
-    key: str
+    key: keys.Key
     transform: str | dict
 
     @classmethod
     def from_json(cls, d: dict) -> 'Transform':
+        transform = d["transform"]
         return cls(
-            key=d["key"],
-            transform=d["transform"]
+            key=keys.from_string(d["key"]),
+            # Unit transforms such as "Identity" are shared by every instance.
+            transform=sys.intern(transform) if isinstance(transform, str) else transform
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExecutionEffect:
     """
     The execution effect info deploy.
@@ -416,26 +522,26 @@ class ExecutionEffect:
     transforms: List[Transform]
 
     @classmethod
-    def from_json(cls, d: dict) -> 'ExecutionEffect':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ExecutionEffect':
         return cls(
-            operations=list(map(Operation.from_json, d["operations"])),
-            transforms=list(map(Transform.from_json, d["transforms"])),
+            operations=decode_list(d["operations"], Operation.from_json, lazy),
+            transforms=decode_list(d["transforms"], Transform.from_json, lazy),
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExecutionResult(ABC):
     """
     The execution result type info deploy.
     """
     
     @abstractclassmethod
-    def from_json(cls, d: dict) -> 'ExecutionResult':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ExecutionResult':
         """
         Create an ExecutionResult from the API response.
         """
         pass
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExecutionResultFailure(ExecutionResult):
     """
     The result of a failed execution.
@@ -443,33 +549,33 @@ class ExecutionResultFailure(ExecutionResult):
     cost: int
     effect: ExecutionEffect
     error_message: str
-    transfers: List[str]
+    transfers: List[keys.Key]
 
     @classmethod
-    def from_json(cls, d: dict) -> 'ExecutionResultFailure':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ExecutionResultFailure':
         return cls(
             cost=d['cost'],
-            effect=ExecutionEffect.from_json(d['effect']),
+            effect=ExecutionEffect.from_json(d['effect'], lazy),
             error_message=d['error_message'],
-            transfers=d['transfers']
+            transfers=list(map(keys.from_string, d['transfers']))
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExecutionResultSuccess(ExecutionResult):
     """
     The result of a successful execution.
     """
     cost: int
     effect: ExecutionEffect
-    transfers: List[str]
+    transfers: List[keys.Key]
 
     @classmethod
-    def from_json(cls, d: dict) -> 'ExecutionResultSuccess':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ExecutionResultSuccess':
         return cls(
             cost=d['cost'],
-            effect=ExecutionEffect.from_json(d['effect']),
-            transfers=d['transfers']
+            effect=ExecutionEffect.from_json(d['effect'], lazy),
+            transfers=list(map(keys.from_string, d['transfers']))
         )
 
 execution_result_type_map = {
@@ -477,22 +583,22 @@ execution_result_type_map = {
     "Failure": ExecutionResultFailure
 }
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExecutionResultWrapper:
     """
     The execution result of a single deploy.
     """
-    block_hash: str
+    block_hash: Digest
     result: ExecutionResult
 
     @classmethod
-    def from_json(cls, d: dict) -> 'ExecutionResultWrapper':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ExecutionResultWrapper':
         result_name = list(d["result"].keys())[0]
         result_class = execution_result_type_map[result_name]
-        result = result_class.from_json(d["result"][result_name])
+        result = result_class.from_json(d["result"][result_name], lazy)
 
         return cls(
-            block_hash=d['block_hash'],
+            block_hash=Digest.from_hex(d['block_hash']),
             result=result,
         )
 
@@ -505,19 +611,19 @@ deploy_item_type_map = {
     "Transfer": Transfer,
 }
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Deploy:
     """
     The deploy info of the deploy hash.
     """
     approvals: List[Approval]
-    hash: str
+    hash: Digest
     header: DeployHeader
     payment: ExecutableDeployItem
     session: ExecutableDeployItem
 
     @classmethod
-    def from_json(cls, d: dict) -> 'Deploy':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'Deploy':
         """
         Create a Deploy from the API response.
         """
@@ -527,14 +633,14 @@ class Deploy:
         session_class = deploy_item_type_map[session_name]
 
         return cls(
-            approvals=list(map(Approval.from_json, d['approvals'])),
-            hash=d['hash'],
+            approvals=decode_list(d['approvals'], Approval.from_json, lazy),
+            hash=Digest.from_hex(d['hash']),
             header=DeployHeader.from_json(d['header']),
             payment=payment_class.from_json(d['payment'][payment_name]),
             session=session_class.from_json(d['session'][session_name])
         )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class InfoGetDeployResponse:
     """
     The deploy info of the deploy hash.
@@ -544,12 +650,229 @@ class InfoGetDeployResponse:
     execution_results: List[ExecutionResultWrapper]
 
     @classmethod
-    def from_json(cls, d: dict) -> 'InfoGetDeployResponse':
+    def from_json(cls, d: dict, lazy: bool = False) -> 'InfoGetDeployResponse':
         """
         Create a InfoGetDeployResponse from the API response.
+
+        With lazy, the nested lists (execution results, operations,
+        transforms, approvals) keep their raw JSON items and build each
+        dataclass on first access.
         """
         return cls(
             api_version=d['api_version'],
-            deploy=Deploy.from_json(d['deploy']),
-            execution_results=list(map(ExecutionResultWrapper.from_json, d['execution_results']))
-        )
\ No newline at end of file
+            deploy=Deploy.from_json(d['deploy'], lazy),
+            execution_results=decode_list(
+                d['execution_results'],
+                lambda result: ExecutionResultWrapper.from_json(result, lazy),
+                lazy,
+            )
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class ValidatorWeight:
+    """
+    The weight of a validator in the next era.
+    """
+    validator: str
+    weight: int
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'ValidatorWeight':
+        return cls(validator=d["validator"], weight=int(d["weight"]))
+
+@dataclasses.dataclass(slots=True)
+class Reward:
+    """
+    The reward of a validator for an era.
+    """
+    validator: str
+    amount: int
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'Reward':
+        return cls(validator=d["validator"], amount=d["amount"])
+
+@dataclasses.dataclass(slots=True)
+class EraEnd:
+    """
+    The end of era report, set on the switch block of an era.
+    """
+    equivocators: List[str]
+    inactive_validators: List[str]
+    rewards: List[Reward]
+    next_era_validator_weights: List[ValidatorWeight]
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'EraEnd':
+        """
+        Create an EraEnd from the API response.
+        """
+        report = d["era_report"]
+        return cls(
+            equivocators=report["equivocators"],
+            inactive_validators=report["inactive_validators"],
+            rewards=list(map(Reward.from_json, report["rewards"])),
+            next_era_validator_weights=list(map(ValidatorWeight.from_json, d["next_era_validator_weights"]))
+        )
+
+@dataclasses.dataclass(slots=True)
+class BlockHeader:
+    """
+    The block header.
+    """
+    accumulated_seed: Digest
+    body_hash: Digest
+    era_end: Optional[EraEnd]
+    era_id: int
+    height: int
+    parent_hash: Digest
+    protocol_version: str
+    random_bit: bool
+    state_root_hash: Digest
+    timestamp: str
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'BlockHeader':
+        """
+        Create a BlockHeader from the API response.
+        """
+        return cls(
+            accumulated_seed=Digest.from_hex(d["accumulated_seed"]),
+            body_hash=Digest.from_hex(d["body_hash"]),
+            era_end=EraEnd.from_json(d["era_end"]) if d.get("era_end") else None,
+            era_id=d["era_id"],
+            height=d["height"],
+            parent_hash=Digest.from_hex(d["parent_hash"]),
+            protocol_version=d["protocol_version"],
+            random_bit=d["random_bit"],
+            state_root_hash=Digest.from_hex(d["state_root_hash"]),
+            timestamp=d["timestamp"]
+        )
+
+@dataclasses.dataclass(slots=True)
+class BlockBody:
+    """
+    The block body.
+    """
+    deploy_hashes: List[Digest]
+    proposer: str
+    transfer_hashes: List[Digest]
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'BlockBody':
+        return cls(
+            deploy_hashes=list(map(Digest.from_hex, d["deploy_hashes"])),
+            proposer=d["proposer"],
+            transfer_hashes=list(map(Digest.from_hex, d["transfer_hashes"]))
+        )
+
+@dataclasses.dataclass(slots=True)
+class BlockProof:
+    """
+    A finality signature of the block.
+    """
+    public_key: str
+    signature: str
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'BlockProof':
+        return cls(public_key=d["public_key"], signature=d["signature"])
+
+@dataclasses.dataclass(slots=True)
+class Block:
+    """
+    A block of the chain.
+    """
+    body: BlockBody
+    hash: Digest
+    header: BlockHeader
+    proofs: List[BlockProof]
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> 'Block':
+        """
+        Create a Block from the API response, building the proofs on access if lazy.
+        """
+        return cls(
+            body=BlockBody.from_json(d["body"]),
+            hash=Digest.from_hex(d["hash"]),
+            header=BlockHeader.from_json(d["header"]),
+            proofs=decode_list(d["proofs"], BlockProof.from_json, lazy)
+        )
+
+BlockIdentifier = Union[str, int]
+"""A block hash or a block height."""
+
+def block_params(block: Optional[BlockIdentifier]) -> dict:
+    """
+    Get the JSON RPC params identifying the block, the latest block if None.
+    """
+    if block is None:
+        return {}
+    if isinstance(block, int):
+        return {"block_identifier": {"Height": block}}
+    return {"block_identifier": {"Hash": str(block)}}
+
+def state_item_params(state_root_hash: str, key: str, path: Optional[List[str]] = None) -> dict:
+    """
+    Get the JSON RPC params of a state_get_item request.
+    """
+    params = {"state_root_hash": str(state_root_hash), "key": str(key)}
+    if path:
+        params["path"] = list(path)
+    return params
+
+def global_state_params(key: str, path: Optional[List[str]] = None, state_root_hash: Optional[str] = None, block_hash: Optional[str] = None) -> dict:
+    """
+    Get the JSON RPC params of a query_global_state request, at the state root hash or else at the block.
+    """
+    if state_root_hash is not None:
+        state_identifier = {"StateRootHash": str(state_root_hash)}
+    elif block_hash is not None:
+        state_identifier = {"BlockHash": str(block_hash)}
+    else:
+        raise ValueError("A state root hash or a block hash is required")
+    params = {"state_identifier": state_identifier, "key": str(key)}
+    if path:
+        params["path"] = list(path)
+    return params
+
+@dataclasses.dataclass(slots=True)
+class ChainGetBlockResponse:
+    """
+    The block of the block identifier.
+    """
+    api_version: str
+    block: Optional[Block]
+
+    @classmethod
+    def from_json(cls, d: dict, lazy: bool = False) -> 'ChainGetBlockResponse':
+        """
+        Create a ChainGetBlockResponse from the API response.
+        """
+        return cls(
+            api_version=d["api_version"],
+            block=Block.from_json(d["block"], lazy) if d.get("block") else None
+        )
+
+@dataclasses.dataclass(slots=True)
+class ChainGetBlockTransfersResponse:
+    """
+    The transfers of the block of the block identifier.
+    """
+    api_version: str
+    block_hash: Optional[Digest]
+    transfers: Optional[List[BlockTransfer]]
+
+    @classmethod
+    def from_json(cls, d: dict) -> 'ChainGetBlockTransfersResponse':
+        """
+        Create a ChainGetBlockTransfersResponse from the API response.
+        """
+        transfers = d.get("transfers")
+        return cls(
+            api_version=d["api_version"],
+            block_hash=digest_or_none(d.get("block_hash")),
+            transfers=None if transfers is None else list(map(BlockTransfer.from_json, transfers))
+        )
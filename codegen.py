@@ -0,0 +1,483 @@
+import argparse
+import json
+import keyword
+import re
+import textwrap
+import typing
+
+SCHEMA_PATH = "docs/rpc_schema_hashing_V2.json"
+OUTPUT_PATH = "casperpy/generated.py"
+
+LEAF_CONVERTERS = {
+    "Digest": "Digest.from_hex",
+    "U128": "int",
+    "U256": "int",
+    "U512": "int",
+    "AccountHash": "keys.from_string",
+    "URef": "keys.from_string",
+    "TransferAddr": "keys.from_string",
+}
+"""Converters of the string schemas, by schema name. Schemas aliasing them with allOf convert the same way."""
+
+LEAF_TYPES = {
+    "Digest": "Digest",
+    "U128": "int",
+    "U256": "int",
+    "U512": "int",
+    "AccountHash": "keys.Key",
+    "URef": "keys.Key",
+    "TransferAddr": "keys.Key",
+}
+"""Python types of the converted string schemas."""
+
+FORMATTED_TYPES = {
+    "Timestamp": "str",
+    "TimeDiff": "str",
+}
+"""Types of the schemas the node sends formatted, e.g. 2020-11-17T00:39:24.072Z or 1h, rather than as the integers of the schema."""
+
+FIELD_CONVERTERS = {
+    ("NamedKey", "key"): ("keys.from_string", "keys.Key"),
+    ("Operation", "key"): ("keys.from_string", "keys.Key"),
+    ("TransformEntry", "key"): ("keys.from_string", "keys.Key"),
+}
+"""Converters of the formatted key strings the schema types as plain strings, by (schema, property)."""
+
+PARAM_ENCODERS = {
+    "Digest": ("typing.Union[str, Digest]", "str({})"),
+    "Deploy": ("deploy_types.Deploy", "{}.to_json()"),
+}
+"""Python types and JSON encoding of the parameters, by schema name."""
+
+SRC = "\0"
+"""Stands for the JSON value in the code of a field, until the expression reading it is known."""
+
+JSON_TYPES = {"string": "str", "integer": "int", "number": "float", "boolean": "bool"}
+
+HEADER = '''\
+# Generated by codegen.py from {schema}, do not edit.
+import dataclasses
+import typing
+from sys import intern
+from .types.crypto import Digest
+import casperpy.types.deploy as deploy_types
+import casperpy.types.keys as keys
+'''
+
+def snake(name: str) -> str:
+    """
+    Snake case of a CamelCase schema name, e.g. JsonBlockHeader to json_block_header.
+    """
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+
+def camel(name: str) -> str:
+    """
+    CamelCase of a snake case method name, e.g. info_get_deploy to InfoGetDeploy.
+    """
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+def identifier(name: str) -> str:
+    """
+    Python identifier of a property name.
+    """
+    return name + "_" if keyword.iskeyword(name) else name
+
+def clean(text: str) -> str:
+    """
+    The description on a single line, safe to put in a docstring.
+    """
+    text = " ".join(text.replace('"""', "'''").split())
+    return text[:-1] + '\\"' if text.endswith('"') else text
+
+def docstring(text: typing.Optional[str], indent: str) -> typing.List[str]:
+    """
+    Lines of a docstring for the description, empty if none.
+    """
+    if not text:
+        return []
+    text = clean(text)
+    lines = textwrap.wrap(text, 100 - len(indent))
+    return [f'{indent}"""'] + [indent + line for line in lines] + [f'{indent}"""']
+
+def ref_name(schema: dict) -> str:
+    return schema["$ref"].rsplit("/", 1)[1]
+
+class Generator:
+    """
+    Generates the models, parsers and typed methods of an OpenRPC schema.
+
+    Every model is a slotted dataclass built by a parse function written
+    out for it: fields are read straight from the JSON object, nested
+    models are built by calling their own parse function, lists of plain
+    values are kept as decoded. Unions tagged by a single key, like
+    StoredValue or Transform, are parsed into a (kind, value) model by
+    comparing the tag to each variant in turn.
+    """
+    def __init__(self, schema: dict) -> None:
+        self.methods = schema["methods"]
+        self.schemas: typing.Dict[str, typing.Any] = schema["components"]["schemas"]
+        self.models: typing.Dict[str, typing.Tuple[dict, str]] = {}
+        """Schemas to generate a model and a parser for, by model name, with their kind."""
+        self.queue: typing.List[str] = []
+
+    def resolve(self, schema: typing.Any) -> typing.Any:
+        """
+        Follow the single entry allOf wrappers the schema uses to document a reference.
+        """
+        while isinstance(schema, dict) and "allOf" in schema and len(schema["allOf"]) == 1:
+            schema = schema["allOf"][0]
+        return schema
+
+    def leaf(self, name: str) -> typing.Optional[str]:
+        """
+        Name of the converted string schema the named schema aliases, if any.
+        """
+        while True:
+            if name in LEAF_CONVERTERS:
+                return name
+            schema = self.resolve(self.schemas[name])
+            if "$ref" not in schema:
+                return None
+            name = ref_name(schema)
+
+    def split_nullable(self, schema: typing.Any) -> typing.Tuple[typing.Any, bool]:
+        """
+        The schema without its null alternative, and whether it had one.
+        """
+        schema = self.resolve(schema)
+        if not isinstance(schema, dict):
+            return schema, False
+        variants = schema.get("anyOf")
+        if variants and len(variants) == 2 and {"type": "null"} in variants:
+            return next(variant for variant in variants if variant != {"type": "null"}), True
+        types = schema.get("type")
+        if isinstance(types, list) and "null" in types:
+            rest = [t for t in types if t != "null"]
+            return dict(schema, type=rest[0] if len(rest) == 1 else rest), True
+        return schema, False
+
+    def is_tagged_union(self, schema: dict) -> bool:
+        """
+        Whether every alternative of the union is a string enum or an object with a single required property.
+        """
+        for variant in schema.get("anyOf", ()):
+            if variant.get("type") == "string" and "enum" in variant:
+                continue
+            if variant.get("type") == "object" and len(variant.get("properties", {})) == 1 and variant.get("required") == list(variant["properties"]):
+                continue
+            return False
+        return "anyOf" in schema
+
+    def model_kind(self, schema: dict) -> typing.Optional[str]:
+        """
+        Kind of model generated for the schema: object, union or tuple, None if kept as decoded.
+        """
+        if schema.get("type") == "object" and schema.get("properties"):
+            return "object"
+        if self.is_tagged_union(schema):
+            return "union"
+        if schema.get("type") == "array" and isinstance(schema.get("items"), list):
+            return "tuple"
+        return None
+
+    def need(self, name: str, schema: dict, kind: str) -> str:
+        """
+        Queue the model of the schema, returning the name of its parse function.
+        """
+        if name not in self.models:
+            self.models[name] = (schema, kind)
+            self.queue.append(name)
+        return f"parse_{snake(name)}"
+
+    def convert(self, schema: typing.Any, src: str, context: str, depth: int = 0) -> typing.Optional[str]:
+        """
+        Code building the model of the JSON value src, None if the value is kept as decoded.
+
+        context names the models of inline object schemas.
+        """
+        schema = self.resolve(schema)
+        if not isinstance(schema, dict):
+            return None
+        if "$ref" in schema:
+            name = ref_name(schema)
+            leaf = self.leaf(name)
+            if leaf is not None:
+                return f"{LEAF_CONVERTERS[leaf]}({src})"
+            target = self.resolve(self.schemas[name])
+            kind = self.model_kind(target)
+            if kind is not None:
+                return f"{self.need(name, target, kind)}({src})"
+            return self.convert(target, src, name, depth)
+        schema, nullable = self.split_nullable(schema)
+        if nullable:
+            # Only the fields of the models handle null, with a local.
+            return None
+        kind = self.model_kind(schema)
+        if kind is not None:
+            return f"{self.need(context, schema, kind)}({src})"
+        if schema.get("type") == "array" and isinstance(schema.get("items"), dict):
+            item = f"x{depth}"
+            inner = self.convert(schema["items"], item, context, depth + 1)
+            return None if inner is None else f"[{inner} for {item} in {src}]"
+        if schema.get("type") == "object" and isinstance(schema.get("additionalProperties"), dict):
+            value = f"v{depth}"
+            inner = self.convert(schema["additionalProperties"], value, context, depth + 1)
+            return None if inner is None else f"{{k{depth}: {inner} for k{depth}, {value} in {src}.items()}}"
+        if schema.get("type") == "string" and "enum" in schema:
+            return f"intern({src})"
+        return None
+
+    def py_type(self, schema: typing.Any, context: str) -> str:
+        """
+        Python type of the model of the schema.
+        """
+        schema = self.resolve(schema)
+        if not isinstance(schema, dict):
+            return "typing.Any"
+        if "$ref" in schema:
+            name = ref_name(schema)
+            leaf = self.leaf(name)
+            if leaf is not None:
+                return LEAF_TYPES[leaf]
+            if name in FORMATTED_TYPES:
+                return FORMATTED_TYPES[name]
+            target = self.resolve(self.schemas[name])
+            if self.model_kind(target) in ("object", "union"):
+                return f'"{name}"'
+            return self.py_type(target, name)
+        schema, nullable = self.split_nullable(schema)
+        if nullable:
+            return f"typing.Optional[{self.py_type(schema, context)}]"
+        kind = self.model_kind(schema)
+        if kind in ("object", "union"):
+            return f'"{context}"'
+        json_type = schema.get("type")
+        if json_type == "array":
+            items = schema.get("items")
+            if isinstance(items, list):
+                return f"typing.Tuple[{', '.join(self.py_type(item, context) for item in items)}]"
+            return f"typing.List[{self.py_type(items, context)}]"
+        if json_type == "object":
+            values = schema.get("additionalProperties")
+            if isinstance(values, dict):
+                return f"typing.Dict[str, {self.py_type(values, context)}]"
+            return "dict"
+        if isinstance(json_type, str) and json_type in JSON_TYPES:
+            return JSON_TYPES[json_type]
+        return "typing.Any"
+
+    def field_code(self, model: str, name: str, prop: typing.Any, required: bool) -> typing.Tuple[typing.List[str], str, str]:
+        """
+        Local statements, argument expression and type of a field of an object model.
+        """
+        override = FIELD_CONVERTERS.get((model, name))
+        inner, nullable = self.split_nullable(prop)
+        if override is not None:
+            convert: typing.Optional[str] = f"{override[0]}({SRC})"
+            py_type = override[1]
+        else:
+            context = model + camel(name)
+            convert = self.convert(inner, SRC, context)
+            py_type = self.py_type(inner, context)
+        if nullable or not required:
+            py_type = f"typing.Optional[{py_type}]" if not py_type.startswith("typing.Optional") else py_type
+            if convert is None:
+                return [], f'd.get("{name}")', py_type
+            local = f"v_{name}"
+            return [f'    {local} = d.get("{name}")'], f"None if {local} is None else {convert.replace(SRC, local)}", py_type
+        src = f'd["{name}"]'
+        return [], src if convert is None else convert.replace(SRC, src), py_type
+
+    def object_model(self, name: str, schema: dict) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Dataclass and parse function of an object schema.
+        """
+        required = schema.get("required", [])
+        fields = []
+        locals_ = []
+        args = []
+        for prop_name, prop in schema["properties"].items():
+            statements, arg, py_type = self.field_code(name, prop_name, prop, prop_name in required)
+            locals_ += statements
+            args.append(f"        {identifier(prop_name)}={arg},")
+            description = prop.get("description") if isinstance(prop, dict) else None
+            is_required = prop_name in required and not py_type.startswith("typing.Optional")
+            fields.append((not is_required, identifier(prop_name), py_type, description))
+        cls = ["@dataclasses.dataclass(slots=True)", f"class {name}:"]
+        cls += docstring(schema.get("description") or name, "    ")
+        # Fields with defaults come last, the parsers pass every field by keyword.
+        for optional, field_name, py_type, description in sorted(fields, key=lambda field: field[0]):
+            cls.append(f"    {field_name}: {py_type}{' = None' if optional else ''}")
+            if description:
+                cls.append(f'    """{clean(description)}"""')
+        parse = [f'def parse_{snake(name)}(d: dict) -> "{name}":'] + locals_ + [f"    return {name}("] + args + ["    )"]
+        return cls, parse
+
+    def union_model(self, name: str, schema: dict) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Dataclass and parse function of a union tagged by a string or a single key object.
+        """
+        tags = []
+        branches = []
+        has_strings = False
+        for variant in schema["anyOf"]:
+            if variant.get("type") == "string":
+                has_strings = True
+                tags += variant["enum"]
+                continue
+            (tag, payload), = variant["properties"].items()
+            tags.append(tag)
+            convert = self.convert(payload, "value", name + tag)
+            if convert is not None:
+                branches += [f'    if kind == "{tag}":', f'        return {name}("{tag}", {convert})']
+        cls = ["@dataclasses.dataclass(slots=True)", f"class {name}:"]
+        cls += docstring(schema.get("description") or name, "    ")
+        cls += ["    kind: str", f'    """{", ".join(tags)}."""', "    value: typing.Any", '    """Model of the variant, None for the variants without data."""']
+        parse = [f'def parse_{snake(name)}(d: typing.Any) -> "{name}":']
+        if has_strings:
+            parse += ["    if d.__class__ is str:", f"        return {name}(intern(d), None)"]
+        parse += ["    (kind, value), = d.items()"] + branches + [f"    return {name}(intern(kind), value)"]
+        return cls, parse
+
+    def tuple_model(self, name: str, schema: dict) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Parse function of a fixed size array schema, built as a tuple.
+        """
+        items = []
+        for i, item in enumerate(schema["items"]):
+            convert = self.convert(item, f"d[{i}]", name)
+            items.append(convert or f"d[{i}]")
+        py_type = self.py_type(schema, name)
+        cls = [f"{name} = {py_type}"]
+        cls += docstring(schema.get("description"), "")
+        return cls, [f"def parse_{snake(name)}(d: list) -> {py_type}:", f"    return ({', '.join(items)},)"]
+
+    def method_code(self, method: dict) -> typing.List[str]:
+        """
+        Typed method of the RPCMethods class sending the call and parsing its result.
+        """
+        name = method["name"]
+        result = self.need(camel(name) + "Result", method["result"]["schema"], "object")
+        args = ["self"]
+        required_params = []
+        optional_params = []
+        for param in method["params"]:
+            schema, nullable = self.split_nullable(param["schema"])
+            leaf = self.leaf(ref_name(schema)) if "$ref" in schema else None
+            encoder = PARAM_ENCODERS.get(leaf or (ref_name(schema) if "$ref" in schema else ""))
+            if encoder is not None:
+                py_type, encode = encoder
+            else:
+                py_type, encode = self.json_type(schema), "{}"
+            param_name = identifier(param["name"])
+            if param.get("required") and not nullable:
+                args.append(f"{param_name}: {py_type}")
+                required_params.append((param["name"], encode.format(param_name)))
+            else:
+                args.append(f"{param_name}: typing.Optional[{py_type}] = None")
+                optional_params.append((param["name"], param_name, encode.format(param_name)))
+        result_type = camel(name) + "Result"
+        lines = [f"    def {name}({', '.join(args)}) -> {result_type}:"]
+        summary = method.get("summary", name)
+        lines += docstring(summary[:1].upper() + summary[1:] + ".", "        ")
+        params = ", ".join(f'"{key}": {value}' for key, value in required_params)
+        if optional_params:
+            lines.append(f"        params: dict = {{{params}}}")
+            for key, param_name, value in optional_params:
+                lines += [f"        if {param_name} is not None:", f'            params["{key}"] = {value}']
+            lines.append(f'        return {result}(self.send("{name}", params))')
+        else:
+            lines.append(f'        return {result}(self.send("{name}", {{{params}}}))')
+        return lines
+
+    def json_type(self, schema: typing.Any) -> str:
+        """
+        Python type of the JSON form of a parameter.
+        """
+        schema = self.resolve(schema)
+        if not isinstance(schema, dict):
+            return "typing.Any"
+        if "$ref" in schema:
+            return self.json_type(self.schemas[ref_name(schema)])
+        json_type = schema.get("type")
+        if json_type == "array":
+            return f"typing.List[{self.json_type(schema.get('items'))}]"
+        if json_type == "object" or "anyOf" in schema:
+            return "dict"
+        return JSON_TYPES.get(json_type, "typing.Any") if isinstance(json_type, str) else "typing.Any"
+
+    def generate(self, schema_path: str = SCHEMA_PATH) -> str:
+        """
+        Source of the generated module.
+        """
+        methods = ["class RPCMethods:"]
+        methods += docstring(
+            "Typed methods of every RPC endpoint of the schema, sending their calls through the send function of a client.",
+            "    ",
+        )
+        methods += [
+            '    __slots__ = ("send",)',
+            "",
+            "    def __init__(self, send: typing.Callable[[str, dict], dict]) -> None:",
+            "        self.send = send",
+        ]
+        for method in self.methods:
+            methods += [""] + self.method_code(method)
+
+        classes: typing.List[str] = []
+        parsers: typing.List[str] = []
+        done = set()
+        while self.queue:
+            name = self.queue.pop(0)
+            if name in done:
+                continue
+            done.add(name)
+            schema, kind = self.models[name]
+            if kind == "object":
+                cls, parse = self.object_model(name, schema)
+            elif kind == "union":
+                cls, parse = self.union_model(name, schema)
+            else:
+                cls, parse = self.tuple_model(name, schema)
+            classes += [""] + cls + [""]
+            parsers += [""] + parse + [""]
+        parse_results = [
+            "RESULT_PARSERS: typing.Dict[str, typing.Callable[[dict], typing.Any]] = {",
+            *[f'    "{method["name"]}": parse_{snake(camel(method["name"]) + "Result")},' for method in self.methods],
+            "}",
+            '"""Parsers of the results, by method name."""',
+        ]
+        lines = [HEADER.format(schema=schema_path)] + classes + parsers + [""] + parse_results + ["", ""] + methods
+        source = "\n".join(lines)
+        return re.sub(r"\n{3,}", "\n\n", source).rstrip("\n") + "\n"
+
+def generate(schema_path: str = SCHEMA_PATH) -> str:
+    """
+    Source of the module generated from the OpenRPC schema file.
+
+    The schema file holds a JSON schema of OpenRPC documents, with the
+    document of the node as its example.
+    """
+    with open(schema_path) as f:
+        document = json.load(f)
+    if "methods" not in document:
+        document = document["examples"][0]
+    return Generator(document).generate(schema_path)
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the RPC models, parsers and typed methods from the OpenRPC schema.")
+    parser.add_argument("--schema", default=SCHEMA_PATH)
+    parser.add_argument("-o", "--output", default=OUTPUT_PATH)
+    parser.add_argument("--check", action="store_true", help="exit 1 if the output is not up to date")
+    args = parser.parse_args(argv)
+    source = generate(args.schema)
+    if args.check:
+        with open(args.output) as f:
+            return 0 if f.read() == source else 1
+    with open(args.output, "w") as f:
+        f.write(source)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
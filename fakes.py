@@ -0,0 +1,271 @@
+import json
+import threading
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from casperpy.errors import RPCError
+from casperpy.transport import TransportError
+
+class FakeRPCHandler(BaseHTTPRequestHandler):
+    """
+    Request handler answering JSON RPC requests from the results of the server.
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, Nagle would hold the body for the delayed ACK.
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def answer(self, req: dict) -> dict:
+        self.server.calls.append(req["method"])
+        result = self.server.results[req["method"]]
+        if callable(result):
+            try:
+                result = result(req.get("params", {}))
+            except RPCError as e:
+                return {"jsonrpc": "2.0", "id": req["id"], "error": {"code": e.code, "message": e.message}}
+        return {"jsonrpc": "2.0", "id": req["id"], "result": result}
+
+    def do_POST(self) -> None:
+        self.server.posts += 1
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        status = 200
+        try:
+            if isinstance(body, list):
+                res = [self.answer(req) for req in body]
+            else:
+                res = self.answer(body)
+        except TransportError as e:
+            # Stands in for a failure of the node itself.
+            status, res = e.status, str(e)
+        payload = json.dumps(res).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+class FakeRPCServer(ThreadingHTTPServer):
+    """
+    Local JSON RPC server standing in for a Casper node.
+    """
+    daemon_threads = True
+
+    def __init__(self, results: typing.Dict[str, object]) -> None:
+        super().__init__(("127.0.0.1", 0), FakeRPCHandler)
+        self.results = results
+        self.calls: typing.List[str] = []
+        self.posts = 0
+        self.connections = 0
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> "FakeRPCServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+class FakeSSEHandler(BaseHTTPRequestHandler):
+    """
+    Request handler streaming the events of the server from the start_from query parameter.
+    """
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)
+        start_from = int(self.path.partition("start_from=")[2] or 0)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(b'data:{"ApiVersion":"1.4.6"}\n\n:\n\n')
+        for event_id, data in self.server.events:
+            if event_id < start_from:
+                continue
+            self.wfile.write(f"data:{data}\nid:{event_id}\n\n".encode("utf-8"))
+            if event_id == self.server.drop_at:
+                # Cut the stream once, the client has to resume.
+                self.server.drop_at = None
+                return
+
+class FakeSSEServer(ThreadingHTTPServer):
+    """
+    Local event stream standing in for a Casper node.
+    """
+    daemon_threads = True
+
+    def __init__(self, events: typing.List[typing.Tuple[int, str]], drop_at: typing.Optional[int] = None) -> None:
+        super().__init__(("127.0.0.1", 0), FakeSSEHandler)
+        self.events = events
+        self.drop_at = drop_at
+        self.requests: typing.List[str] = []
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> "FakeSSEServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+STATE_ROOT_HASH_RESULT = {
+    "api_version": "1.4.6",
+    "state_root_hash": "0808080808080808080808080808080808080808080808080808080808080808",
+}
+
+MOCK_ACCOUNT_INFO = {
+    "api_version": "1.4.6",
+    "account": {
+        "account_hash": "account-hash-e94daaff79c2ab8d9c31d9c3058d7d0a0dd31204a5638dc1451fa67b2e3fb88c",
+        "named_keys": [
+            {
+                "key": "hash-8ff4b4bc1c27e8b0e6f3afa06eb7a4ae2e8ae0a4cc3f2a1f1d6ec0c5e0a5d2b1",
+                "name": "erc20_token_contract"
+            }
+        ],
+        "main_purse": "uref-09480c3248ef76b603d386f3f4f8a5f87f597d4eaffd475433f861af187ab5db-007",
+        "associated_keys": [
+            {
+                "account_hash": "account-hash-e94daaff79c2ab8d9c31d9c3058d7d0a0dd31204a5638dc1451fa67b2e3fb88c",
+                "weight": 1
+            }
+        ],
+        "action_thresholds": {
+            "deployment": 1,
+            "key_management": 1
+        }
+    },
+    "merkle_proof": "01000000006ef2e0949ac76e55812421f755abe129b6244fe7168b77f47a72536147614625016ef2e0949ac76e55812421f755abe129b6244fe7168b77f47a72536147614625000000003529cde5c621f857f75f3810611eb4af3f998caaa9d4a3413cf799f99c67db0307010000006ef2e0949ac76e55812421f755abe129b6244fe7168b77f47a7253614761462501010102000000006e06000000000074769d28aac597a36a03a932d4b43e4f10bf0403ee5c41dd035102553f5773631200b9e173e8f05361b681513c14e25e3138639eb03232581db7557c9e8dbbc83ce94500226a9a7fe4f2b7b88d5103a4fc7400f02bf89c860c9ccdd56951a2afe9be0e0267006d820fb5676eb2960e15722f7725f3f8f41030078f8b2e44bf0dc03f71b176d6e800dc5ae9805068c5be6da1a90b2528ee85db0609cc0fb4bd60bbd559f497a98b67f500e1e3e846592f4918234647fca39830b7e1e6ad6f5b7a99b39af823d82ba1873d000003000000010186ff500f287e9b53f823ae1582b1fa429dfede28015125fd233a31ca04d5012002015cc42669a55467a1fdf49750772bfc1aed59b9b085558eb81510e9b015a7c83b0301e3cf4a34b1db6bfa58808b686cb8fe21ebe0c1bcbcee522649d2b135fe510fe3"
+}
+
+MOCK_DEPLOY_INFO = {
+    "api_version": "1.4.6",
+    "deploy": {
+        "approvals": [
+            {
+                "signature": "012dbf03817a51794a8e19e0724884075e6d1fbec326b766ecfa6658b41f81290da85e23b24e88b1c8d9761185c961daee1adab0649912a6477bcd2e69bd91bd08",
+                "signer": "01d9bf2148748a85c89da5aad8ee0b0fc2d105fd39d41a4c796536354f0ae2900c"
+            }
+        ],
+        "hash": "5c9b3b099c1378aa8e4a5f07f59ff1fcdc69a83179427c7e67ae0377d94d93fa",
+        "header": {
+            "account": "01d9bf2148748a85c89da5aad8ee0b0fc2d105fd39d41a4c796536354f0ae2900c",
+            "body_hash": "d53cf72d17278fd47d399013ca389c50d589352f1a12593c0b8e01872a641b50",
+            "chain_name": "casper-example",
+            "dependencies": [
+                "0101010101010101010101010101010101010101010101010101010101010101"
+            ],
+            "gas_price": 1,
+            "timestamp": "2020-11-17T00:39:24.072Z",
+            "ttl": "1h"
+        },
+        "payment": {
+            "StoredContractByName": {
+                "args": [
+                    [
+                        "amount",
+                        {
+                            "bytes": "e8030000",
+                            "cl_type": "I32",
+                            "parsed": 1000
+                        }
+                    ]
+                ],
+                "entry_point": "example-entry-point",
+                "name": "casper-example"
+            }
+        },
+        "session": {
+            "Transfer": {
+                "args": [
+                    [
+                        "amount",
+                        {
+                            "bytes": "e8030000",
+                            "cl_type": "I32",
+                            "parsed": 1000
+                        }
+                    ]
+                ]
+            }
+        }
+    },
+    "execution_results": [
+        {
+            "block_hash": "6b5db3585233ed0076910d3a81fa7d23fc4325f35e06d31f293043aef3f4c98d",
+            "result": {
+                "Success": {
+                    "cost": "123456",
+                    "effect": {
+                        "operations": [
+                            {
+                                "key": "account-hash-2c4a11c062a8a337bfc97e27fd66291caeb2c65865dcb5d3ef3759c4c97efecb",
+                                "kind": "Write"
+                            },
+                            {
+                                "key": "deploy-af684263911154d26fa05be9963171802801a0b6aff8f199b7391eacb8edc9e1",
+                                "kind": "Read"
+                            }
+                        ],
+                        "transforms": [
+                            {
+                                "key": "uref-2c4a11c062a8a337bfc97e27fd66291caeb2c65865dcb5d3ef3759c4c97efecb-007",
+                                "transform": {
+                                    "AddUInt64": 8
+                                }
+                            },
+                            {
+                                "key": "deploy-af684263911154d26fa05be9963171802801a0b6aff8f199b7391eacb8edc9e1",
+                                "transform": "Identity"
+                            }
+                        ]
+                    },
+                    "transfers": [
+                        "transfer-5959595959595959595959595959595959595959595959595959595959595959",
+                        "transfer-8282828282828282828282828282828282828282828282828282828282828282"
+                    ]
+                }
+            }
+        }
+    ]
+}
+
+def mock_block(height: int) -> dict:
+    """
+    Block at the height with height % 3 deploys, after the chain_get_block schema example.
+    """
+    return {
+        "body": {
+            "deploy_hashes": [f"{height:032x}{i:032x}" for i in range(height % 3)],
+            "proposer": "01d9bf2148748a85c89da5aad8ee0b0fc2d105fd39d41a4c796536354f0ae2900c",
+            "transfer_hashes": [],
+        },
+        "hash": f"{height:064x}",
+        "header": {
+            "accumulated_seed": "ac979f51525cfd979b14aa7dc0737c5154eabe0db9280eceaa8dc8d2905b20d5",
+            "body_hash": "8472b18539dc204cf7cb0520bb5c3a91c1551a5c258189a61a15d3a2a35f1763",
+            "era_end": None,
+            "era_id": 1,
+            "height": height,
+            "parent_hash": f"{max(height - 1, 0):064x}",
+            "protocol_version": "1.0.0",
+            "random_bit": True,
+            "state_root_hash": "0808080808080808080808080808080808080808080808080808080808080808",
+            "timestamp": "2020-11-17T00:39:24.072Z",
+        },
+        "proofs": [],
+    }
@@ -1,13 +1,11 @@
-import datetime
-import hashlib 
-from typing import List
 import enum
-from hashlib import blake2b
 
 import casperpy.types.deploy as deploy_types
 import casperpy.types.cl_values as cl_values
 import casperpy.types.cl_types as cl_types
 import casperpy.client as casper_client
+from casperpy.deploy_builder import DeployBuilder
+from casperpy.signing import PrivateKey
 
 
 def show_named_keys(client: casper_client.Client, public_key: str) -> None:
@@ -91,18 +89,7 @@ if __name__ == "__main__":
     }
 
     with open(deploy_args['path_to_operator_secret_key'], 'r') as f:
-        secret_key = f.read()
-    
-    with open(deploy_args['path_to_operator_public_key'], 'r') as f:
-        public_key = f.read()
-
-    params = {
-        'account_public_key': public_key,
-        'chain_name': deploy_args['chain_name'],
-        'timestamp': round(datetime.datetime.now(tz=datetime.timezone.utc).timestamp(), 3),
-        'ttl': 3600_000,
-        'dependencies': [],
-    }
+        signer = PrivateKey.from_pem(f.read())
 
     payment = deploy_types.ModuleBytes(
         args = {
@@ -112,10 +99,10 @@ if __name__ == "__main__":
 
     session = deploy_types.ModuleBytes(
         args = {
-            ERC20_INSTANTIATION_PARAMETERS.TOKEN_DECIMALS: cl_values.CL_U8(deploy_args['token_decimals']),
-            ERC20_INSTANTIATION_PARAMETERS.TOKEN_NAME: cl_values.CL_String(deploy_args['token_name']),
-            ERC20_INSTANTIATION_PARAMETERS.TOKEN_SYMBOL: cl_values.CL_String(deploy_args['token_symbol']),
-            ERC20_INSTANTIATION_PARAMETERS.TOKEN_INITIAL_SUPPLY: cl_values.CL_U256(deploy_args['token_total_supply']),
+            ERC20_INSTANTIATION_PARAMETERS.TOKEN_DECIMALS.value: cl_values.CL_U8(deploy_args['token_decimals']),
+            ERC20_INSTANTIATION_PARAMETERS.TOKEN_NAME.value: cl_values.CL_String(deploy_args['token_name']),
+            ERC20_INSTANTIATION_PARAMETERS.TOKEN_SYMBOL.value: cl_values.CL_String(deploy_args['token_symbol']),
+            ERC20_INSTANTIATION_PARAMETERS.TOKEN_INITIAL_SUPPLY.value: cl_values.CL_U256(deploy_args['token_total_supply']),
         },
         raw_wasm_payload=open(deploy_args['path_to_wasm'], 'rb').read(),
     )
@@ -124,8 +111,7 @@ if __name__ == "__main__":
     res = payment.encode_value()
     print(res)
 
-    # Create body
-    # hash_payload = payment.encode_value() + session.encode_value()
-    # hash = hashlib.blake2b(b'', digest_size=32).hexdigest()
-
-    # Create header
\ No newline at end of file
+    # Create, hash and sign the deploy
+    builder = DeployBuilder(deploy_args['chain_name'], ttl=3600_000)
+    deploy = builder.build(signer, payment, session)
+    print(f"Deploy hash: {deploy.hash.hex()}")
@@ -1,104 +1,1088 @@
-from casperpy.types import InfoGetDeployResponse
+import asyncio
+import json
+import os
+import pickle
+import ssl
+import tempfile
+import threading
+import time
+import typing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from casperpy.async_client import AsyncJRPCClient
+from casperpy.batch import BatchCall, resolve_batch
+from casperpy.bulk import BulkDeployBuilder, DeploySpec
+from casperpy.cache import CachingClient
+from casperpy.client import JRPCClient
+from casperpy.codec import CODECS, get_codec, orjson
+from casperpy.columnar import ColumnarExporter, read_columnar
+from casperpy.generated import RESULT_PARSERS
+from casperpy.instrument import CallbackSink, HistogramSink, Instruments
+from casperpy.crawler import BlockCrawler
+from casperpy.deploy_builder import DeployBuilder, blake2b256
+from casperpy.errors import RPCError
+from casperpy.events import BlockAdded, DeployProcessed, EventStream, EventType
+from casperpy.multi_node import MultiNodeClient
+from casperpy.scheduler import Priority, RetryPolicy, Scheduler, TokenBucket, lane
+from casperpy.signing import PrivateKey
+from casperpy.state import StateReader
+from casperpy.store import SQLiteChainStore
+from casperpy.submit import DeploySubmitter, SubmissionStatus
+from casperpy.tracker import DeployTracker
+from casperpy.transport import AsyncHTTPTransport, TransportError
+from casperpy.types_old import ExecutionResultFailure, ExecutionResultSuccess, InfoGetDeployResponse, LazyList, StateGetAccountInfoResponse
+import casperpy.columnar as columnar
+import casperpy.types.bytesrepr as bytesrepr
+import casperpy.types.cl_types as cl_types
+import casperpy.types.cl_values as cl_values
+import casperpy.types.crypto as crypto_types
+import casperpy.types.deploy as deploy_types
+import casperpy.types.keys as keys
+from fakes import FakeRPCServer, FakeSSEServer, MOCK_ACCOUNT_INFO, MOCK_DEPLOY_INFO, STATE_ROOT_HASH_RESULT, mock_block
 
 def parse_deploy_info() -> InfoGetDeployResponse:
     """
     Parse the deploy info.
     """
     print("[+] Parsing deploy info...")
-    mock_deploy_info = {
-        "api_version": "1.4.6",
-        "deploy": {
-            "approvals": [
-                {
-                    "signature": "012dbf03817a51794a8e19e0724884075e6d1fbec326b766ecfa6658b41f81290da85e23b24e88b1c8d9761185c961daee1adab0649912a6477bcd2e69bd91bd08",
-                    "signer": "01d9bf2148748a85c89da5aad8ee0b0fc2d105fd39d41a4c796536354f0ae2900c"
-                }
-            ],
-            "hash": "5c9b3b099c1378aa8e4a5f07f59ff1fcdc69a83179427c7e67ae0377d94d93fa",
-            "header": {
-                "account": "01d9bf2148748a85c89da5aad8ee0b0fc2d105fd39d41a4c796536354f0ae2900c",
-                "body_hash": "d53cf72d17278fd47d399013ca389c50d589352f1a12593c0b8e01872a641b50",
-                "chain_name": "casper-example",
-                "dependencies": [
-                    "0101010101010101010101010101010101010101010101010101010101010101"
-                ],
-                "gas_price": 1,
-                "timestamp": "2020-11-17T00:39:24.072Z",
-                "ttl": "1h"
-            },
-            "payment": {
-                "StoredContractByName": {
-                    "args": [
-                        [
-                            "amount",
-                            {
-                                "bytes": "e8030000",
-                                "cl_type": "I32",
-                                "parsed": 1000
-                            }
-                        ]
-                    ],
-                    "entry_point": "example-entry-point",
-                    "name": "casper-example"
-                }
-            },
-            "session": {
-                "Transfer": {
-                    "args": [
-                        [
-                            "amount",
-                            {
-                                "bytes": "e8030000",
-                                "cl_type": "I32",
-                                "parsed": 1000
-                            }
-                        ]
-                    ]
-                }
-            }
-        },
-        "execution_results": [
-            {
-                "block_hash": "6b5db3585233ed0076910d3a81fa7d23fc4325f35e06d31f293043aef3f4c98d",
-                "result": {
-                    "Success": {
-                        "cost": "123456",
-                        "effect": {
-                            "operations": [
-                                {
-                                    "key": "account-hash-2c4a11c062a8a337bfc97e27fd66291caeb2c65865dcb5d3ef3759c4c97efecb",
-                                    "kind": "Write"
-                                },
-                                {
-                                    "key": "deploy-af684263911154d26fa05be9963171802801a0b6aff8f199b7391eacb8edc9e1",
-                                    "kind": "Read"
-                                }
-                            ],
-                            "transforms": [
-                                {
-                                    "key": "uref-2c4a11c062a8a337bfc97e27fd66291caeb2c65865dcb5d3ef3759c4c97efecb-007",
-                                    "transform": {
-                                        "AddUInt64": 8
-                                    }
-                                },
-                                {
-                                    "key": "deploy-af684263911154d26fa05be9963171802801a0b6aff8f199b7391eacb8edc9e1",
-                                    "transform": "Identity"
-                                }
-                            ]
-                        },
-                        "transfers": [
-                            "transfer-5959595959595959595959595959595959595959595959595959595959595959",
-                            "transfer-8282828282828282828282828282828282828282828282828282828282828282"
-                        ]
-                    }
-                }
-            }
+    return InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO)
+
+def test_transport_reuses_connections() -> None:
+    """
+    Check that consecutive calls share one keep-alive connection.
+    """
+    print("[+] Reusing pooled connections...")
+    with FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as server:
+        client = JRPCClient("127.0.0.1", server.port)
+        for _ in range(10):
+            res = client.chain_get_state_root_hash()
+        assert str(res.state_root_hash) == STATE_ROOT_HASH_RESULT["state_root_hash"]
+        stats = client.transport.stats()
+        assert server.connections == 1
+        assert stats.requests == 10 and stats.connections_opened == 1
+        assert stats.reuse_ratio == 0.9
+
+def test_async_client_fan_out() -> None:
+    """
+    Check that the async client keeps many requests in flight under its concurrency limit.
+    """
+    print("[+] Fanning out async requests...")
+    async def fan_out(port: int) -> list:
+        async with AsyncJRPCClient("127.0.0.1", port, max_concurrency=8) as client:
+            return await asyncio.gather(*[client.info_get_deploy("00" * 32) for _ in range(100)])
+
+    with FakeRPCServer({"info_get_deploy": MOCK_DEPLOY_INFO}) as server:
+        results = asyncio.run(fan_out(server.port))
+        assert len(results) == 100
+        assert results[0] == InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO)
+        assert server.connections <= 8
+
+def test_async_transport_stale_connections() -> None:
+    """
+    Check that the async transport skips idle connections closed by the node and never sends a request twice.
+    """
+    print("[+] Reusing async connections...")
+    async def exchange() -> None:
+        received = []
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                length = int(head.lower().partition(b"content-length:")[2].split(b"\r\n")[0])
+                received.append(await reader.readexactly(length))
+                if len(received) == 3:
+                    # Drop the request unanswered, it reached the node.
+                    break
+                if len(received) == 4:
+                    writer.write(b"HTTP/1.1 OK\r\nContent-Length: 2\r\n\r\n{}")
+                    break
+                # No reason phrase, and the connection is closed after the answer.
+                writer.write(b"HTTP/1.1 200\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+                if len(received) == 1:
+                    break
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/rpc"
+        transport = AsyncHTTPTransport()
+        try:
+            assert await transport.post(url, b"1") == b"{}"
+            await asyncio.sleep(0.1)
+            assert await transport.post(url, b"2") == b"{}"
+            try:
+                await transport.post(url, b"3")
+                assert False, "An unanswered request must not be sent again"
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+            assert received == [b"1", b"2", b"3"]
+            assert transport.stats().connections_opened == 2
+            try:
+                await transport.post(url, b"4")
+                assert False, "A malformed status line should be rejected"
+            except TransportError:
+                pass
+            try:
+                await transport.post(url.replace("http", "ftp"), b"5")
+                assert False, "Only http and https should be sent"
+            except ValueError:
+                pass
+            # Sent over TLS, which the plain node never answers.
+            secure = AsyncHTTPTransport(connect_timeout=0.5)
+            try:
+                await secure.post(url.replace("http", "https"), b"6")
+                assert False, "An https url should not be sent as plaintext"
+            except (ssl.SSLError, asyncio.TimeoutError, ConnectionError):
+                pass
+            assert received == [b"1", b"2", b"3", b"4"]
+        finally:
+            await transport.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(exchange())
+
+def test_batch_chunks_and_errors() -> None:
+    """
+    Check that batched calls are chunked, matched by id and fail one by one.
+    """
+    print("[+] Sending batched calls...")
+    def get_deploy(params: dict) -> dict:
+        if params["deploy_hash"] == "missing":
+            raise RPCError(-32000, "deploy not known")
+        return MOCK_DEPLOY_INFO
+
+    with FakeRPCServer({"info_get_deploy": get_deploy}) as server:
+        client = JRPCClient("127.0.0.1", server.port)
+        with client.batch(chunk_size=100) as batch:
+            calls = [batch.info_get_deploy(f"{i:064x}") for i in range(249)]
+            missing = batch.info_get_deploy("missing")
+        assert server.posts == 3
+        assert all(str(call.get().deploy.hash) == MOCK_DEPLOY_INFO["deploy"]["hash"] for call in calls)
+        assert isinstance(missing.error, RPCError) and missing.error.code == -32000
+
+    # A reply without result nor error fails its call, the next ones are still resolved.
+    calls = [BatchCall("chain_get_state_root_hash", {}, lambda res: res, id=i) for i in range(3)]
+    resolve_batch(calls, [{"jsonrpc": "2.0", "id": 0}, {"jsonrpc": "2.0", "id": 1, "error": None}, {"jsonrpc": "2.0", "id": 2, "result": 1}])
+    assert [call.error.code for call in calls[:2]] == [-32603, -32603] and calls[2].get() == 1
+
+def test_caching_client_keys_on_state_root() -> None:
+    """
+    Check that state reads are made and cached at the pinned block, and executed deploys for good.
+    """
+    print("[+] Caching state reads...")
+    blocks = iter([mock_block(1), mock_block(1), mock_block(2), mock_block(2)])
+    account_blocks = []
+    def account_info(params: dict) -> dict:
+        account_blocks.append(params["block_identifier"]["Hash"])
+        return MOCK_ACCOUNT_INFO
+    results = {
+        "chain_get_block": lambda params: {"api_version": "1.4.6", "block": next(blocks)},
+        "state_get_account_info": account_info,
+        "info_get_deploy": MOCK_DEPLOY_INFO,
+    }
+    with FakeRPCServer(results) as server:
+        client = CachingClient(JRPCClient("127.0.0.1", server.port), state_root_ttl=0)
+        public_key = MOCK_DEPLOY_INFO["deploy"]["header"]["account"]
+        first = client.state_get_account_info(public_key)
+        assert client.state_get_account_info(public_key) is first
+        client.state_get_account_info(public_key)
+        assert account_blocks == [f"{1:064x}", f"{2:064x}"]
+        assert client.state_root_hash() == mock_block(2)["header"]["state_root_hash"]
+        for _ in range(3):
+            eager = client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+        assert server.calls.count("info_get_deploy") == 1
+        assert (client.stats.hits, client.stats.misses) == (3, 3)
+        # Lazy and eager results are cached apart.
+        lazy = client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"], lazy=True)
+        assert lazy is not eager and isinstance(lazy.execution_results[0].result.effect.transforms, LazyList)
+        assert isinstance(client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"]).execution_results[0].result.effect.transforms, list)
+
+def test_persistent_store_survives_restart() -> None:
+    """
+    Check that executed deploys and blocks are read back from disk by a fresh client.
+    """
+    print("[+] Reading deploys from the persistent store...")
+    deploy_hash = MOCK_DEPLOY_INFO["deploy"]["hash"]
+    results = {"info_get_deploy": MOCK_DEPLOY_INFO, "chain_get_block": {"api_version": "1.4.6", "block": mock_block(7)}}
+    with tempfile.TemporaryDirectory() as tmp, FakeRPCServer(results) as server:
+        path = os.path.join(tmp, "chain.sqlite")
+        first = CachingClient(JRPCClient("127.0.0.1", server.port), store=SQLiteChainStore(path))
+        expected = first.info_get_deploy(deploy_hash)
+        block = first.chain_get_block(7).block
+        assert first.chain_get_block(7).block == block
+        restarted = CachingClient(JRPCClient("127.0.0.1", server.port), store=SQLiteChainStore(path))
+        assert restarted.info_get_deploy(deploy_hash) == expected
+        assert restarted.chain_get_block(block.hash).block == block
+        assert restarted.chain_get_block(7).block == block
+        assert server.calls.count("info_get_deploy") == 1 and server.calls.count("chain_get_block") == 1
+        # Digests are stored under the same key as their hex.
+        store = SQLiteChainStore(path)
+        assert store.get("block", block.hash) == store.get("block", str(block.hash)) is not None
+        assert store.block_hash(7) == str(block.hash) and store.block_hash(8) is None
+
+def test_multi_node_failover() -> None:
+    """
+    Check that reads fail over to a live node and that the dead node is dropped.
+    """
+    print("[+] Failing over between nodes...")
+    with FakeRPCServer({}) as dead:
+        dead_port = dead.port
+    with FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as server:
+        client = MultiNodeClient.from_endpoints([("127.0.0.1", dead_port), ("127.0.0.1", server.port)], failure_threshold=1)
+        for _ in range(5):
+            assert str(client.chain_get_state_root_hash().state_root_hash) == STATE_ROOT_HASH_RESULT["state_root_hash"]
+        assert server.calls.count("chain_get_state_root_hash") == 5
+        dead_health = client.health(client.nodes[0])
+        assert dead_health.errors == 1 and dead_health.down_until > 0
+        assert client.ranked_nodes() == [1, 0]
+
+def test_hedged_reads() -> None:
+    """
+    Check that a read stuck on a slow node is answered by the hedge on the next node.
+    """
+    print("[+] Hedging slow reads...")
+    def slow_root(params: dict) -> dict:
+        time.sleep(1)
+        return STATE_ROOT_HASH_RESULT
+
+    with FakeRPCServer({"chain_get_state_root_hash": slow_root}) as slow, \
+            FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as fast:
+        client = MultiNodeClient.from_endpoints([("127.0.0.1", slow.port), ("127.0.0.1", fast.port)], hedge=True)
+        start = time.monotonic()
+        assert str(client.chain_get_state_root_hash().state_root_hash) == STATE_ROOT_HASH_RESULT["state_root_hash"]
+        assert time.monotonic() - start < 0.5
+        assert (client.hedges_sent, client.hedges_won) == (1, 1)
+        for _ in range(5):
+            client.chain_get_state_root_hash()
+        assert client.hedges_sent == 1
+
+    # A primary failing before the hedge delay is not hedged, the read falls back to the next node.
+    with FakeRPCServer({}) as dead:
+        dead_port = dead.port
+    with FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as server:
+        client = MultiNodeClient.from_endpoints([("127.0.0.1", dead_port), ("127.0.0.1", server.port)], hedge=True, hedge_min_delay=1.0)
+        assert str(client.chain_get_state_root_hash().state_root_hash) == STATE_ROOT_HASH_RESULT["state_root_hash"]
+        assert (client.hedges_sent, server.calls) == (0, ["chain_get_state_root_hash"])
+
+    # The record of a typed call is filled in by the node answering it from a hedge thread.
+    records = []
+    instruments = Instruments([CallbackSink(records.append)])
+    with FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as first, \
+            FakeRPCServer({"chain_get_state_root_hash": STATE_ROOT_HASH_RESULT}) as second:
+        nodes = [JRPCClient("127.0.0.1", server.port, instruments=instruments) for server in (first, second)]
+        with MultiNodeClient(nodes, hedge=True) as client:
+            client.instruments = instruments
+            client.chain_get_state_root_hash()
+            executor = client._executor
+        assert client._executor is None and executor._shutdown
+        assert len(records) == 1 and records[0].network_time > 0 and records[0].parse_time > 0
+
+def test_lazy_deploy_decoding() -> None:
+    """
+    Check that lazy decoding defers nested lists and matches the eager result.
+    """
+    print("[+] Decoding deploy info lazily...")
+    lazy = InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO, lazy=True)
+    effect = lazy.execution_results[0].result.effect
+    assert effect.transforms._items is None
+    assert effect.transforms[1].transform == "Identity"
+    assert effect.transforms._items[0] is None
+    assert lazy == InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO)
+
+def test_bytesrepr_decoding() -> None:
+    """
+    Check the decoding of deploy arguments and nested CL values.
+    """
+    print("[+] Decoding CL values...")
+    deploy_info = parse_deploy_info()
+    assert deploy_info.deploy.session.args[0].value.decode() == cl_values.CL_I32(1000)
+    map_type = cl_types.from_json({"Map": {"key": "String", "value": {"List": "U64"}}})
+    data = bytes.fromhex("01000000" "02000000" "6162" "02000000" "0500000000000000" "0600000000000000")
+    decoded = bytesrepr.from_bytes(map_type, data)
+    assert decoded.value == [(cl_values.CL_String("ab"), cl_values.CL_List([cl_values.CL_U64(5), cl_values.CL_U64(6)]))]
+    value, offset = bytesrepr.decode_cl_value(bytes.fromhex("05000000" "0400e1f505" "08"))
+    assert value == cl_values.CL_U512(100000000) and offset == 10
+    truncated = [
+        ("String", "05000000" "616263", "Truncated String at offset 4: 5 bytes needed, 3 left"),
+        ("Key", "00" + "11" * 20, "Truncated Key at offset 1: 32 bytes needed, 20 left"),
+        ({"List": "U64"}, "02000000" "0500000000000000" "06", "Truncated {'List': 'U64'} at offset 4: 16 bytes needed, 9 left"),
+    ]
+    for cl_type, data, message in truncated:
+        try:
+            bytesrepr.from_bytes(cl_types.from_json(cl_type), bytes.fromhex(data))
+            assert False, f"truncated {cl_type} should not decode"
+        except ValueError as e:
+            assert str(e) == message, str(e)
+
+def test_bytesrepr_encoding() -> None:
+    """
+    Check the encoding of a payment and the round trip of nested CL values.
+    """
+    print("[+] Encoding CL values...")
+    payment = deploy_types.ModuleBytes(args={"amount": cl_values.CL_U512(50000000000)})
+    assert payment.encode_value() == bytes.fromhex("00" "00000000" "01000000" "06000000") + b"amount" + bytes.fromhex("06000000" "0500743ba40b" "08")
+    value = cl_values.CL_List([
+        cl_values.CL_Map([(cl_values.CL_String("alice"), cl_values.CL_U512(10 ** 30))]),
+        cl_values.CL_Map([], cl_types.CL_SimpleType(cl_types.CL_TypeKey.STRING), cl_types.CL_SimpleType(cl_types.CL_TypeKey.U512)),
+    ])
+    assert value.encode_type() == bytes([14, 17, 10, 8])
+    assert bytesrepr.from_bytes(value.cl_type(), value.encode_value()) == value
+
+def test_deploy_hashing_and_signing() -> None:
+    """
+    Check header hashing against the schema example, body hashing and signatures.
+    """
+    print("[+] Building and signing deploys...")
+    header = MOCK_DEPLOY_INFO["deploy"]["header"]
+    example = deploy_types.DeployHeader(
+        account=cl_values.CL_PublicKey(bytes.fromhex(header["account"][2:]), crypto_types.KeyAlgorithm.ED25519),
+        timestamp=1605573564072,
+        ttl=3600000,
+        gas_price=header["gas_price"],
+        body_hash=bytes.fromhex(header["body_hash"]),
+        dependencies=[bytes.fromhex(dependency) for dependency in header["dependencies"]],
+        chain_name=header["chain_name"],
+    )
+    assert blake2b256(example.encode_value()).hex() == MOCK_DEPLOY_INFO["deploy"]["hash"]
+    assert example.to_json()["timestamp"] == header["timestamp"]
+
+    builder = DeployBuilder("casper-test")
+    payment = deploy_types.ModuleBytes(args={"amount": cl_values.CL_U512(50000000000)})
+    with open("erc20.wasm", "rb") as f:
+        wasm = f.read()
+    for algo in crypto_types.KeyAlgorithm:
+        signer = PrivateKey.generate(algo)
+        for supply in (1, 2):
+            session = deploy_types.ModuleBytes(args={"token_total_supply": cl_values.CL_U256(supply)}, raw_wasm_payload=wasm)
+            deploy = builder.build(signer, payment, session)
+            assert deploy.header.body_hash == blake2b256(payment.encode_value() + session.encode_value())
+            assert deploy.hash == blake2b256(deploy.header.encode_value())
+            approval = deploy.approvals[0]
+            assert approval.signature_with_type[0] == algo.value and len(approval.signature) == 64
+    assert len(builder._module_hashers) == 1
+
+def test_bulk_deploy_building() -> None:
+    """
+    Check deploys built across worker processes match the ones built in process, in order.
+    """
+    print("[+] Building deploys in bulk...")
+    with open("erc20.wasm", "rb") as f:
+        wasm = f.read()
+    signer = PrivateKey.generate()
+    specs = [
+        DeploySpec({"token_total_supply": cl_values.CL_U256(i)}, 50000000000, signer, timestamp=1605573564072 + i)
+        for i in range(20)
+    ]
+    with BulkDeployBuilder("casper-test", wasm, max_workers=2, chunksize=4) as bulk:
+        deploys = bulk.build(specs)
+    builder = DeployBuilder("casper-test")
+    payment = deploy_types.ModuleBytes(args={"amount": cl_values.CL_U512(50000000000)})
+    for spec, deploy in zip(specs, deploys):
+        session = deploy_types.ModuleBytes(args=spec.session_args, raw_wasm_payload=wasm)
+        assert deploy.hash == builder.build(signer, payment, session, spec.timestamp).hash
+        assert deploy.session.raw_wasm_payload is wasm
+        assert deploy.approvals[0].signer == signer.public_key.encode_value().hex()
+
+def test_pipelined_submission() -> None:
+    """
+    Check deploys are submitted once each, a lost reply being resolved with info_get_deploy.
+    """
+    print("[+] Submitting deploys...")
+    builder = DeployBuilder("casper-test")
+    signer = PrivateKey.generate()
+    payment = deploy_types.ModuleBytes(args={"amount": cl_values.CL_U512(50000000000)})
+    deploys = [
+        builder.build(signer, payment, deploy_types.ModuleBytes(args={"id": cl_values.CL_U64(i)}, raw_wasm_payload=b"wasm"))
+        for i in range(30)
+    ]
+    lost, rejected = deploys[3].hash.hex(), deploys[4].hash.hex()
+    received: typing.List[str] = []
+    lock = threading.Lock()
+
+    def put_deploy(params: dict) -> dict:
+        deploy_hash = params["deploy"]["hash"]
+        with lock:
+            received.append(deploy_hash)
+        if deploy_hash == rejected:
+            raise RPCError(-32008, "invalid deploy")
+        if deploy_hash == lost:
+            # Accepted, but the reply never reaches the client.
+            raise TransportError(503, "unavailable")
+        return {"api_version": "1.4.6", "deploy_hash": deploy_hash}
+
+    def get_deploy(params: dict) -> dict:
+        if params["deploy_hash"] not in received:
+            raise RPCError(-32000, "deploy not known")
+        return MOCK_DEPLOY_INFO
+
+    with FakeRPCServer({"account_put_deploy": put_deploy, "info_get_deploy": get_deploy}) as server:
+        submitter = DeploySubmitter(JRPCClient("127.0.0.1", server.port), max_in_flight=8, retry_delay=0.01)
+        submissions = submitter.submit(deploys + deploys[:5])
+    assert len(submissions) == 30 and sorted(received) == sorted(d.hash.hex() for d in deploys)
+    assert submitter.status(lost).status == SubmissionStatus.ACCEPTED and submitter.status(lost).attempts == 1
+    assert submitter.status(rejected).status == SubmissionStatus.FAILED
+    assert submitter.stats.accepted == 29 and submitter.stats.failed == 1 and submitter.stats.retries == 1
+    assert submitter.stats.deploys_per_second > 0
+
+    # Never answered: unknown, and sent again once the node is back.
+    unreachable = deploys[5].hash.hex()
+    down = {"put": True}
+    def flaky_put_deploy(params: dict) -> dict:
+        if down["put"]:
+            raise TransportError(503, "unavailable")
+        return put_deploy(params)
+
+    received.clear()
+    with FakeRPCServer({"account_put_deploy": flaky_put_deploy, "info_get_deploy": get_deploy}) as server:
+        submitter = DeploySubmitter(JRPCClient("127.0.0.1", server.port), retry_delay=0.01)
+        [submission] = submitter.submit([deploys[5]])
+        assert submission.status == SubmissionStatus.UNKNOWN and submission.attempts == 3
+        assert submitter.stats.unknown == 1 and submitter.stats.failed == 0
+        down["put"] = False
+        [submission] = submitter.submit([deploys[5]])
+        assert submission.status == SubmissionStatus.ACCEPTED and submission.attempts == 4
+        assert received == [unreachable] and submitter.submit([deploys[5]]) == []
+        assert server.calls.count("info_get_deploy") == 4
+
+def test_deploy_tracker_batches_polling() -> None:
+    """
+    Check pending deploys are polled in batches and dropped once executed.
+    """
+    print("[+] Tracking deploys...")
+    hashes = [f"{i:064x}" for i in range(150)]
+    polls: typing.Dict[str, int] = {}
+    lock = threading.Lock()
+    roots = iter(range(1_000_000))
+
+    def state_root_hash(params: dict) -> dict:
+        return dict(STATE_ROOT_HASH_RESULT, state_root_hash=f"{next(roots):064x}")
+
+    def get_deploy(params: dict) -> dict:
+        deploy_hash = params["deploy_hash"]
+        with lock:
+            polls[deploy_hash] = polls.get(deploy_hash, 0) + 1
+            count = polls[deploy_hash]
+        index = int(deploy_hash, 16)
+        if index % 50 == 49:
+            raise RPCError(-32000, "deploy not known")
+        if count < 1 + index % 3:
+            return dict(MOCK_DEPLOY_INFO, execution_results=[])
+        if index % 2:
+            return MOCK_DEPLOY_INFO
+        failure = {"Failure": dict(MOCK_DEPLOY_INFO["execution_results"][0]["result"]["Success"], error_message="User error: 1")}
+        return dict(MOCK_DEPLOY_INFO, execution_results=[dict(MOCK_DEPLOY_INFO["execution_results"][0], result=failure)])
+
+    with FakeRPCServer({"chain_get_state_root_hash": state_root_hash, "info_get_deploy": get_deploy}) as server:
+        tracker = DeployTracker(JRPCClient("127.0.0.1", server.port), block_time=0.05, min_interval=0.01, timeout=5.0)
+        called: typing.List[ExecutionResultSuccess] = []
+        futures = [tracker.track(h, callback=called.append) for h in hashes]
+        assert tracker.poll() == 49 and server.posts == 2
+        assert tracker.poll() == 49 and tracker.poll() == 49 and tracker.pending() == 3
+        with tracker:
+            time.sleep(0.1)
+        assert tracker.rounds > 3 and tracker.pending() == 3 and tracker.block_time < 0.05
+        # Cancelled futures are dropped, the others still resolved.
+        tracker = DeployTracker(JRPCClient("127.0.0.1", server.port))
+        cancelled, tracked = tracker.track(f"{1002:064x}"), tracker.track(f"{1005:064x}")
+        assert cancelled.cancel()
+        assert tracker.poll() == 1 and tracker.pending() == 0
+        assert isinstance(tracked.result(), ExecutionResultSuccess) and f"{1002:064x}" not in polls
+    for i, future in enumerate(futures):
+        if i % 50 == 49:
+            assert not future.done()
+        else:
+            assert isinstance(future.result(), ExecutionResultSuccess if i % 2 else ExecutionResultFailure)
+    assert all(polls[h] == 1 + int(h, 16) % 3 for h in hashes if int(h, 16) % 50 != 49)
+    assert len(called) == 147
+
+def test_block_crawler() -> None:
+    """
+    Check blocks are crawled in height order with their deploys, resume from the checkpoint and follow the tip.
+    """
+    print("[+] Crawling blocks...")
+    tip = [40]
+
+    def get_block(params: dict) -> dict:
+        height = params["block_identifier"]["Height"]
+        if height > tip[0]:
+            raise RPCError(-32001, "block not known")
+        return {"api_version": "1.4.6", "block": mock_block(height)}
+
+    def get_deploy(params: dict) -> dict:
+        return dict(MOCK_DEPLOY_INFO, deploy=dict(MOCK_DEPLOY_INFO["deploy"], hash=params["deploy_hash"]))
+
+    with FakeRPCServer({"chain_get_block": get_block, "info_get_deploy": get_deploy}) as server:
+        crawler = BlockCrawler(JRPCClient("127.0.0.1", server.port), window=8, poll_interval=0.01)
+        heights = []
+        for crawled in crawler.crawl(0, 30):
+            heights.append(crawled.height)
+            assert [d.deploy.hash for d in crawled.deploys] == crawled.block.body.deploy_hashes
+            if crawled.height == 11:
+                break
+        assert crawler.checkpoint == 12
+        heights += [crawled.height for crawled in crawler.crawl(end=30)]
+        assert heights == list(range(30)) and crawler.checkpoint == 30
+
+        followed = []
+        for crawled in crawler.crawl():
+            followed.append(crawled.height)
+            if crawled.height == tip[0]:
+                tip[0] += 5
+            if crawled.height == 50:
+                break
+        assert followed == list(range(30, 51))
+        try:
+            list(crawler.crawl(60, 70))
+            assert False, "missing blocks should fail a bounded crawl"
+        except LookupError:
+            pass
+
+def test_event_stream() -> None:
+    """
+    Check the event stream is filtered before decoding and resumes after a disconnect.
+    """
+    print("[+] Consuming the event stream...")
+    execution_result = MOCK_DEPLOY_INFO["execution_results"][0]
+    processed = {
+        "deploy_hash": MOCK_DEPLOY_INFO["deploy"]["hash"],
+        "account": MOCK_DEPLOY_INFO["deploy"]["header"]["account"],
+        "timestamp": MOCK_DEPLOY_INFO["deploy"]["header"]["timestamp"],
+        "ttl": MOCK_DEPLOY_INFO["deploy"]["header"]["ttl"],
+        "dependencies": [],
+        "block_hash": execution_result["block_hash"],
+        "execution_result": execution_result["result"],
+    }
+    events = []
+    for height in range(5):
+        events.append(json.dumps({"BlockAdded": {"block_hash": f"{height:064x}", "block": mock_block(height)}}))
+        events.append(json.dumps({"DeployProcessed": processed}))
+        # Never decoded when filtered out.
+        events.append('{"FinalitySignature": not json}')
+    with FakeSSEServer(list(enumerate(events, 1)), drop_at=5) as server:
+        stream = EventStream("127.0.0.1", server.port, event_types={EventType.BLOCK_ADDED, EventType.DEPLOY_PROCESSED}, reconnect_delay=0.01)
+        received = []
+        for event in stream:
+            received.append(event)
+            if len(received) == 10:
+                stream.close()
+    assert [event.id for event in received] == [1, 2, 4, 5, 7, 8, 10, 11, 13, 14]
+    assert [event.data.block.header.height for event in received if isinstance(event.data, BlockAdded)] == list(range(5))
+    assert all(str(event.data.execution_result.block_hash) == execution_result["block_hash"] for event in received if isinstance(event.data, DeployProcessed))
+    assert server.requests == ["/events/main", "/events/main?start_from=6"]
+
+    # Events laid out with whitespace are decoded to find their type.
+    spaced = [
+        (1, '{ "BlockAdded" : ' + json.dumps({"block_hash": f"{0:064x}", "block": mock_block(0)}) + " }"),
+        (2, '{\t"DeployProcessed": ' + json.dumps(processed) + "}"),
+        (3, '"Shutdown"'),
+    ]
+    for event_types, expected in ((None, ["ApiVersion", "BlockAdded", "DeployProcessed", "Shutdown"]), ({EventType.DEPLOY_PROCESSED}, ["DeployProcessed"])):
+        with FakeSSEServer(spaced) as server:
+            stream = EventStream("127.0.0.1", server.port, event_types=event_types, reconnect_delay=0.01)
+            received = []
+            for event in stream:
+                received.append(event)
+                if len(received) == len(expected):
+                    stream.close()
+        assert [event.type for event in received] == expected
+        assert isinstance(received[-1 if event_types else 2].data, DeployProcessed)
+
+    # A node dropping the stream after its handshake counts as a failure.
+    with FakeSSEServer([]) as server:
+        stream = EventStream("127.0.0.1", server.port, reconnect_delay=0.01, max_reconnects=2)
+        received = []
+        try:
+            for event in stream:
+                received.append(event.type)
+            assert False, "a stream without events should give up"
+        except ConnectionError:
+            pass
+    assert received == ["ApiVersion"] * 3 and len(server.requests) == 3
+
+def test_compact_response_models() -> None:
+    """
+    Check the response models are slotted and hold hashes as bytes printing as their hex.
+    """
+    print("[+] Checking compact response models...")
+    res = InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO)
+    effect = res.execution_results[0].result.effect
+    for obj in (res, res.deploy, res.deploy.header, res.deploy.session, effect, effect.operations[0], effect.transforms[0]):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+    deploy_hash = MOCK_DEPLOY_INFO["deploy"]["hash"]
+    assert isinstance(res.deploy.hash, bytes) and len(res.deploy.hash) == 32
+    assert res.deploy.hash == bytes.fromhex(deploy_hash) == crypto_types.Digest.from_hex(deploy_hash)
+    assert str(res.deploy.hash) == deploy_hash and res.deploy.hash != deploy_hash
+    # Hashes are interchangeable with the plain bytes of DeployBuilder.
+    assert {bytes.fromhex(deploy_hash): 1}[res.deploy.hash] == 1 and {res.deploy.hash: 1}[bytes.fromhex(deploy_hash)] == 1
+    again = InfoGetDeployResponse.from_json(json.loads(json.dumps(MOCK_DEPLOY_INFO)))
+    assert again.execution_results[0].result.effect.operations[0].kind is effect.operations[0].kind
+
+def test_interned_keys() -> None:
+    """
+    Check keys parsed from responses are shared, hashable and parse every key format.
+    """
+    print("[+] Interning keys...")
+    first = InfoGetDeployResponse.from_json(json.loads(json.dumps(MOCK_DEPLOY_INFO)))
+    second = InfoGetDeployResponse.from_json(json.loads(json.dumps(MOCK_DEPLOY_INFO)))
+    key = first.execution_results[0].result.effect.operations[0].key
+    assert isinstance(key, keys.AccountHash) and key is second.execution_results[0].result.effect.operations[0].key
+    assert key != str(key) and keys.from_string(str(key)) is key and pickle.loads(pickle.dumps(key)) is key
+    assert {key: 1}[keys.AccountHash(key.value)] == 1 and key != keys.Hash(key.value)
+    try:
+        key.value = b""
+        assert False, "keys should be immutable"
+    except AttributeError:
+        pass
+    uref = "uref-09480c3248ef76b603d386f3f4f8a5f87f597d4eaffd475433f861af187ab5db-007"
+    parsed = keys.from_string(uref)
+    assert parsed is keys.URef(bytes.fromhex(uref[5:69]), keys.CL_UrefAccessRights.READ_ADD_WRITE) and str(parsed) == uref
+    assert cl_values.CL_Key.from_string(uref).encode_value()[-1] == 7
+    assert cl_values.CL_Uref.from_string(uref) == cl_values.CL_Uref(parsed.value, parsed.access_rights)
+    assert str(keys.from_string("era-42")) == "era-42"
+    account = StateGetAccountInfoResponse.from_json(MOCK_ACCOUNT_INFO).account
+    assert account.main_purse is parsed and account.associated_keys[0].account_hash is account.account_hash
+
+def mock_cost(i: int) -> int:
+    return 1000 + i if i % 6 else 2 ** 64 * (i + 1) + 2 ** 64 - 1
+
+def mock_columnar_responses(count: int) -> typing.List[InfoGetDeployResponse]:
+    """
+    Deploys spread over four blocks, with costs from mock_cost and up to four transforms each.
+    """
+    effect = MOCK_DEPLOY_INFO["execution_results"][0]["result"]["Success"]["effect"]
+    responses = []
+    for i in range(count):
+        raw = json.loads(json.dumps(MOCK_DEPLOY_INFO))
+        raw["deploy"]["hash"] = f"{i:064x}"
+        result = raw["execution_results"][0]
+        result["block_hash"] = f"{i % 4:064x}"
+        result["result"]["Success"]["cost"] = str(mock_cost(i))
+        result["result"]["Success"]["effect"]["transforms"] = [
+            dict(effect["transforms"][j % 2], key=f"hash-{(i + j) % 7:064x}") for j in range(i % 5)
+        ]
+        responses.append(InfoGetDeployResponse.from_json(raw))
+    return responses
+
+def test_columnar_export() -> None:
+    """
+    Check deploy effects are flattened into dictionary encoded columns, written in batches and read back.
+    """
+    print("[+] Exporting effects to columns...")
+    responses = mock_columnar_responses(25)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "effects.col")
+        with ColumnarExporter(path, batch_rows=10) as exporter:
+            for height, res in enumerate(responses):
+                exporter.append(res, block_height=height)
+            exporter.append(InfoGetDeployResponse.from_json(dict(MOCK_DEPLOY_INFO, execution_results=[])))
+        data = read_columnar(path)
+    assert data.rows("deploys") == 25 and data.rows("operations") == 50 and data.rows("transfers") == 50
+    assert bytes(data.tables["deploys"]["deploy_hash"]) == b"".join(res.deploy.hash for res in responses)
+    assert list(data.tables["deploys"]["block_height"]) == list(range(25))
+    expected: typing.Dict[str, int] = {}
+    for res in responses:
+        for transform in res.execution_results[0].result.effect.transforms:
+            expected[transform.key] = expected.get(transform.key, 0) + 1
+    assert data.count_by("transforms", "key") == expected
+    assert data.count_by("transforms", "kind") == {"AddUInt64": 30, "Identity": 20}
+    assert data.integers("deploys", "cost") == [mock_cost(i) for i in range(25)]
+    assert data.sum_by("deploys", "cost", "block_hash") == {
+        crypto_types.Digest.from_hex(f"{block:064x}"): sum(mock_cost(i) for i in range(25) if i % 4 == block) for block in range(4)
+    }
+    assert data.decode("operations", "key")[:2] == [op.key for op in responses[0].execution_results[0].result.effect.operations]
+
+def test_columnar_numpy_aggregations() -> None:
+    """
+    Check the NumPy aggregations match the pure Python ones.
+    """
+    if numpy is None:
+        print("[-] NumPy is not installed, skipping the NumPy aggregations")
+        return
+    print("[+] Aggregating columns with NumPy...")
+    exporter = ColumnarExporter()
+    for height, res in enumerate(mock_columnar_responses(40)):
+        exporter.append(res, block_height=height)
+    data = exporter.data
+    vectorized = (data.count_by("transforms", "key"), data.sum_by("deploys", "cost", "block_hash"), data.sum_by("deploys", "block_height", "block_hash"))
+    columnar.numpy = None
+    try:
+        expected = (data.count_by("transforms", "key"), data.sum_by("deploys", "cost", "block_hash"), data.sum_by("deploys", "block_height", "block_hash"))
+    finally:
+        columnar.numpy = numpy
+    assert vectorized == expected
+    assert all(type(total) is int for total in vectorized[1].values())
+    arrays = data.to_numpy("deploys")
+    assert arrays["deploy_hash"][3] == bytes.fromhex(f"{3:064x}") and arrays["cost_high"][6] == 7
+
+def test_benchmark_baseline() -> None:
+    """
+    Check benchmark results are saved as a baseline and regressions against it are reported.
+    """
+    print("[+] Comparing benchmarks with a baseline...")
+    import benchmarks
+    args = ["-k", "CL_U512", "--repeat", "1", "--min-time", "0.01"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "baseline.json")
+        assert benchmarks.main(args + ["--save", path]) == 0
+        with open(path) as f:
+            baseline = json.load(f)
+        result = baseline["results"]["CL_U512.encode_value"]
+        assert result["ops_per_second"] > 0 and result["peak_alloc_bytes"] > 0
+        result["ops_per_second"] *= 100
+        with open(path, "w") as f:
+            json.dump(baseline, f)
+        assert benchmarks.main(args + ["--compare", path]) == 1
+
+def test_generated_rpc_methods() -> None:
+    """
+    Check the generated module is up to date and its methods send typed params and parse typed models.
+    """
+    print("[+] Calling generated RPC methods...")
+    import codegen
+    assert codegen.main(["--check"]) == 0
+    assert len(RESULT_PARSERS) == 15
+    sent = []
+    def balance(params: dict) -> dict:
+        sent.append(params)
+        return {"api_version": "1.4.6", "balance_value": str(10 ** 30), "merkle_proof": "00"}
+    def query(params: dict) -> dict:
+        sent.append(params)
+        return {"api_version": "1.4.6", "merkle_proof": "00", "stored_value": {"Account": MOCK_ACCOUNT_INFO["account"]}}
+    results = {"info_get_deploy": MOCK_DEPLOY_INFO, "state_get_balance": balance, "query_global_state": query}
+    with FakeRPCServer(results) as server:
+        client = JRPCClient("127.0.0.1", server.port)
+        state_root = crypto_types.Digest.from_hex(STATE_ROOT_HASH_RESULT["state_root_hash"])
+        purse = MOCK_ACCOUNT_INFO["account"]["main_purse"]
+        assert client.rpc.state_get_balance(state_root, purse).balance_value == 10 ** 30
+        res = client.rpc.query_global_state({"StateRootHash": str(state_root)}, purse)
+        assert sent == [
+            {"state_root_hash": str(state_root), "purse_uref": purse},
+            {"state_identifier": {"StateRootHash": str(state_root)}, "key": purse},
         ]
+        assert res.stored_value.kind == "Account" and res.block_header is None
+        account = res.stored_value.value
+        assert str(account.main_purse) == purse and isinstance(account.main_purse, keys.URef)
+        assert account.named_keys[0].key is keys.from_string(MOCK_ACCOUNT_INFO["account"]["named_keys"][0]["key"])
+        info = client.rpc.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+    expected = InfoGetDeployResponse.from_json(MOCK_DEPLOY_INFO)
+    assert info.deploy.hash == expected.deploy.hash and info.deploy.header.dependencies == expected.deploy.header.dependencies
+    assert info.deploy.payment.kind == "StoredContractByName" and info.deploy.payment.value.args[0][1].parsed == 1000
+    result = info.execution_results[0].result
+    assert result.kind == "Success" and result.value.cost == 123456
+    effect = expected.execution_results[0].result.effect
+    assert [op.key for op in result.value.effect.operations] == [op.key for op in effect.operations]
+    transforms = result.value.effect.transforms
+    assert (transforms[0].transform.kind, transforms[0].transform.value) == ("AddUInt64", 8)
+    assert (transforms[1].transform.kind, transforms[1].transform.value) == ("Identity", None)
+    assert result.value.transfers == expected.execution_results[0].result.transfers
+
+def test_json_codecs() -> None:
+    """
+    Check the codecs decode raw bodies alike and the client works with each of them.
+    """
+    print("[+] Encoding and decoding with the JSON codecs...")
+    assert get_codec().name == ("orjson" if orjson is not None else "json")
+    body = json.dumps(MOCK_DEPLOY_INFO).encode("utf-8")
+    for name in CODECS:
+        if name == "orjson" and orjson is None:
+            continue
+        codec = get_codec(name)
+        assert codec.loads(body) == codec.loads(memoryview(body)) == codec.loads(body.decode("utf-8")) == MOCK_DEPLOY_INFO
+        # Numbers beyond 64 bits are still encoded.
+        assert json.loads(codec.dumps({"amount": 10 ** 30})) == {"amount": 10 ** 30}
+        def failing(params: dict) -> dict:
+            raise RPCError(-32001, "No such deploy")
+        results = {"info_get_deploy": MOCK_DEPLOY_INFO, "chain_get_state_root_hash": failing}
+        with FakeRPCServer(results) as server:
+            client = JRPCClient("127.0.0.1", server.port, codec=codec)
+            res = client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+            assert str(res.deploy.hash) == MOCK_DEPLOY_INFO["deploy"]["hash"]
+            try:
+                client.chain_get_state_root_hash()
+                assert False, "error reply not raised"
+            except RPCError as e:
+                assert (e.code, e.message) == (-32001, "No such deploy")
+            with client.batch() as batch:
+                calls = [batch.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"]) for _ in range(3)]
+            assert all(call.get().deploy.hash == res.deploy.hash for call in calls)
+    try:
+        get_codec("yaml")
+        assert False, "unknown codecs should be rejected"
+    except ValueError:
+        pass
+
+def test_instrumentation() -> None:
+    """
+    Check the calls are recorded once each, with their sizes, times and errors.
+    """
+    print("[+] Recording the calls of an instrumented client...")
+    def failing(params: dict) -> dict:
+        raise RPCError(-32001, "No such deploy")
+    results = {"info_get_deploy": MOCK_DEPLOY_INFO, "chain_get_state_root_hash": failing}
+    sink = HistogramSink()
+    records = []
+    with FakeRPCServer(results) as server:
+        client = JRPCClient("127.0.0.1", server.port, instruments=Instruments([sink, CallbackSink(records.append)]))
+        for _ in range(3):
+            client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+        assert len(records) == 3
+        record = records[0]
+        assert record.method == "info_get_deploy" and record.error is None
+        assert record.request_bytes > 0 and record.response_bytes > len(MOCK_DEPLOY_INFO["deploy"]["hash"])
+        assert record.network_time > 0 and record.decode_time > 0 and record.parse_time > 0
+        # Raw sends are recorded too, without parse time.
+        client.send("info_get_deploy", {"deploy_hash": MOCK_DEPLOY_INFO["deploy"]["hash"]})
+        assert len(records) == 4 and records[-1].parse_time == 0
+        try:
+            client.chain_get_state_root_hash()
+            assert False, "error reply not raised"
+        except RPCError:
+            pass
+        assert records[-1].method == "chain_get_state_root_hash" and records[-1].error == "RPCError"
+        with client.batch() as batch:
+            for _ in range(3):
+                batch.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+        assert len(records) == 6 and records[-1].method == "batch"
+
+        async def fetch() -> None:
+            async_client = AsyncJRPCClient("127.0.0.1", server.port, instruments=Instruments([CallbackSink(records.append)]))
+            try:
+                await asyncio.gather(*(async_client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"]) for _ in range(4)))
+            finally:
+                await async_client.close()
+        asyncio.run(fetch())
+        assert len(records) == 10 and all(r.parse_time > 0 and r.response_bytes > 0 for r in records[-4:])
+
+        plain = JRPCClient("127.0.0.1", server.port)
+        plain.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+        assert len(records) == 10
+    stats = sink.methods["info_get_deploy"]
+    assert stats.calls == 4 and not stats.errors
+    assert sink.methods["chain_get_state_root_hash"].errors == {"RPCError": 1}
+    assert 0 < sink.quantile("info_get_deploy", "network_time", 0.5) <= sink.quantile("info_get_deploy", "network_time", 0.99)
+    text = sink.to_prometheus()
+    assert 'casperpy_rpc_calls_total{method="info_get_deploy"} 4' in text
+    assert 'casperpy_rpc_errors_total{method="chain_get_state_root_hash",error="RPCError"} 1' in text
+    assert 'casperpy_rpc_network_seconds_bucket{method="info_get_deploy",le="+Inf"} 4' in text
+    assert 'casperpy_rpc_response_bytes_bucket{method="batch",le="67108864"} 1' in text
+
+def test_scheduler() -> None:
+    """
+    Check the rate limit per node, the priority lanes and the retries of throttled requests.
+    """
+    print("[+] Scheduling requests with rate limits, lanes and retries...")
+    bucket = TokenBucket(rate=50, burst=2)
+    assert bucket.acquire() < 0.005 and bucket.acquire() < 0.005
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.015
+
+    # Waiting bulk requests are overtaken by a high priority one.
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire()
+    order = []
+    def take(priority: Priority, name: str) -> None:
+        bucket.acquire(priority)
+        order.append(name)
+    threads = [threading.Thread(target=take, args=(Priority.BULK, f"bulk-{i}")) for i in range(3)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.002)
+    threads.append(threading.Thread(target=take, args=(Priority.HIGH, "deploy")))
+    threads[-1].start()
+    for thread in threads:
+        thread.join()
+    assert order == ["deploy", "bulk-0", "bulk-1", "bulk-2"], order
+
+    scheduler = Scheduler(rate=1000, burst=10, retry=RetryPolicy(base_delay=0.001))
+    assert scheduler.priority_of("account_put_deploy") == Priority.HIGH
+    assert scheduler.priority_of("info_get_deploy", "account_put_deploy") == Priority.HIGH
+    assert scheduler.priority_of("info_get_deploy") == Priority.NORMAL
+    with lane(Priority.BULK):
+        assert scheduler.priority_of("info_get_deploy") == Priority.BULK
+    assert scheduler.bucket("http://a/rpc") is scheduler.bucket("http://a/rpc") is not scheduler.bucket("http://b/rpc")
+
+    failures = {"left": 2}
+    def flaky(params: dict) -> dict:
+        if failures["left"]:
+            failures["left"] -= 1
+            raise TransportError(429, "Too Many Requests")
+        return STATE_ROOT_HASH_RESULT
+    def broken(params: dict) -> dict:
+        raise TransportError(500, "Internal Server Error")
+    results = {"chain_get_state_root_hash": flaky, "info_get_deploy": broken}
+    with FakeRPCServer(results) as server:
+        client = JRPCClient("127.0.0.1", server.port, scheduler=scheduler)
+        assert str(client.chain_get_state_root_hash().state_root_hash) == STATE_ROOT_HASH_RESULT["state_root_hash"]
+        assert server.calls.count("chain_get_state_root_hash") == 3
+        assert (scheduler.stats.requests, scheduler.stats.retries, scheduler.stats.throttled) == (3, 2, 2)
+        # A server error is not retried, nor is an exhausted retry budget.
+        try:
+            client.info_get_deploy(MOCK_DEPLOY_INFO["deploy"]["hash"])
+            assert False, "server error not raised"
+        except TransportError as e:
+            assert e.status == 500
+        assert server.calls.count("info_get_deploy") == 1
+        failures["left"] = 10
+        try:
+            client.chain_get_state_root_hash()
+            assert False, "throttling not raised after the last attempt"
+        except TransportError as e:
+            assert e.status == 429
+        assert server.calls.count("chain_get_state_root_hash") == 3 + scheduler.retry.max_attempts
+
+    # Deploys are only retried when they can't have reached the node.
+    statuses = [429, 503]
+    def put_deploy(params: dict) -> dict:
+        if statuses:
+            status = statuses.pop(0)
+            raise TransportError(status, "Unavailable")
+        return {"api_version": "1.4.5", "deploy_hash": MOCK_DEPLOY_INFO["deploy"]["hash"]}
+    with FakeRPCServer({"account_put_deploy": put_deploy}) as server:
+        client = JRPCClient("127.0.0.1", server.port, scheduler=Scheduler(rate=1000, burst=10, retry=RetryPolicy(base_delay=0.001)))
+        try:
+            client.send("account_put_deploy", {"deploy": {}})
+            assert False, "a deploy failing after reaching the node should not be resubmitted"
+        except TransportError as e:
+            assert e.status == 503
+        assert server.calls == ["account_put_deploy", "account_put_deploy"]
+    with FakeRPCServer({}) as dead:
+        dead_port = dead.port
+    scheduler = Scheduler(rate=1000, burst=10, retry=RetryPolicy(max_attempts=3, base_delay=0.001))
+    client = JRPCClient("127.0.0.1", dead_port, scheduler=scheduler)
+    try:
+        client.send("account_put_deploy", {"deploy": {}})
+        assert False, "connection refused not raised"
+    except IOError:
+        pass
+    assert scheduler.stats.requests == 3
+
+def test_global_state_paths() -> None:
+    """
+    Check the typed global state queries and the bulk path reads at one state root hash.
+    """
+    print("[+] Reading global state paths at a pinned state root hash...")
+    contract, other = f"hash-{'c' * 64}", f"hash-{'d' * 64}"
+    balances, supply, flag = f"uref-{'b' * 64}-007", f"uref-{'5' * 64}-007", f"uref-{'f' * 64}-007"
+    def contract_value(named_keys: typing.Dict[str, str]) -> dict:
+        return {"Contract": {
+            "contract_package_hash": f"contract-package-wasm{'a' * 64}",
+            "contract_wasm_hash": f"contract-wasm-{'a' * 64}",
+            "entry_points": [],
+            "named_keys": [{"name": name, "key": key} for name, key in named_keys.items()],
+            "protocol_version": "1.4.5",
+        }}
+    def u256(value: int) -> dict:
+        return {"CLValue": {"bytes": "", "cl_type": "U256", "parsed": str(value)}}
+    state = {
+        contract: contract_value({"balances": balances, "total_supply": supply, "other": other}),
+        other: contract_value({"flag": flag}),
+        supply: u256(10 ** 6),
+        flag: {"CLValue": {"bytes": "01", "cl_type": "Bool", "parsed": True}},
     }
-    return InfoGetDeployResponse.from_dict(mock_deploy_info)
+    accounts = [f"{i:064x}" for i in range(50)]
+    broken = f"hash-{'b' * 64}"
+    state_root_hash = STATE_ROOT_HASH_RESULT["state_root_hash"]
+    def query_global_state(params: dict) -> dict:
+        assert params["state_identifier"] == {"StateRootHash": state_root_hash}
+        if params["key"] == broken:
+            raise RPCError(-32603, "internal error")
+        if params["key"] not in state:
+            raise RPCError(-32003, "ValueNotFound")
+        return {"api_version": "1.4.5", "merkle_proof": "", "stored_value": state[params["key"]]}
+    def state_get_item(params: dict) -> dict:
+        assert params == {"state_root_hash": state_root_hash, "key": contract, "path": ["total_supply"]}
+        return {"api_version": "1.4.5", "merkle_proof": "", "stored_value": state[supply]}
+    def state_get_dictionary_item(params: dict) -> dict:
+        item = params["dictionary_identifier"]["URef"]
+        assert params["state_root_hash"] == state_root_hash
+        if item["seed_uref"] != balances or item["dictionary_item_key"] not in accounts:
+            raise RPCError(-32003, "ValueNotFound")
+        index = accounts.index(item["dictionary_item_key"])
+        return {"api_version": "1.4.5", "dictionary_key": f"dictionary-{index:064x}", "merkle_proof": "", "stored_value": u256(index)}
+    results = {
+        "chain_get_state_root_hash": STATE_ROOT_HASH_RESULT,
+        "query_global_state": query_global_state,
+        "state_get_item": state_get_item,
+        "state_get_dictionary_item": state_get_dictionary_item,
+    }
+    with FakeRPCServer(results) as server:
+        client = JRPCClient("127.0.0.1", server.port)
+        res = client.query_global_state(contract, state_root_hash=state_root_hash)
+        assert res.stored_value.kind == "Contract"
+        assert [str(named.key) for named in res.stored_value.value.named_keys] == [balances, supply, other]
+        res = client.state_get_item(state_root_hash, contract, ["total_supply"])
+        assert (res.stored_value.kind, res.stored_value.value.parsed) == ("CLValue", "1000000")
+        try:
+            client.query_global_state(contract)
+            assert False, "a query without state identifier should be rejected"
+        except ValueError:
+            pass
+
+        server.calls.clear()
+        reader = StateReader(client, max_workers=4)
+        paths = [f"{contract}/balances/{account}" for account in accounts] + [
+            f"{contract}/total_supply",
+            (contract, "other", "flag"),
+            f"{contract}/balances/{'e' * 64}",
+            f"{contract}/missing/name",
+            f"{supply}/not_a_dictionary/name",
+        ]
+        values = reader.read_many(paths)
+        assert [values[f"{contract}/balances/{account}"].value.parsed for account in accounts] == [str(i) for i in range(50)]
+        assert values[f"{contract}/total_supply"].value.parsed == "1000000"
+        assert values[(contract, "other", "flag")].value.parsed is True
+        assert values[f"{contract}/balances/{'e' * 64}"] is None and values[f"{contract}/missing/name"] is None
+        assert values[f"{supply}/not_a_dictionary/name"] is None
+        # The root is pinned once and each shared prefix is fetched once.
+        assert server.calls.count("chain_get_state_root_hash") == 1
+        assert server.calls.count("query_global_state") == 4
+        assert server.calls.count("state_get_dictionary_item") == 52
+        calls = len(server.calls)
+        assert reader.read(f"{contract}/balances/{accounts[7]}").value.parsed == "7"
+        assert len(server.calls) == calls
+        try:
+            reader.read_many([f"{broken}/balances", f"{contract}/total_supply"])
+            assert False, "a failed read should not be taken for a missing value"
+        except RPCError as e:
+            assert e.code == -32603
 
 if __name__ == "__main__":
+    test_transport_reuses_connections()
+    test_async_client_fan_out()
+    test_async_transport_stale_connections()
+    test_batch_chunks_and_errors()
+    test_caching_client_keys_on_state_root()
+    test_persistent_store_survives_restart()
+    test_multi_node_failover()
+    test_hedged_reads()
+    test_lazy_deploy_decoding()
+    test_bytesrepr_decoding()
+    test_bytesrepr_encoding()
+    test_deploy_hashing_and_signing()
+    test_bulk_deploy_building()
+    test_pipelined_submission()
+    test_deploy_tracker_batches_polling()
+    test_block_crawler()
+    test_event_stream()
+    test_compact_response_models()
+    test_interned_keys()
+    test_columnar_export()
+    test_columnar_numpy_aggregations()
+    test_benchmark_baseline()
+    test_generated_rpc_methods()
+    test_json_codecs()
+    test_instrumentation()
+    test_scheduler()
+    test_global_state_paths()
     deploy_info = parse_deploy_info()
     print(deploy_info)
     print("Tests passed successfully.")